@@ -0,0 +1,67 @@
+# Compares arithmetic on number literals scanned as floats (the fast path in
+# Interpreter.visit_binary_expr) with the same program using string literals,
+# which is what the scanner produced before and still goes through float().
+#
+# run from the pylox directory: python -m benchmarks.bench_arithmetic
+from benchmarks.common import best_of, parse
+from src.errors import ErrorReporter
+from src.expr import Literal
+from src.interpreter import Interpreter
+
+STATEMENTS = 2_000
+REPEAT = 5
+
+SOURCE = "var a = 1.5; var b = 2;\n" + (
+    "a = (a * 3 - b / 4 + 2) / (b + 1) - (a - b) * 0.5;\n" * STATEMENTS
+)
+
+
+class _StringifyLiterals:
+    def visit_expression_stmt(self, stmt):
+        stmt.expression.accept(self)
+
+    def visit_var_stmt(self, stmt):
+        stmt.initializer.accept(self)
+
+    def visit_assign_expr(self, expr):
+        expr.value.accept(self)
+
+    def visit_binary_expr(self, expr):
+        expr.left.accept(self)
+        expr.right.accept(self)
+
+    def visit_grouping_expr(self, expr):
+        expr.expression.accept(self)
+
+    def visit_literal_expr(self, expr: Literal):
+        if isinstance(expr.value, float):
+            expr.value = str(expr.value)
+
+    def visit_variable_expr(self, expr):
+        pass
+
+
+def time_interpret(statements: list) -> float:
+    def run():
+        Interpreter(ErrorReporter()).interpret(statements)
+
+    return best_of(run, REPEAT)
+
+
+def main():
+    float_program = parse(SOURCE)
+    string_program = parse(SOURCE)
+    visitor = _StringifyLiterals()
+    for stmt in string_program:
+        stmt.accept(visitor)
+
+    slow = time_interpret(string_program)
+    fast = time_interpret(float_program)
+    print(f"{STATEMENTS} arithmetic statements, best of {REPEAT}")
+    print(f"  string literals: {slow * 1000:8.2f} ms")
+    print(f"  float literals:  {fast * 1000:8.2f} ms")
+    print(f"  speedup:         {slow / fast:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
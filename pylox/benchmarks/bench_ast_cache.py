@@ -0,0 +1,49 @@
+# Startup of `main.py --cache` on a generated script: the cold run scans,
+# parses and fills __loxcache__, the warm runs load the cached AST.
+#
+# run from the pylox directory: python -m benchmarks.bench_ast_cache
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+LINES = 20_000
+REPEAT = 5
+
+
+def run_script(script: str) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "main.py", "--cache", "--scanner", "regex", script],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    script = os.path.join(directory, "bench.lox")
+    with open(script, "w") as file:
+        for i in range(LINES):
+            file.write(f"var v{i} = ({i} + 1) * 2 - {i} / 3;\n")
+    cache_dir = os.path.join(directory, "__loxcache__")
+
+    try:
+        cold = []
+        for _ in range(REPEAT):
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            cold.append(run_script(script))
+        warm = [run_script(script) for _ in range(REPEAT)]
+    finally:
+        shutil.rmtree(directory)
+
+    print(f"{LINES} line script, best of {REPEAT} runs")
+    print(f"  cold (parse + store): {min(cold) * 1000:8.2f} ms")
+    print(f"  warm (cached AST):    {min(warm) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# Reports the memory held by the AST of a generated 100k line script, once
+# with node classes generated the old way (instance __dict__) and once with
+# the __slots__ classes in src/expr.py and src/stmt.py.
+#
+# run from the pylox directory: python -m benchmarks.bench_ast_memory
+import gc
+import tracemalloc
+import types
+
+import src.parser
+from src.errors import ErrorReporter
+from src.parser import Parser
+from src.scanner import Scanner
+from tools.tool import EXPR_TYPES, STMT_TYPES, generate_ast
+
+LINES = 100_000
+
+
+def generate_source(lines: int) -> str:
+    body = []
+    for i in range(lines):
+        match i % 4:
+            case 0:
+                body.append(f"var v{i} = {i} * (2 + {i % 7}) - 1;")
+            case 1:
+                body.append(f"v{i - 1} = v{i - 1} / 3 + -{i};")
+            case 2:
+                body.append(f'print "line" + "{i}";')
+            case 3:
+                body.append(f"{{ var x = v{i - 3}; print x >= {i} == !false; }}")
+    return "\n".join(body)
+
+
+def load_module(name: str, source: str) -> types.ModuleType:
+    module = types.ModuleType(name)
+    exec(source, module.__dict__)
+    return module
+
+
+def measure_ast(tokens: list) -> tuple[int, int]:
+    gc.collect()
+    tracemalloc.start()
+    statements = Parser(ErrorReporter(), tokens).parse()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, len(statements)
+
+
+def main():
+    source = generate_source(LINES)
+    tokens = Scanner(source, ErrorReporter()).scan_tokens()
+
+    slotted_size, count = measure_ast(tokens)
+
+    # swap the classes the parser builds for ones without __slots__
+    dict_classes = {
+        **load_module("expr", generate_ast("Expr", EXPR_TYPES, slots=False)).__dict__,
+        **load_module("stmt", generate_ast("Stmt", STMT_TYPES, slots=False)).__dict__,
+    }
+    originals = {}
+    for name in dir(src.parser):
+        if isinstance(dict_classes.get(name), type):
+            originals[name] = getattr(src.parser, name)
+            setattr(src.parser, name, dict_classes[name])
+    try:
+        dict_size, _ = measure_ast(tokens)
+    finally:
+        for name, cls in originals.items():
+            setattr(src.parser, name, cls)
+
+    print(f"{LINES} lines, {len(tokens)} tokens, {count} top level statements")
+    print(f"  __dict__ nodes: {dict_size / 2**20:8.2f} MiB")
+    print(f"  __slots__ nodes:{slotted_size / 2**20:8.2f} MiB")
+    print(f"  saved:          {1 - slotted_size / dict_size:8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# Throughput of BatchExecutor on many independent scripts: sequential, with a
+# thread pool and with process pools of 1 up to os.cpu_count() workers.
+# Threads are bound by the GIL, processes should scale with the cores.
+#
+# run from the pylox directory: python -m benchmarks.bench_batch
+import os
+import time
+
+from src.batch import BatchExecutor, run_script
+
+SCRIPTS = 500
+REPEAT = 3
+
+SOURCES = [
+    f"var total = {i};\n"
+    + "{ var a = total; var b = 2; total = total + a * b - (a - b) / 3; }\n" * 20
+    + 'print "script " + "done";'
+    for i in range(SCRIPTS)
+]
+
+
+def best_time(run) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def pooled(workers: int, mode: str) -> float:
+    # the pool is started outside the timing, like a long running service
+    with BatchExecutor(workers, mode) as executor:
+        executor.run(SOURCES[:workers])
+        return best_time(lambda: executor.run(SOURCES))
+
+
+def main():
+    cores = os.cpu_count() or 1
+    sequential = best_time(lambda: [run_script(source) for source in SOURCES])
+    print(f"{SCRIPTS} scripts, {cores} cores, best of {REPEAT}")
+    print(f"  sequential:          {SCRIPTS / sequential:10.0f} scripts/s")
+    rate = SCRIPTS / pooled(cores, "thread")
+    print(f"  {cores:2} threads:          {rate:10.0f} scripts/s")
+    workers = 1
+    while True:
+        rate = SCRIPTS / pooled(workers, "process")
+        print(f"  {workers:2} processes:        {rate:10.0f} scripts/s")
+        if workers >= cores:
+            break
+        workers = min(workers * 2, cores)
+
+
+if __name__ == "__main__":
+    main()
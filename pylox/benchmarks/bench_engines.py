@@ -0,0 +1,63 @@
+# Compares the tree-walking Interpreter with the ClosureCompiler and the
+# bytecode VM on a hot program that is executed many times. The closure
+# program and the bytecode are compiled once up front, the same way a loop
+# body would be.
+#
+# run from the pylox directory: python -m benchmarks.bench_engines
+from benchmarks.common import best_of, parse
+from src.closure_compiler import ClosureCompiler
+from src.compiler import Compiler
+from src.errors import ErrorReporter
+from src.interpreter import Interpreter
+from src.vm import VM
+
+ITERATIONS = 2_000
+REPEAT = 5
+
+SOURCE = """
+var total = 0;
+{
+  var a = 1.5;
+  var b = 2;
+  {
+    var c = a * b - 3 / (a + b);
+    total = total + c * c - (a - b) / 2;
+    a = a + 1;
+    b = b * 1.01;
+  }
+}
+"""
+
+
+def main():
+    statements = parse(SOURCE)
+
+    interpreter = Interpreter(ErrorReporter())
+    compiler = ClosureCompiler(ErrorReporter())
+    program = compiler.compile(statements)
+    vm = VM(ErrorReporter())
+    chunk = Compiler(ErrorReporter()).compile(statements)
+
+    def run_interpreter():
+        for _ in range(ITERATIONS):
+            interpreter.interpret(statements)
+
+    def run_compiled():
+        for _ in range(ITERATIONS):
+            compiler.run(program)
+
+    def run_vm():
+        for _ in range(ITERATIONS):
+            vm.run(chunk)
+
+    walked = best_of(run_interpreter, REPEAT)
+    compiled = best_of(run_compiled, REPEAT)
+    bytecode = best_of(run_vm, REPEAT)
+    print(f"{ITERATIONS} iterations of a hot block, best of {REPEAT}")
+    print(f"  interpreter:      {walked * 1000:8.2f} ms")
+    print(f"  closure compiler: {compiled * 1000:8.2f} ms ({walked / compiled:.2f}x)")
+    print(f"  bytecode vm:      {bytecode * 1000:8.2f} ms ({walked / bytecode:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Equality heavy program run with the previous str() based equality and with
+# the type aware runtime.is_equal.
+#
+# run from the pylox directory: python -m benchmarks.bench_equality
+from unittest.mock import patch
+
+from benchmarks.common import best_of, parse
+from src.errors import ErrorReporter
+from src.interpreter import Interpreter
+from src.runtime import is_equal
+
+STATEMENTS = 2_000
+REPEAT = 5
+
+SOURCE = 'var a = 1.5; var s = "some longer string value"; var done = false;\n' + (
+    'done = (a == 1.5) != (s == "some longer string value") == (done != nil);\n'
+    * STATEMENTS
+)
+
+
+def str_equal(left, right) -> bool:
+    return str(left) == str(right)
+
+
+def main():
+    statements = parse(SOURCE)
+
+    def run():
+        Interpreter(ErrorReporter()).interpret(statements)
+
+    with patch("src.interpreter.is_equal", str_equal):
+        stringified = best_of(run, REPEAT)
+    native = best_of(run, REPEAT)
+    print(f"{STATEMENTS} statements with 5 comparisons each, best of {REPEAT}")
+    print(f"  str() equality:   {stringified * 1000:8.2f} ms")
+    print(f"  native equality:  {native * 1000:8.2f} ms")
+    print(f"  speedup:          {stringified / native:8.2f}x")
+
+    pairs = [(1.5, 1.5), (123456.789, 98765.4321), ("x" * 64, "x" * 64), (True, None)]
+
+    def compare(equal):
+        def run_pairs():
+            for left, right in pairs:
+                equal(left, right)
+
+        return best_of(run_pairs, REPEAT, number=50_000) / len(pairs)
+
+    print("single comparison")
+    print(f"  str() equality:   {compare(str_equal) * 1e9:8.1f} ns")
+    print(f"  native equality:  {compare(is_equal) * 1e9:8.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
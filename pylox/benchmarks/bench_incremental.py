@@ -0,0 +1,73 @@
+# Latency of IncrementalDocument.edit() on a 50k line script against scanning
+# and parsing the whole edited source again. The edits are one character typed
+# in the middle of the file, a line break, and a run of keystrokes in one place.
+#
+# run from the pylox directory: python -m benchmarks.bench_incremental
+import time
+
+from benchmarks.workloads import large_source
+from src.errors import ErrorReporter
+from src.fast_scanner import FastScanner
+from src.incremental import IncrementalDocument
+from src.parser import PrattParser
+
+LINES = 50_000
+KEYSTROKES = 200
+
+
+def full_parse(source: str):
+    error_reporter = ErrorReporter()
+    tokens = FastScanner(source, error_reporter).scan_tokens()
+    return PrattParser(error_reporter, tokens).parse()
+
+
+# milliseconds per edit, over `count` consecutive edits made by make_edit(i)
+def time_edits(document: IncrementalDocument, make_edit, count: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        document.edit(*make_edit(i))
+    return (time.perf_counter() - start) * 1000 / count
+
+
+def main():
+    # half the lines are the `var value_...` declarations
+    source = large_source(LINES // 2)
+    middle = source.index("var value_", len(source) // 2) + len("var value_")
+
+    start = time.perf_counter()
+    full_parse(source)
+    full = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    document = IncrementalDocument(source)
+    initial = (time.perf_counter() - start) * 1000
+
+    # typing `x` then deleting it again keeps the source valid
+    typed = time_edits(
+        document,
+        lambda i: (middle, 0, "x") if i % 2 == 0 else (middle, 1, ""),
+        KEYSTROKES,
+    )
+    line_breaks = time_edits(
+        document,
+        lambda i: (middle - 10, 0, "\n") if i % 2 == 0 else (middle - 10, 1, ""),
+        KEYSTROKES,
+    )
+    # edits alternating between the middle and the start of the file move the
+    # pending shifts back and forth over half of the tokens
+    jumps = time_edits(
+        document,
+        lambda i: (middle if i % 2 == 0 else 4, 0, "\n"),
+        20,
+    )
+
+    print(f"{LINES} lines, {len(document.tokens)} tokens")
+    print(f"  full scan and parse:        {full:8.2f} ms")
+    print(f"  initial document:           {initial:8.2f} ms")
+    print(f"  one character typed:        {typed:8.3f} ms per edit")
+    print(f"  line break typed:           {line_breaks:8.3f} ms per edit")
+    print(f"  far apart line breaks:      {jumps:8.3f} ms per edit")
+
+
+if __name__ == "__main__":
+    main()
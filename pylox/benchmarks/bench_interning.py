@@ -0,0 +1,74 @@
+# Memory held by the tokens of a large source with and without interning of
+# identifiers and strings, scanning time, and the time of a program doing
+# only global variable lookups (names compared by identity when interned).
+#
+# run from the pylox directory: python -m benchmarks.bench_interning
+import gc
+import tracemalloc
+
+from benchmarks.common import best_of
+from src.errors import ErrorReporter
+from src.fast_scanner import FastScanner
+from src.intern import InternTable
+from src.interpreter import Interpreter
+from src.parser import Parser
+from src.resolver import Resolver
+
+LINES = 20_000
+REPEAT = 5
+
+NAMES = [f"variable_number_{i}" for i in range(50)]
+
+SOURCE = "".join(f'var {name} = "initial value";\n' for name in NAMES) + "".join(
+    f"{NAMES[i % 50]} = {NAMES[(i * 7) % 50]} == {NAMES[(i * 3) % 50]};\n"
+    for i in range(LINES)
+)
+
+
+# table handing back every string as is, to scan without interning
+class _NoInterning(InternTable):
+    def intern(self, text: str) -> str:
+        return text
+
+
+def scan(table: InternTable) -> list:
+    return FastScanner(SOURCE, ErrorReporter(), table).scan_tokens()
+
+
+def token_memory(table_type) -> int:
+    gc.collect()
+    tracemalloc.start()
+    tokens = scan(table_type())
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del tokens
+    return size
+
+
+def run_time(table_type) -> float:
+    error_reporter = ErrorReporter()
+    statements = Parser(error_reporter, scan(table_type())).parse()
+    Resolver().resolve(statements)
+    return best_of(lambda: Interpreter(error_reporter).interpret(statements), REPEAT)
+
+
+def main():
+    table = InternTable()
+    scan(table)
+    stats = table.stats()
+    print(f"{LINES} lines, best of {REPEAT}")
+    print(f"  hit rate: {stats.hit_rate:.2%} ({stats.hits} hits, {len(table)} unique)")
+
+    plain, interned = token_memory(_NoInterning), token_memory(InternTable)
+    print(f"  token memory: {plain / 2**20:7.2f} MiB -> {interned / 2**20:7.2f} MiB")
+
+    plain = best_of(lambda: scan(_NoInterning()), REPEAT)
+    interned = best_of(lambda: scan(InternTable()), REPEAT)
+    print(f"  scanning:     {plain * 1000:7.2f} ms  -> {interned * 1000:7.2f} ms")
+
+    plain, interned = run_time(_NoInterning), run_time(InternTable)
+    print(f"  lookups:      {plain * 1000:7.2f} ms  -> {interned * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# Output heavy program run with print() per line, a BufferedSink and a
+# NullSink. stdout is redirected to os.devnull so the terminal is not timed.
+#
+# run from the pylox directory: python -m benchmarks.bench_output
+import contextlib
+import os
+
+from benchmarks.common import best_of, parse
+from src.errors import ErrorReporter
+from src.interpreter import Interpreter
+from src.output import BufferedSink, NullSink
+
+LINES = 20_000
+REPEAT = 5
+
+SOURCE = "var a = 0.5;\n" + 'print a; print "line"; a = a + 1;\n' * (LINES // 2)
+
+
+def main():
+    statements = parse(SOURCE)
+
+    def run(make_sink):
+        def run_once():
+            sink = make_sink()
+            Interpreter(ErrorReporter(), sink).interpret(statements)
+            if sink is not None:
+                sink.flush()
+
+        return run_once
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        printed = best_of(run(lambda: None), REPEAT)
+        buffered = best_of(run(BufferedSink), REPEAT)
+        discarded = best_of(run(NullSink), REPEAT)
+
+    print(f"{LINES} printed lines, best of {REPEAT}")
+    print(f"  print():      {printed * 1000:8.2f} ms")
+    print(f"  BufferedSink: {buffered * 1000:8.2f} ms ({printed / buffered:.2f}x)")
+    print(f"  NullSink:     {discarded * 1000:8.2f} ms ({printed / discarded:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# Parsing throughput of the recursive descent Parser and the PrattParser on
+# the same tokens, for expression heavy and statement heavy sources.
+#
+# run from the pylox directory: python -m benchmarks.bench_parser
+from benchmarks.bench_ast_memory import generate_source
+from benchmarks.common import best_of
+from benchmarks.workloads import arithmetic_chain
+from src.errors import ErrorReporter
+from src.fast_scanner import FastScanner
+from src.parser import Parser, PrattParser
+
+REPEAT = 5
+
+SOURCES = {
+    "arithmetic chains": arithmetic_chain(2_000),
+    "mixed statements": generate_source(20_000),
+}
+
+
+def main():
+    print(f"best of {REPEAT}")
+    for name, source in SOURCES.items():
+        tokens = FastScanner(source, ErrorReporter()).scan_tokens()
+        descent = best_of(lambda: Parser(ErrorReporter(), tokens).parse(), REPEAT)
+        pratt = best_of(lambda: PrattParser(ErrorReporter(), tokens).parse(), REPEAT)
+        rate = len(tokens) / 1e6
+        print(f"  {name}, {len(tokens)} tokens")
+        print(
+            f"    Parser:      {descent * 1000:8.2f} ms ({rate / descent:5.2f} M tokens/s)"
+        )
+        print(
+            f"    PrattParser: {pratt * 1000:8.2f} ms ({rate / pratt:5.2f} M tokens/s)"
+        )
+        print(f"    speedup:     {descent / pratt:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# Per line latency of the REPL for trivial statements: new lines, which are
+# scanned and parsed, and lines entered again, which run from the session's
+# cache. Output goes to an in-memory stream.
+#
+# run from the pylox directory: python -m benchmarks.bench_repl
+import io
+import statistics
+import time
+
+from src.repl import Repl
+
+LINES = 5_000
+
+REENTERED = [
+    "a = a + 1;",
+    "print a;",
+    "{ var b = a * 2; b = b - 1; }",
+]
+
+
+# microseconds per line for every pushed line
+def latencies(repl: Repl, lines: list[str]) -> list[float]:
+    timings = []
+    for line in lines:
+        start = time.perf_counter()
+        repl.push(line)
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return timings
+
+
+def report(name: str, timings: list[float]):
+    timings = sorted(timings)
+    p99 = timings[int(len(timings) * 0.99)]
+    print(
+        f"  {name:<12} median {statistics.median(timings):7.1f} us"
+        f"   p99 {p99:7.1f} us   max {timings[-1]:7.1f} us"
+    )
+
+
+def main():
+    repl = Repl(stdout=io.StringIO())
+    repl.push("var a = 0;")
+    new = latencies(repl, [f"var v{i} = a + {i};" for i in range(LINES)])
+    reentered = latencies(repl, [REENTERED[i % len(REENTERED)] for i in range(LINES)])
+
+    print(f"{LINES} lines each")
+    report("new", new)
+    report("re-entered", reentered)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+# Compares scanning throughput of the char by char Scanner and the regex based
+# FastScanner on a large generated source.
+#
+# run from the pylox directory: python -m benchmarks.bench_scanner
+from benchmarks.common import best_of
+from src.errors import ErrorReporter
+from src.fast_scanner import FastScanner
+from src.scanner import Scanner
+
+LINES = 20_000
+REPEAT = 3
+
+SOURCE = "\n".join(
+    f"var value_{i} = {i} * (value_{i - 1} + 3.25) / 7; // running total\n"
+    f'print "line {i}: " + value_{i} >= {i};'
+    for i in range(LINES)
+)
+
+
+def main():
+    def scan(scanner):
+        return lambda: scanner(SOURCE, ErrorReporter()).scan_tokens()
+
+    slow = best_of(scan(Scanner), REPEAT)
+    fast = best_of(scan(FastScanner), REPEAT)
+    size = len(SOURCE) / 2**20
+    print(f"{size:.2f} MiB of source, best of {REPEAT}")
+    print(f"  Scanner:     {slow * 1000:8.2f} ms ({size / slow:6.2f} MiB/s)")
+    print(f"  FastScanner: {fast * 1000:8.2f} ms ({size / fast:6.2f} MiB/s)")
+    print(f"  speedup:     {slow / fast:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# Per call overhead of running small snippets: building a new Scanner, Parser,
+# Resolver and Interpreter for every snippet like main.run does, against one
+# warm LoxSession with and without its parse cache.
+#
+# run from the pylox directory: python -m benchmarks.bench_session
+from benchmarks.common import best_of
+from src.errors import ErrorReporter
+from src.interpreter import Interpreter
+from src.output import MemorySink
+from src.parser import Parser
+from src.resolver import Resolver
+from src.scanner import Scanner
+from src.session import LoxSession
+
+CALLS = 2_000
+REPEAT = 5
+
+SNIPPETS = [
+    "var a = 1;",
+    "a = a + 1;",
+    '{ var b = a * 2; var c = "n" + "m"; b = b - 1; }',
+    "var d = a >= 2;",
+    "print a;",
+]
+
+
+def fresh():
+    output = MemorySink()
+    for i in range(CALLS):
+        error_reporter = ErrorReporter()
+        tokens = Scanner(SNIPPETS[i % len(SNIPPETS)], error_reporter).scan_tokens()
+        statements = Parser(error_reporter, tokens).parse()
+        Resolver().resolve(statements)
+        interpreter = Interpreter(error_reporter, output)
+        # every snippet starts from empty globals, so seed `a`
+        interpreter.globals.define("a", 1.0)
+        interpreter.interpret(statements)
+
+
+def session(cache_size: int):
+    def run():
+        lox = LoxSession(cache_size=cache_size)
+        for i in range(CALLS):
+            lox.execute(SNIPPETS[i % len(SNIPPETS)])
+
+    return run
+
+
+def main():
+    cold = best_of(fresh, REPEAT)
+    uncached = best_of(session(0), REPEAT)
+    warm = best_of(session(256), REPEAT)
+    print(f"{CALLS} small snippets, best of {REPEAT}, per call")
+    print(f"  new objects per call:    {cold / CALLS * 1e6:8.2f} us")
+    print(f"  LoxSession, no cache:    {uncached / CALLS * 1e6:8.2f} us")
+    print(f"  LoxSession, parse cache: {warm / CALLS * 1e6:8.2f} us")
+    print(f"  speedup:                 {cold / warm:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Compares the recursive Interpreter with the StackInterpreter on deep trees: a
+# long chain of additions and deeply nested blocks. The recursive visitor needs
+# a raised recursion limit to run them at all. The StackInterpreter is timed
+# end to end (interpret(), flattening included) and running already flattened
+# code (run()), since the two differ: flattening nested blocks costs about as
+# much as the recursive Interpreter saves running them, so end to end the
+# StackInterpreter is a little slower on "blocks".
+#
+# run from the pylox directory: python -m benchmarks.bench_stack_interpreter
+import sys
+from unittest.mock import patch
+
+from benchmarks.common import best_of, parse
+from src.errors import ErrorReporter
+from src.interpreter import Interpreter
+from src.stack_interpreter import StackInterpreter
+
+DEPTH = 2_000
+REPEAT = 5
+
+PROGRAMS = {
+    "expression": "var a = " + " + ".join(["1"] * DEPTH) + ";",
+    "blocks": "var a = 0;" + "{ var b = 1;" * DEPTH + "a = a + b;" + "}" * DEPTH,
+}
+
+
+def main():
+    # every Python frame of the recursive parser and visitor counts, a node
+    # takes several
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), DEPTH * 10))
+    print(f"depth {DEPTH}, best of {REPEAT}")
+    for name, source in PROGRAMS.items():
+        statements = parse(source)
+        recursive = Interpreter(ErrorReporter())
+        stack = StackInterpreter(ErrorReporter())
+        code = stack.compile(statements)
+        with patch("builtins.print"):
+            walked = best_of(lambda: recursive.interpret(statements), REPEAT)
+            iterative = best_of(lambda: stack.interpret(statements), REPEAT)
+            flattened = best_of(lambda: stack.run(code), REPEAT)
+        print(f"  {name}:")
+        print(f"    interpreter:               {walked * 1000:8.2f} ms")
+        print(
+            f"    stack interpreter:         {iterative * 1000:8.2f} ms"
+            f" ({walked / iterative:.2f}x)"
+        )
+        print(
+            f"    stack interpreter, run:    {flattened * 1000:8.2f} ms"
+            f" ({walked / flattened:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# Cold start of `python main.py script.lox`: the time spent importing what
+# pylox needs, measured with `-X importtime` against a bare `python -c pass`,
+# for the default options and a few others, plus the wall time of whole runs.
+# tests/test_startup.py checks the default run against IMPORT_BUDGET_MS and
+# that none of SLOW_MODULES is imported.
+#
+# run from the pylox directory: python -m benchmarks.bench_startup
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+PYLOX_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPEAT = 5
+
+# import time of the default run, in ms of the modules' own import times
+IMPORT_BUDGET_MS = 30.0
+
+# standard modules too slow to import for a plain script run
+SLOW_MODULES = {"argparse", "dataclasses", "enum", "re", "typing", "tracemalloc"}
+
+MODES = {
+    "default": [],
+    "--engine vm": ["--engine", "vm"],
+    "--scanner regex": ["--scanner", "regex"],
+    "--cache": ["--cache"],
+}
+
+
+# module -> microseconds spent importing the module itself, for a python run
+# with the given arguments
+def import_times(args: list[str]) -> dict[str, int]:
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=PYLOX_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    times = dict()
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, _, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(own)
+    return times
+
+
+# modules imported by `main.py *args` on top of the interpreter's own, with
+# their import time in microseconds, from the fastest of `repeat` runs
+def startup_imports(args: list[str], repeat: int = REPEAT) -> dict[str, int]:
+    bare = import_times(["-c", "pass"])
+    runs = []
+    for _ in range(repeat):
+        times = import_times(["main.py", *args])
+        runs.append({name: t for name, t in times.items() if name not in bare})
+    return min(runs, key=lambda run: sum(run.values()))
+
+
+def import_ms(imports: dict[str, int]) -> float:
+    return sum(imports.values()) / 1000
+
+
+def wall_ms(args: list[str], repeat: int = REPEAT) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args],
+            cwd=PYLOX_DIR,
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+# a small script in a temporary directory, which also gets the --cache files
+def write_script() -> str:
+    script = os.path.join(tempfile.mkdtemp(), "startup.lox")
+    with open(script, "w") as file:
+        file.write("var a = 1;\n{ var b = a + 2; print b * 3; }\n")
+    return script
+
+
+def main():
+    script = write_script()
+    # compiles the .pyc files and fills the AST cache
+    for args in MODES.values():
+        import_times(["main.py", *args, script])
+
+    print(f"python -c pass:      {wall_ms(['-c', 'pass']):8.2f} ms wall")
+    for mode, args in MODES.items():
+        imports = startup_imports([*args, script])
+        wall = wall_ms(["main.py", *args, script])
+        print(
+            f"{mode:<20} {wall:8.2f} ms wall, {import_ms(imports):6.2f} ms importing "
+            f"{len(imports)} modules"
+        )
+    default = startup_imports([script])
+    slowest = sorted(default.items(), key=lambda item: -item[1])[:5]
+    print(f"budget {IMPORT_BUDGET_MS} ms, slowest imports of the default run:")
+    for name, own in slowest:
+        print(f"  {name:<20} {own / 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# Peak memory of scanning a generated file, once by reading it whole and
+# building the token list and once through scan_stream feeding a TokenWindow.
+#
+# run from the pylox directory: python -m benchmarks.bench_stream_memory
+import os
+import tempfile
+import tracemalloc
+
+from src.errors import ErrorReporter
+from src.fast_scanner import FastScanner
+from src.stream_scanner import TokenWindow, scan_stream
+
+LINES = 50_000
+
+
+def peak_memory(fn) -> int:
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    with tempfile.NamedTemporaryFile("w", suffix=".lox", delete=False) as file:
+        for i in range(LINES):
+            file.write(f'var v{i} = {i} * 2 + 1; print "line " + "{i}";\n')
+    try:
+
+        def whole():
+            with open(file.name) as f:
+                tokens = FastScanner(f.read(), ErrorReporter()).scan_tokens()
+            return len(tokens)
+
+        def streamed():
+            with open(file.name) as f:
+                window = TokenWindow(scan_stream(f, ErrorReporter()))
+                index = 0
+                while window[index].lexeme != "":
+                    index += 1
+            return index + 1
+
+        size = os.path.getsize(file.name) / 2**20
+        print(f"{LINES} lines, {size:.2f} MiB")
+        print(f"  read + token list: {peak_memory(whole) / 2**20:8.2f} MiB peak")
+        print(f"  streamed:          {peak_memory(streamed) / 2**20:8.2f} MiB peak")
+    finally:
+        os.unlink(file.name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# Builds strings of 10k to 1M characters with `s = s + chunk;` statements,
+# once with plain str concatenation (copying s every time) and once with
+# ropes, then compares the result with `==` so the rope is materialized.
+#
+# run from the pylox directory: python -m benchmarks.bench_strings
+from benchmarks.common import best_of, parse
+from src import runtime
+from src.errors import ErrorReporter
+from src.interpreter import Interpreter
+from src.output import MemorySink
+
+SIZES = [10_000, 100_000, 1_000_000]
+CHUNK = 100
+REPEAT = 3
+DEFAULT_THRESHOLD = runtime.ROPE_THRESHOLD
+
+
+def program(size: int) -> str:
+    chunk = "x" * CHUNK
+    return (
+        'var s = "";\n'
+        + f's = s + "{chunk}";\n' * (size // CHUNK)
+        + f'print s == "{chunk}" + s;\n'
+    )
+
+
+def time_building(statements: list, threshold) -> float:
+    runtime.ROPE_THRESHOLD = threshold
+
+    def run():
+        Interpreter(ErrorReporter(), MemorySink()).interpret(statements)
+
+    try:
+        return best_of(run, REPEAT)
+    finally:
+        runtime.ROPE_THRESHOLD = DEFAULT_THRESHOLD
+
+
+def main():
+    print(f"appending {CHUNK} character chunks, best of {REPEAT}")
+    for size in SIZES:
+        statements = parse(program(size))
+        plain = time_building(statements, float("inf"))
+        rope = time_building(statements, DEFAULT_THRESHOLD)
+        print(
+            f"  {size:>9} chars: str {plain * 1000:9.2f} ms, "
+            f"rope {rope * 1000:8.2f} ms ({plain / rope:6.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
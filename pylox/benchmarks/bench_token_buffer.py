@@ -0,0 +1,54 @@
+# Memory held by the tokens of a generated source with about a million tokens
+# as a list of Tokens (FastScanner) and as a TokenBuffer (CompactScanner),
+# plus the time to scan and to scan and parse with each.
+#
+# run from the pylox directory: python -m benchmarks.bench_token_buffer
+import gc
+import tracemalloc
+
+from benchmarks.bench_ast_memory import generate_source
+from benchmarks.common import best_of
+from src.errors import ErrorReporter
+from src.fast_scanner import FastScanner
+from src.parser import Parser
+from src.token_buffer import CompactScanner
+
+LINES = 100_000
+REPEAT = 3
+
+
+def traced_size(fn) -> int:
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main():
+    source = generate_source(LINES)
+    count = len(CompactScanner(source, ErrorReporter()).scan_tokens())
+    print(f"{count} tokens, best of {REPEAT}")
+
+    for scanner in (FastScanner, CompactScanner):
+
+        def scan():
+            return scanner(source, ErrorReporter()).scan_tokens()
+
+        def scan_and_parse():
+            return Parser(ErrorReporter(), scan()).parse()
+
+        size = traced_size(scan)
+        scanning = best_of(scan, REPEAT)
+        parsing = best_of(scan_and_parse, REPEAT)
+        print(
+            f"  {scanner.__name__:<15} tokens {size / 2**20:7.2f} MiB "
+            f"({size / count:5.1f} B/token), scan {scanning * 1000:8.2f} ms, "
+            f"scan+parse {parsing * 1000:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+import timeit
+
+from src.errors import ErrorReporter
+from src.parser import Parser
+from src.resolver import Resolver
+from src.scanner import Scanner
+
+
+def parse(source: str) -> list:
+    error_reporter = ErrorReporter()
+    tokens = Scanner(source, error_reporter).scan_tokens()
+    statements = Parser(error_reporter, tokens).parse()
+    Resolver().resolve(statements)
+    return statements
+
+
+# best wall time in seconds of `repeat` runs of fn
+def best_of(fn, repeat: int = 5, number: int = 1) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
@@ -0,0 +1,164 @@
+# Times the scan, parse (including resolution) and interpret phases of every
+# workload in benchmarks/workloads.py over repeated runs, and compares the
+# best times with a stored baseline. Any phase slower than the baseline by
+# more than the tolerance is reported as a regression and the suite exits 1.
+# Timings depend on the machine, record a baseline on the machine comparing.
+#
+# run from the pylox directory:
+#   python -m benchmarks.suite                  compare with baseline.json
+#   python -m benchmarks.suite --save-baseline  record a new baseline
+#   python -m benchmarks.suite --scale 0.1      smaller workloads
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+from benchmarks.workloads import WORKLOADS
+from src.errors import ErrorReporter
+from src.fast_scanner import FastScanner
+from src.interpreter import Interpreter
+from src.parser import Parser
+from src.resolver import Resolver
+from src.scanner import Scanner
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+PHASES = ("scan", "parse", "interpret")
+SCANNERS = {"char": Scanner, "regex": FastScanner}
+REPEAT = 5
+TOLERANCE = 0.25
+
+
+# wall times in seconds of every phase, one list entry per run
+def time_phases(source: str, scanner=Scanner, repeat: int = REPEAT) -> dict:
+    times = {phase: [] for phase in PHASES}
+    for _ in range(repeat):
+        error_reporter = ErrorReporter()
+
+        start = time.perf_counter()
+        tokens = scanner(source, error_reporter).scan_tokens()
+        scanned = time.perf_counter()
+        statements = Parser(error_reporter, tokens).parse()
+        Resolver().resolve(statements)
+        parsed = time.perf_counter()
+        Interpreter(error_reporter).interpret(statements)
+        interpreted = time.perf_counter()
+
+        if error_reporter.had_error or error_reporter.had_runtime_error:
+            raise RuntimeError("workload failed to run")
+        times["scan"].append(scanned - start)
+        times["parse"].append(parsed - scanned)
+        times["interpret"].append(interpreted - parsed)
+    return times
+
+
+def summarize(samples: list) -> dict:
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.mean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+# {workload: {"size": n, phase: stats}}
+def run_suite(scale: float = 1.0, scanner=Scanner, repeat: int = REPEAT) -> dict:
+    results = dict()
+    for name, (generate, size) in WORKLOADS.items():
+        size = max(1, int(size * scale))
+        times = time_phases(generate(size), scanner, repeat)
+        results[name] = {"size": size}
+        results[name].update({phase: summarize(times[phase]) for phase in PHASES})
+    return results
+
+
+# messages for every phase whose best time is slower than the baseline by more
+# than the tolerance. Workloads run with another size than the baseline are
+# not comparable and are skipped.
+def regressions(results: dict, baseline: dict, tolerance: float = TOLERANCE) -> list:
+    found = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None or expected["size"] != result["size"]:
+            continue
+        for phase in PHASES:
+            best, limit = result[phase]["min"], expected[phase]["min"] * (1 + tolerance)
+            if best > limit:
+                found.append(
+                    f"{name} {phase}: {best * 1000:.2f} ms, baseline "
+                    f"{expected[phase]['min'] * 1000:.2f} ms (+{tolerance:.0%} allowed)"
+                )
+    return found
+
+
+def report(results: dict, baseline: dict):
+    print(
+        f"{'workload':<18} {'phase':<10} {'min ms':>9} {'median ms':>10} "
+        f"{'stdev ms':>9} {'vs base':>9}"
+    )
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is not None and expected["size"] != result["size"]:
+            expected = None
+        for phase in PHASES:
+            stats = result[phase]
+            change = ""
+            if expected is not None:
+                change = f"{stats['min'] / expected[phase]['min'] - 1:+9.1%}"
+            print(
+                f"{name:<18} {phase:<10} {stats['min'] * 1000:9.2f} "
+                f"{stats['median'] * 1000:10.2f} {stats['stdev'] * 1000:9.2f} {change}"
+            )
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(prog="benchmarks.suite")
+    arg_parser.add_argument(
+        "--scale", type=float, default=1.0, help="multiplies the size of every workload"
+    )
+    arg_parser.add_argument("--repeat", type=int, default=REPEAT)
+    arg_parser.add_argument("--scanner", choices=SCANNERS, default="char")
+    arg_parser.add_argument("--baseline", default=BASELINE)
+    arg_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=TOLERANCE,
+        help="allowed slowdown over the baseline, 0.25 is 25%%",
+    )
+    arg_parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="store the results as the new baseline",
+    )
+    args = arg_parser.parse_args()
+
+    # the nested_blocks workload recurses deeply in the parser and interpreter
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))
+    results = run_suite(args.scale, SCANNERS[args.scanner], args.repeat)
+
+    if args.save_baseline:
+        with open(args.baseline, mode="w") as file:
+            json.dump(results, file, indent=2)
+        report(results, dict())
+        print(f"baseline saved to {args.baseline}")
+        return
+
+    try:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+    except FileNotFoundError:
+        baseline = dict()
+        print(f"no baseline at {args.baseline}, run with --save-baseline")
+    report(results, baseline)
+
+    found = regressions(results, baseline, args.tolerance)
+    if found:
+        print("\nREGRESSIONS:", file=sys.stderr)
+        for message in found:
+            print(f"  {message}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
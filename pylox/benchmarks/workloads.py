@@ -0,0 +1,58 @@
+# Generators for the Lox programs used by the benchmark suite. Each one takes
+# a size and returns source text, so workloads can be scaled up or down.
+
+
+# `depth` nested blocks, each declaring a variable. The innermost block reads
+# and assigns variables from every level and a global, so each access walks
+# part of the Environment chain.
+def nested_blocks(depth: int) -> str:
+    lines = ["var total = 0;"]
+    for level in range(depth):
+        lines.append(f"{{ var v{level} = {level};")
+    for level in range(depth):
+        lines.append(f"total = total + v{level} * v{depth - 1 - level};")
+        lines.append(f"v{level} = v{level} + 1;")
+    lines.append("}" * depth)
+    return "\n".join(lines) + "\n"
+
+
+# `length` statements, each a long chain of binary operators on numbers
+def arithmetic_chain(length: int) -> str:
+    lines = ["var a = 1.5;", "var b = 2;"]
+    for i in range(length):
+        lines.append(
+            f"a = (a * {i % 7 + 1} - b / 4 + {i}) / (b + 1) - (a - b) * 0.5 "
+            f"+ -a * 2 - b / 3 + {i % 5} * (a + b) / 8;"
+        )
+    return "\n".join(lines) + "\n"
+
+
+# `count` string concatenations growing a single string
+def string_concat(count: int) -> str:
+    lines = ['var s = "";']
+    for i in range(count):
+        lines.append(f's = s + "chunk {i} " + "of text";')
+    lines.append('var done = s == "";')
+    return "\n".join(lines) + "\n"
+
+
+# `lines` lines of declarations, comments and string literals, mostly to
+# measure the scanner and the parser on a big file
+def large_source(lines: int) -> str:
+    return (
+        "\n".join(
+            f"var value_{i} = {i} * (3.25 + {i % 10}) / 7; // running total\n"
+            f'var label_{i} = "line {i}: " + "value";'
+            for i in range(lines)
+        )
+        + "\n"
+    )
+
+
+# name -> (generator, default size)
+WORKLOADS = {
+    "nested_blocks": (nested_blocks, 150),
+    "arithmetic_chain": (arithmetic_chain, 2_000),
+    "string_concat": (string_concat, 2_000),
+    "large_source": (large_source, 10_000),
+}
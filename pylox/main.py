@@ -1,50 +1,395 @@
+# Started for every script, so only what the chosen options need is imported:
+# components are named by "module:attribute" and loaded on first use, the
+# argument parser is only built when there are options to parse, and the
+# modules on the default path avoid enum, dataclasses and typing. Run
+# benchmarks/bench_startup.py after adding an import here.
+import io
+import os
 import sys
 
 from src.errors import ErrorReporter
-from src.interpreter import Interpreter
-from src.parser import Parser
-from src.scanner import Scanner
+from src.instrumentation import Instrumentation
 
+SCANNERS = {
+    "char": "src.scanner:Scanner",
+    "regex": "src.fast_scanner:FastScanner",
+    "compact": "src.token_buffer:CompactScanner",
+}
 
-def run_file(file_name: str):
+PARSERS = {
+    "pratt": "src.parser:PrattParser",
+    "descent": "src.parser:Parser",
+}
+
+ENGINES = {
+    "interpreter": "src.interpreter:Interpreter",
+    "stack": "src.stack_interpreter:StackInterpreter",
+    "closure": "src.closure_compiler:ClosureCompiler",
+    "vm": "src.vm:VM",
+}
+
+
+# imports the attribute named by a "module:attribute" spec. __import__ rather
+# than importlib.import_module, which -X importtime doesn't see.
+def load(spec: str):
+    module, attribute = spec.split(":")
+    return getattr(__import__(module, fromlist=[attribute]), attribute)
+
+
+PROFILE_OUTPUT = "pylox_profile.json"
+
+
+class Options:
+    __slots__ = (
+        "engine",
+        "scanner",
+        "parser",
+        "pipeline",
+        "cache",
+        "optimize",
+        "profile",
+        "buffered",
+    )
+
+    def __init__(
+        self,
+        engine: str = "interpreter",
+        scanner: str = "char",
+        parser: str = "pratt",
+        pipeline: bool = False,
+        cache: bool = False,
+        optimize: bool = False,
+        # path of the JSON profile, profiling is off when None
+        profile: str | None = None,
+        buffered: bool = False,
+    ):
+        self.engine = engine
+        self.scanner = scanner
+        self.parser = parser
+        self.pipeline = pipeline
+        self.cache = cache
+        self.optimize = optimize
+        self.profile = profile
+        self.buffered = buffered
+
+
+DEFAULT_OPTIONS = Options()
+
+
+def run_file(file_name: str, options: Options = DEFAULT_OPTIONS):
     with open(file_name, mode="r") as file:
-        source = file.read()
-    run(source)
+        if options.scanner == "stream":
+            run_stream(file, options)
+        elif options.cache:
+            from src.ast_cache import CACHE_DIR
+
+            cache_dir = os.path.join(
+                os.path.dirname(os.path.abspath(file_name)), CACHE_DIR
+            )
+            run_cached(file.read(), cache_dir, options)
+        else:
+            run(file.read(), options)
     if errorReporter.had_error or errorReporter.had_runtime_error:
         exit(1)
     return
 
 
-def run_prompt():
-    while True:
-        source = input("> ")
-        run(source)
-        errorReporter.had_error = False
-        errorReporter.had_runtime_error = False
+# one session for the whole prompt, so globals survive from line to line. The
+# session always uses the regex scanner and the Pratt parser, of the options
+# only --engine, --optimize and --stats apply (parse_args rejects the others).
+def run_prompt(options: Options = DEFAULT_OPTIONS):
+    from src.repl import Repl
+    from src.session import LoxSession
+
+    engine = load(ENGINES[options.engine])
+    session = LoxSession(optimize=options.optimize, engine=engine)
+    Repl(session, instrumentation=instrumentation).loop()
+
 
+def run(source: str, options: Options = DEFAULT_OPTIONS):
+    if options.scanner == "stream":
+        run_stream(io.StringIO(source), options)
+        return
+
+    scanner = load(SCANNERS[options.scanner])
+    with instrumentation.phase("scan") as event:
+        tokens = scanner(source, errorReporter).scan_tokens()
+        if event:
+            event.count, event.unit = len(tokens), "tokens"
+    run_tokens(tokens, options)
+
+
+# scans the file lazily while parsing, only a small window of tokens is kept.
+# Scanning is then reported as part of the parse phase.
+def run_stream(
+    file: io.TextIOWrapper | io.StringIO, options: Options = DEFAULT_OPTIONS
+):
+    from src.stream_scanner import TokenWindow, scan_stream
+
+    run_tokens(TokenWindow(scan_stream(file, errorReporter)), options)
+
+
+def run_tokens(tokens, options: Options = DEFAULT_OPTIONS):
+    p = load(PARSERS[options.parser])(errorReporter, tokens)
+    if options.pipeline:
+        run_pipelined(p, options)
+        return
 
-def run(source: str):
-    s = Scanner(source, errorReporter)
-    tokens = s.scan_tokens()
-    print(tokens)
+    with instrumentation.phase("parse") as event:
+        statements = p.parse()
+        if event:
+            event.count, event.unit = count_nodes(statements), "nodes"
+    run_statements(statements, options)
 
-    p = Parser(errorReporter, tokens)
-    statements = p.parse()
 
+# node count reported by the parse and load phases
+def count_nodes(statements: list) -> int:
+    from src.optimizer import count_nodes
+
+    return count_nodes(statements)
+
+
+# loads the parsed program from the AST cache, or parses and stores it
+def run_cached(source: str, cache_dir: str, options: Options = DEFAULT_OPTIONS):
+    from src.ast_cache import AstCache
+
+    ast_cache = AstCache(cache_dir)
+    with instrumentation.phase("load") as event:
+        statements = ast_cache.load(source)
+        if event and statements is not None:
+            event.count, event.unit = count_nodes(statements), "nodes"
+    if statements is None:
+        scanner = load(SCANNERS[options.scanner])
+        with instrumentation.phase("scan") as event:
+            tokens = scanner(source, errorReporter).scan_tokens()
+            if event:
+                event.count, event.unit = len(tokens), "tokens"
+        with instrumentation.phase("parse") as event:
+            statements = load(PARSERS[options.parser])(errorReporter, tokens).parse()
+            if event:
+                event.count, event.unit = count_nodes(statements), "nodes"
+        if not errorReporter.had_error:
+            ast_cache.store(source, statements)
+    run_statements(statements, options)
+
+
+def run_statements(statements: list, options: Options = DEFAULT_OPTIONS):
     if errorReporter.had_error:
         return
 
-    i = Interpreter(errorReporter)
-    i.interpret(statements)
+    from src.resolver import Resolver
+
+    if options.optimize:
+        from src.optimizer import Optimizer
+
+        with instrumentation.phase("optimize") as event:
+            optimizer = Optimizer()
+            statements = optimizer.optimize(statements)
+            if event:
+                event.count, event.unit = optimizer.eliminated, "eliminated"
+
+    with instrumentation.phase("resolve"):
+        Resolver().resolve(statements)
+
+    with instrumentation.phase("interpret"):
+        i = make_engine(options)
+        i.interpret(statements)
+        if i.output is not None:
+            i.output.flush()
+    write_profile(i, options)
+
+
+# executes every top level declaration as soon as it is parsed instead of
+# parsing the whole program first. Execution stops at the first parse error
+# (parsing goes on so all of them are reported) or at the first runtime error.
+def run_pipelined(p, options: Options = DEFAULT_OPTIONS):
+    from src.optimizer import Optimizer
+    from src.resolver import Resolver
+
+    optimizer = Optimizer() if options.optimize else None
+    resolver = Resolver()
+    i = make_engine(options)
+    # phases are interleaved, the whole run is reported as one
+    with instrumentation.phase("pipeline") as event:
+        executed = 0
+        for stmt in p.declarations():
+            if errorReporter.had_runtime_error:
+                break
+            if errorReporter.had_error:
+                continue
+            statements = optimizer.optimize([stmt]) if optimizer else [stmt]
+            resolver.resolve(statements)
+            i.interpret(statements)
+            executed += 1
+        if i.output is not None:
+            i.output.flush()
+        if event:
+            event.count, event.unit = executed, "statements"
+    write_profile(i, options)
+
+
+def make_engine(options: Options = DEFAULT_OPTIONS):
+    output = None
+    if options.buffered:
+        from src.output import BufferedSink
+
+        output = BufferedSink()
+    if options.profile is not None:
+        from src.profiler import ProfilingInterpreter
+
+        return ProfilingInterpreter(errorReporter, output)
+    return load(ENGINES[options.engine])(errorReporter, output)
+
+
+# prints the hot spots to stderr and saves the whole profile as JSON
+def write_profile(i, options: Options = DEFAULT_OPTIONS):
+    if options.profile is None:
+        return
+    print(i.report(), file=sys.stderr)
+    with open(options.profile, mode="w") as file:
+        file.write(i.to_json())
 
 
 errorReporter = ErrorReporter()
+# subscribe to it to get a PhaseEvent after every phase of a run
+instrumentation = Instrumentation()
 
-if __name__ == "__main__":
-    if len(sys.argv) > 2:
-        print("Usage: jlox [script]")
-        exit(1)
-    elif len(sys.argv) == 2:
-        run_file(sys.argv[1])
+
+# the parser for the command line options, only built when there are some
+def argument_parser():
+    import argparse
+
+    from src.ast_cache import CACHE_DIR
+
+    arg_parser = argparse.ArgumentParser(prog="pylox")
+    arg_parser.add_argument("script", nargs="?")
+    arg_parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="interpreter",
+        help="execution engine used to run the program",
+    )
+    arg_parser.add_argument(
+        "--scanner",
+        choices=[*SCANNERS, "stream"],
+        help="char by char scanner, the faster regex based one, the regex "
+        "scanner storing tokens in compact arrays, or the regex scanner "
+        "reading the file in chunks while parsing",
+    )
+    arg_parser.add_argument(
+        "--parser",
+        choices=PARSERS,
+        help="table driven precedence climbing expression parser, or the "
+        "recursive descent one with a method per precedence level",
+    )
+    arg_parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="execute each top level declaration as soon as it is parsed, "
+        "by default the whole program is parsed before anything runs",
+    )
+    arg_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"reuse the parsed program from {CACHE_DIR} next to the script, "
+        "skipped when that directory can't be written (not with --pipeline or "
+        "--scanner stream)",
+    )
+    arg_parser.add_argument(
+        "--optimize",
+        action="store_true",
+        help="fold constants and drop dead code before running the program "
+        "(--stats shows the number of nodes eliminated)",
+    )
+    arg_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="count and time every executed node, print the hot spots and save "
+        "the profile as JSON, only with --engine interpreter",
+    )
+    arg_parser.add_argument(
+        "--profile-output",
+        metavar="FILE",
+        help=f"where --profile saves the JSON profile (default {PROFILE_OUTPUT})",
+    )
+    arg_parser.add_argument(
+        "--buffered-output",
+        action="store_true",
+        help="write the output of print statements in large blocks instead of "
+        "line by line (with --pipeline, parse errors may show up before "
+        "earlier output)",
+    )
+    arg_parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="print the time, CPU time, peak memory and size of every phase to "
+        "stderr on exit (tracing memory slows the run down)",
+    )
+    return arg_parser
+
+
+# script (None for the prompt), Options and whether --stats was given. A lone
+# script name is by far the common case and doesn't need argparse.
+def parse_args(argv: list[str]) -> tuple[str | None, Options, bool]:
+    if len(argv) <= 1 and not any(arg.startswith("-") for arg in argv):
+        return (argv[0] if argv else None), DEFAULT_OPTIONS, False
+
+    arg_parser = argument_parser()
+    args = arg_parser.parse_args(argv)
+    if args.profile and args.engine != "interpreter":
+        arg_parser.error("--profile requires --engine interpreter")
+    if args.profile_output is not None and not args.profile:
+        arg_parser.error("--profile-output requires --profile")
+    if args.cache and (args.pipeline or args.scanner == "stream"):
+        arg_parser.error("--cache can't be used with --pipeline or --scanner stream")
+    if args.script is None:
+        # the prompt runs every line on a LoxSession, which has its own scanner
+        # and parser and no cache
+        unsupported = [
+            option
+            for option, given in [
+                ("--scanner", args.scanner is not None),
+                ("--parser", args.parser is not None),
+                ("--pipeline", args.pipeline),
+                ("--cache", args.cache),
+                ("--profile", args.profile),
+                ("--buffered-output", args.buffered_output),
+            ]
+            if given
+        ]
+        if unsupported:
+            arg_parser.error(f"{', '.join(unsupported)} can't be used without a script")
+    options = Options(
+        engine=args.engine,
+        scanner=args.scanner or DEFAULT_OPTIONS.scanner,
+        parser=args.parser or DEFAULT_OPTIONS.parser,
+        pipeline=args.pipeline,
+        cache=args.cache,
+        optimize=args.optimize,
+        profile=(args.profile_output or PROFILE_OUTPUT) if args.profile else None,
+        buffered=args.buffered_output,
+    )
+    return args.script, options, args.stats
+
+
+def main(argv: list[str]):
+    script, options, stats = parse_args(argv)
+
+    if stats:
+        import atexit
+
+        from src.instrumentation import StatsCollector
+
+        collector = StatsCollector()
+        instrumentation.subscribe(collector)
+        instrumentation.trace_memory = True
+        atexit.register(lambda: print(collector.summary(), file=sys.stderr))
+
+    if script:
+        run_file(script, options)
     else:
-        run_prompt()
+        run_prompt(options)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
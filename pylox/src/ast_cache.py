@@ -0,0 +1,177 @@
+import hashlib
+import marshal
+import os
+import sys
+
+from . import expr, stmt
+from .expr import Assign, Binary, Grouping, Literal, Unary, Variable
+from .stmt import Expression, Print, Var, Block
+from .token_type import TOKEN_TYPES
+from .tokens import Token
+
+# bump whenever the encoding or the AST changes, old entries then stop matching
+FORMAT_VERSION = 2
+VERSION = f"pylox-ast-{FORMAT_VERSION}-py{sys.version_info[0]}.{sys.version_info[1]}"
+
+CACHE_DIR = "__loxcache__"
+SUFFIX = ".loxc"
+DEFAULT_MAX_BYTES = 64 * 2**20
+
+_TOKEN_TYPES = {token_type.value: token_type for token_type in TOKEN_TYPES}
+
+
+# On-disk cache of parsed programs, similar to __pycache__. Entries are keyed by
+# a hash of the source and VERSION, so editing a script or upgrading pylox
+# simply misses. Statements are stored as a flat tuple of records of plain
+# values (see _encode) serialized with marshal. When the directory grows over max_bytes the least
+# recently used entries are evicted.
+class AstCache:
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def load(self, source: str):
+        path = self._path(source)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+            statements = _decode(marshal.loads(data))
+        except OSError:
+            # missing, or not readable (then it's never written either)
+            return None
+        except (EOFError, ValueError, TypeError, KeyError, IndexError):
+            # truncated or otherwise unreadable entry, drop it and reparse
+            self._remove(path)
+            return None
+        # mtime is used as the last access time for eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return statements
+
+    # like __pycache__, a directory that can't be written is silently skipped
+    def store(self, source: str, statements: list):
+        data = marshal.dumps(_encode(statements))
+        path = self._path(source)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temporary, "wb") as file:
+                file.write(data)
+            os.replace(temporary, path)
+            self.evict()
+        except OSError:
+            self._remove(temporary)
+
+    def evict(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(SUFFIX):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def _path(self, source: str) -> str:
+        key = hashlib.sha256(VERSION.encode())
+        key.update(source.encode())
+        return os.path.join(self.directory, key.hexdigest() + SUFFIX)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _encode_token(token: Token):
+    return token.type.value, token.lexeme, token.literal, token.line
+
+
+def _decode_token(encoded) -> Token:
+    return Token(_TOKEN_TYPES[encoded[0]], encoded[1], encoded[2], encoded[3])
+
+
+# Programs are stored flat, as a tuple of one record per node in post order: a
+# node's children come right before it and decoding rebuilds the tree on a
+# stack. Both directions walk from explicit stacks, and marshal never sees
+# nesting deeper than a token, so a program nested any depth can be cached.
+def _encode(statements: list) -> tuple:
+    records: list[tuple] = []
+    emit = records.append
+    # nodes are visited parent first with their last child first, the reverse
+    # of that is the post order
+    work = list(statements)
+    push = work.append
+    while work:
+        node = work.pop()
+        kind = node.kind
+        if kind == expr.BINARY:
+            emit((kind, _encode_token(node.operator)))
+            push(node.left)
+            push(node.right)
+        elif kind == expr.LITERAL:
+            emit((kind, node.value))
+        elif kind == expr.VARIABLE:
+            emit((kind, _encode_token(node.name)))
+        elif kind == expr.ASSIGN:
+            emit((kind, _encode_token(node.name)))
+            push(node.value)
+        elif kind == expr.UNARY:
+            emit((kind, _encode_token(node.operator)))
+            push(node.right)
+        elif kind in (expr.GROUPING, stmt.EXPRESSION, stmt.PRINT):
+            emit((kind,))
+            push(node.expression)
+        elif kind == stmt.VAR:
+            emit((kind, _encode_token(node.name), node.initializer is not None))
+            if node.initializer is not None:
+                push(node.initializer)
+        elif kind == stmt.BLOCK:
+            emit((kind, len(node.statements)))
+            work.extend(node.statements)
+    records.reverse()
+    return tuple(records)
+
+
+def _decode(records) -> list:
+    nodes: list = []
+    push = nodes.append
+    pop = nodes.pop
+    for record in records:
+        kind = record[0]
+        if kind == expr.BINARY:
+            right = pop()
+            push(Binary(pop(), _decode_token(record[1]), right))
+        elif kind == expr.LITERAL:
+            push(Literal(record[1]))
+        elif kind == expr.VARIABLE:
+            push(Variable(_decode_token(record[1])))
+        elif kind == expr.ASSIGN:
+            push(Assign(_decode_token(record[1]), pop()))
+        elif kind == expr.UNARY:
+            push(Unary(_decode_token(record[1]), pop()))
+        elif kind == expr.GROUPING:
+            push(Grouping(pop()))
+        elif kind == stmt.EXPRESSION:
+            push(Expression(pop()))
+        elif kind == stmt.PRINT:
+            push(Print(pop()))
+        elif kind == stmt.VAR:
+            push(Var(_decode_token(record[1]), pop() if record[2] else None))
+        elif kind == stmt.BLOCK:
+            count = record[1]
+            children = nodes[len(nodes) - count :]
+            del nodes[len(nodes) - count :]
+            push(Block(children))
+        else:
+            raise ValueError(f"unknown node kind {kind}")
+    # what is left are the top level statements
+    return nodes
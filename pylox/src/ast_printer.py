@@ -1,4 +1,4 @@
-from .expr import Unary, Literal, Grouping, Binary
+from .expr import Unary, Literal, Grouping, Binary, Variable, Assign
 
 
 class AstPrinter:
@@ -25,7 +25,15 @@ class AstPrinter:
     def visit_literal_expr(self, expr: Literal):
         if expr.value is None:
             return None
+        if isinstance(expr.value, float) and expr.value.is_integer():
+            return int(expr.value)
         return expr.value
 
     def visit_unary_expr(self, expr: Unary):
         return self.parenthesize(expr.operator.lexeme, expr.right)
+
+    def visit_variable_expr(self, expr: Variable):
+        return expr.name.lexeme
+
+    def visit_assign_expr(self, expr: Assign):
+        return self.parenthesize(f"= {expr.name.lexeme}", expr.value)
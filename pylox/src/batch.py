@@ -0,0 +1,48 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable
+
+from .session import ExecutionResult, LoxError, LoxSession
+
+MODES = ("process", "thread")
+
+
+# runs one script in a fresh session, so no state is shared with other scripts.
+# Lox errors are already in the result; a failure of pylox itself is reported
+# as an "internal" error of that script instead of ending the whole batch.
+def run_script(source: str) -> ExecutionResult:
+    try:
+        return LoxSession(cache_size=0).execute(source)
+    except Exception as err:
+        message = f"{type(err).__name__}: {err}"
+        return ExecutionResult(errors=[LoxError("internal", 0, message)])
+
+
+# Runs many independent scripts concurrently, each in its own LoxSession, and
+# returns their ExecutionResults in order. Sessions never print and collect
+# their own errors, so scripts can't see each other's output or globals.
+# Threads all share the GIL and only help when scripts are mixed with other
+# I/O; processes are what scales across cores.
+class BatchExecutor:
+    def __init__(
+        self, workers: int | None = None, mode: str = "process", chunksize: int = 16
+    ):
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}, not {mode!r}")
+        self.chunksize = chunksize
+        self._pool: Executor
+        if mode == "process":
+            self._pool = ProcessPoolExecutor(workers)
+        else:
+            self._pool = ThreadPoolExecutor(workers)
+
+    def run(self, sources: Iterable[str]) -> list[ExecutionResult]:
+        return list(self._pool.map(run_script, sources, chunksize=self.chunksize))
+
+    def close(self):
+        self._pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
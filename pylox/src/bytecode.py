@@ -0,0 +1,101 @@
+from array import array
+
+from .tokens import Token
+
+# Instruction set of the bytecode VM. Every opcode is one byte, instructions
+# marked with an operand are followed by a 2 byte big-endian index.
+OP_CONSTANT = 0  # operand: constant index
+OP_NIL = 1
+OP_TRUE = 2
+OP_FALSE = 3
+OP_POP = 4
+OP_POPN = 5  # operand: number of values to pop
+OP_DEFINE_GLOBAL = 6  # operand: constant index of the name
+OP_GET_GLOBAL = 7  # operand: constant index of the name
+OP_SET_GLOBAL = 8  # operand: constant index of the name
+OP_GET_LOCAL = 9  # operand: stack slot
+OP_SET_LOCAL = 10  # operand: stack slot
+OP_ADD = 11
+OP_SUBTRACT = 12
+OP_MULTIPLY = 13
+OP_DIVIDE = 14
+OP_GREATER = 15
+OP_GREATER_EQUAL = 16
+OP_LESS = 17
+OP_LESS_EQUAL = 18
+OP_EQUAL = 19
+OP_NOT_EQUAL = 20
+OP_NEGATE = 21
+OP_NOT = 22
+OP_PRINT = 23
+OP_RETURN = 24
+
+OPCODE_NAMES = {
+    value: name
+    for name, value in globals().items()
+    if name.startswith("OP_") and isinstance(value, int)
+}
+
+WITH_OPERAND = {
+    OP_CONSTANT,
+    OP_POPN,
+    OP_DEFINE_GLOBAL,
+    OP_GET_GLOBAL,
+    OP_SET_GLOBAL,
+    OP_GET_LOCAL,
+    OP_SET_LOCAL,
+}
+
+MAX_OPERAND = 0xFFFF
+
+
+class Chunk:
+    def __init__(self):
+        self.code = array("B")
+        self.constants = []
+        # token of every instruction that can fail, keyed by its offset, so
+        # runtime errors report the same line as the tree-walking interpreter
+        self.tokens: dict[int, Token] = dict()
+        self._constant_index = dict()
+
+    def write(
+        self, opcode: int, operand: int | None = None, token: Token | None = None
+    ):
+        if token is not None:
+            self.tokens[len(self.code)] = token
+        self.code.append(opcode)
+        if operand is not None:
+            self.code.append(operand >> 8)
+            self.code.append(operand & 0xFF)
+
+    # constants are deduplicated, the type is part of the key so that 1.0 and
+    # true don't share an entry
+    def add_constant(self, value) -> int:
+        key = (type(value), value)
+        index = self._constant_index.get(key)
+        if index is None:
+            index = self._constant_index[key] = len(self.constants)
+            self.constants.append(value)
+        return index
+
+
+def disassemble(chunk: Chunk) -> list[str]:
+    lines = []
+    code = chunk.code
+    offset = 0
+    while offset < len(code):
+        opcode = code[offset]
+        name = OPCODE_NAMES[opcode]
+        if opcode in WITH_OPERAND:
+            operand = code[offset + 1] << 8 | code[offset + 2]
+            if opcode in (OP_CONSTANT, OP_DEFINE_GLOBAL, OP_GET_GLOBAL, OP_SET_GLOBAL):
+                lines.append(
+                    f"{offset:04} {name} {operand} ({chunk.constants[operand]!r})"
+                )
+            else:
+                lines.append(f"{offset:04} {name} {operand}")
+            offset += 3
+        else:
+            lines.append(f"{offset:04} {name}")
+            offset += 1
+    return lines
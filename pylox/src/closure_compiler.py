@@ -0,0 +1,238 @@
+from .environment import Environment
+from .errors import PyloxRuntimeError, ErrorReporter
+from .expr import Assign, Binary, Grouping, Literal, Unary, Variable
+from .runtime import (
+    checked_divide,
+    is_equal,
+    is_truthy,
+    stringify,
+    validate_number,
+    validate_plus,
+)
+from .stmt import Expression, Print, Var, Block
+from .token_type import TokenType
+
+# only for type checkers, like in interpreter.py
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .output import OutputSink
+
+
+# Alternative execution engine: the tree is walked once to build nested Python
+# closures, each taking the current Environment. Operators and variable
+# accesses are specialized at compile time, so running the program does no
+# visitor dispatch and no matching on token types.
+class ClosureCompiler:
+    def __init__(self, err_reporter: ErrorReporter, output: "OutputSink | None" = None):
+        self.err_reporter = err_reporter
+        self.output = output
+        self.globals = Environment()
+
+    def compile(self, statements: list) -> list:
+        return [stmt.accept(self) for stmt in statements]
+
+    def interpret(self, statements: list):
+        self.run(self.compile(statements))
+
+    def run(self, program: list):
+        env = self.globals
+        try:
+            for stmt in program:
+                stmt(env)
+        except PyloxRuntimeError as err:
+            if self.output is not None:
+                self.output.flush()
+            self.err_reporter.runtime_error(err)
+
+    def visit_binary_expr(self, expr: Binary):
+        left = expr.left.accept(self)
+        right = expr.right.accept(self)
+        operator = expr.operator
+
+        match operator.type:
+            case TokenType.PLUS:
+
+                def add(env):
+                    lv, rv = left(env), right(env)
+                    if type(lv) is float and type(rv) is float:
+                        return lv + rv
+                    return validate_plus(operator, lv, rv)
+
+                return add
+            case TokenType.MINUS:
+
+                def subtract(env):
+                    lv, rv = left(env), right(env)
+                    if type(lv) is float and type(rv) is float:
+                        return lv - rv
+                    validate_number(operator, lv, rv)
+                    return float(lv) - float(rv)
+
+                return subtract
+            case TokenType.STAR:
+
+                def multiply(env):
+                    lv, rv = left(env), right(env)
+                    if type(lv) is float and type(rv) is float:
+                        return lv * rv
+                    validate_number(operator, lv, rv)
+                    return float(lv) * float(rv)
+
+                return multiply
+            case TokenType.SLASH:
+
+                def divide(env):
+                    lv, rv = left(env), right(env)
+                    if type(lv) is float and type(rv) is float and rv:
+                        return lv / rv
+                    validate_number(operator, lv, rv)
+                    return checked_divide(operator, float(lv), float(rv))
+
+                return divide
+            case TokenType.GREATER:
+
+                def greater(env):
+                    lv, rv = left(env), right(env)
+                    if type(lv) is float and type(rv) is float:
+                        return lv > rv
+                    validate_number(operator, lv, rv)
+                    return float(lv) > float(rv)
+
+                return greater
+            case TokenType.GREATER_EQUAL:
+
+                def greater_equal(env):
+                    lv, rv = left(env), right(env)
+                    if type(lv) is float and type(rv) is float:
+                        return lv >= rv
+                    validate_number(operator, lv, rv)
+                    return float(lv) >= float(rv)
+
+                return greater_equal
+            case TokenType.LESS:
+
+                def less(env):
+                    lv, rv = left(env), right(env)
+                    if type(lv) is float and type(rv) is float:
+                        return lv < rv
+                    validate_number(operator, lv, rv)
+                    return float(lv) < float(rv)
+
+                return less
+            case TokenType.LESS_EQUAL:
+
+                def less_equal(env):
+                    lv, rv = left(env), right(env)
+                    if type(lv) is float and type(rv) is float:
+                        return lv <= rv
+                    validate_number(operator, lv, rv)
+                    return float(lv) <= float(rv)
+
+                return less_equal
+            case TokenType.EQUAL_EQUAL:
+                return lambda env: is_equal(left(env), right(env))
+            case TokenType.BANG_EQUAL:
+                return lambda env: not is_equal(left(env), right(env))
+            case _:
+                return lambda env: None
+
+    # groupings only matter to the parser, there is nothing left to run
+    def visit_grouping_expr(self, expr: Grouping):
+        return expr.expression.accept(self)
+
+    def visit_literal_expr(self, expr: Literal):
+        value = expr.value
+        return lambda env: value
+
+    def visit_unary_expr(self, expr: Unary):
+        right = expr.right.accept(self)
+        operator = expr.operator
+
+        match operator.type:
+            case TokenType.MINUS:
+
+                def negate(env):
+                    value = right(env)
+                    if type(value) is float:
+                        return -value
+                    validate_number(operator, value)
+                    return -float(value)
+
+                return negate
+            case TokenType.BANG:
+                return lambda env: not is_truthy(right(env))
+            case _:
+                return lambda env: None
+
+    def visit_variable_expr(self, expr: Variable):
+        name, depth, slot = expr.name, expr.depth, expr.slot
+        if depth is None:
+            return lambda env: env.get(name)
+        if depth == 0:
+            return lambda env: env.slots[slot]
+        if depth == 1:
+            return lambda env: env.enclosing.slots[slot]
+        return lambda env: env.get_at(depth, slot)
+
+    def visit_assign_expr(self, expr: Assign):
+        value = expr.value.accept(self)
+        name, depth, slot = expr.name, expr.depth, expr.slot
+
+        if depth is None:
+
+            def assign(env):
+                result = value(env)
+                env.assign(name, result)
+                return result
+
+        elif depth == 0:
+
+            def assign(env):
+                result = env.slots[slot] = value(env)
+                return result
+
+        else:
+
+            def assign(env):
+                result = value(env)
+                env.assign_at(depth, slot, result)
+                return result
+
+        return assign
+
+    def visit_expression_stmt(self, stmt: Expression):
+        return stmt.expression.accept(self)
+
+    def visit_print_stmt(self, stmt: Print):
+        value = stmt.expression.accept(self)
+        if self.output is None:
+            return lambda env: print(stringify(value(env)))
+        write = self.output.write
+        return lambda env: write(stringify(value(env)))
+
+    def visit_var_stmt(self, stmt: Var):
+        value = stmt.initializer.accept(self) if stmt.initializer else None
+        name, slot = stmt.name.lexeme, stmt.slot
+
+        if slot is None:
+
+            def define(env):
+                env.define(name, value(env) if value else None)
+
+        else:
+
+            def define(env):
+                env.slots[slot] = value(env) if value else None
+
+        return define
+
+    def visit_block_stmt(self, stmt: Block):
+        body = self.compile(stmt.statements)
+        size = stmt.slot_count or 0
+
+        def block(env):
+            block_env = Environment(env, size)
+            for run in body:
+                run(block_env)
+
+        return block
@@ -0,0 +1,181 @@
+from .bytecode import (
+    MAX_OPERAND,
+    OP_ADD,
+    OP_CONSTANT,
+    OP_DEFINE_GLOBAL,
+    OP_DIVIDE,
+    OP_EQUAL,
+    OP_FALSE,
+    OP_GET_GLOBAL,
+    OP_GET_LOCAL,
+    OP_GREATER,
+    OP_GREATER_EQUAL,
+    OP_LESS,
+    OP_LESS_EQUAL,
+    OP_MULTIPLY,
+    OP_NEGATE,
+    OP_NIL,
+    OP_NOT,
+    OP_NOT_EQUAL,
+    OP_POP,
+    OP_POPN,
+    OP_PRINT,
+    OP_RETURN,
+    OP_SET_GLOBAL,
+    OP_SET_LOCAL,
+    OP_SUBTRACT,
+    OP_TRUE,
+    Chunk,
+)
+from .errors import ErrorReporter
+from .expr import Assign, Binary, Grouping, Literal, Unary, Variable
+from .stmt import Expression, Print, Var, Block
+from .token_type import TokenType
+from .tokens import Token
+
+_BINARY_OPCODES = {
+    TokenType.PLUS: OP_ADD,
+    TokenType.MINUS: OP_SUBTRACT,
+    TokenType.STAR: OP_MULTIPLY,
+    TokenType.SLASH: OP_DIVIDE,
+    TokenType.GREATER: OP_GREATER,
+    TokenType.GREATER_EQUAL: OP_GREATER_EQUAL,
+    TokenType.LESS: OP_LESS,
+    TokenType.LESS_EQUAL: OP_LESS_EQUAL,
+    TokenType.EQUAL_EQUAL: OP_EQUAL,
+    TokenType.BANG_EQUAL: OP_NOT_EQUAL,
+}
+
+
+class CompileError(Exception):
+    pass
+
+
+# Compiles Stmt/Expr trees to a Chunk for the VM. Locals live on the VM's value
+# stack: the compiler tracks the stack slot of every local itself, pushing the
+# initializer of a `var` leaves the value in its slot and leaving a block pops
+# all of its locals at once.
+class Compiler:
+    def __init__(self, err_reporter: ErrorReporter):
+        self.err_reporter = err_reporter
+        self.chunk = Chunk()
+        self.scopes: list[dict[str, int]] = []
+        self.local_count = 0
+
+    def compile(self, statements: list):
+        try:
+            for stmt in statements:
+                stmt.accept(self)
+        except CompileError:
+            return None
+        self.chunk.write(OP_RETURN)
+        return self.chunk
+
+    def visit_block_stmt(self, stmt: Block):
+        self.scopes.append(dict())
+        for s in stmt.statements:
+            s.accept(self)
+        scope = self.scopes.pop()
+        if scope:
+            self.chunk.write(OP_POPN, len(scope))
+            self.local_count -= len(scope)
+
+    def visit_expression_stmt(self, stmt: Expression):
+        stmt.expression.accept(self)
+        self.chunk.write(OP_POP)
+
+    def visit_print_stmt(self, stmt: Print):
+        stmt.expression.accept(self)
+        self.chunk.write(OP_PRINT)
+
+    def visit_var_stmt(self, stmt: Var):
+        # the initializer is compiled before the name is declared so that
+        # `var a = a;` reads the enclosing `a`, same as the interpreter
+        if stmt.initializer:
+            stmt.initializer.accept(self)
+        else:
+            self.chunk.write(OP_NIL)
+
+        if not self.scopes:
+            name = self._constant(stmt.name, stmt.name.lexeme)
+            self.chunk.write(OP_DEFINE_GLOBAL, name)
+            return
+
+        scope = self.scopes[-1]
+        if stmt.name.lexeme in scope:
+            # redeclaring a local in the same scope just overwrites its slot
+            self.chunk.write(OP_SET_LOCAL, scope[stmt.name.lexeme])
+            self.chunk.write(OP_POP)
+            return
+        if self.local_count > MAX_OPERAND:
+            self._error(stmt.name, "Too many local variables.")
+        scope[stmt.name.lexeme] = self.local_count
+        self.local_count += 1
+
+    def visit_assign_expr(self, expr: Assign):
+        expr.value.accept(self)
+        slot = self._resolve_local(expr.name)
+        if slot is None:
+            name = self._constant(expr.name, expr.name.lexeme)
+            self.chunk.write(OP_SET_GLOBAL, name, expr.name)
+        else:
+            self.chunk.write(OP_SET_LOCAL, slot)
+
+    def visit_binary_expr(self, expr: Binary):
+        expr.left.accept(self)
+        expr.right.accept(self)
+        opcode = _BINARY_OPCODES.get(expr.operator.type)
+        if opcode is None:
+            # mirrors the interpreter, which evaluates both sides and yields nil
+            self.chunk.write(OP_POPN, 2)
+            self.chunk.write(OP_NIL)
+        else:
+            self.chunk.write(opcode, token=expr.operator)
+
+    def visit_grouping_expr(self, expr: Grouping):
+        expr.expression.accept(self)
+
+    def visit_literal_expr(self, expr: Literal):
+        if expr.value is None:
+            self.chunk.write(OP_NIL)
+        elif expr.value is True:
+            self.chunk.write(OP_TRUE)
+        elif expr.value is False:
+            self.chunk.write(OP_FALSE)
+        else:
+            self.chunk.write(OP_CONSTANT, self._constant(None, expr.value))
+
+    def visit_unary_expr(self, expr: Unary):
+        expr.right.accept(self)
+        match expr.operator.type:
+            case TokenType.MINUS:
+                self.chunk.write(OP_NEGATE, token=expr.operator)
+            case TokenType.BANG:
+                self.chunk.write(OP_NOT)
+            case _:
+                self.chunk.write(OP_POP)
+                self.chunk.write(OP_NIL)
+
+    def visit_variable_expr(self, expr: Variable):
+        slot = self._resolve_local(expr.name)
+        if slot is None:
+            name = self._constant(expr.name, expr.name.lexeme)
+            self.chunk.write(OP_GET_GLOBAL, name, expr.name)
+        else:
+            self.chunk.write(OP_GET_LOCAL, slot)
+
+    def _resolve_local(self, name: Token):
+        for scope in reversed(self.scopes):
+            if (slot := scope.get(name.lexeme)) is not None:
+                return slot
+        return None
+
+    def _constant(self, token: Token | None, value) -> int:
+        index = self.chunk.add_constant(value)
+        if index > MAX_OPERAND:
+            self._error(token, "Too many constants in one chunk.")
+        return index
+
+    def _error(self, token: Token | None, message: str):
+        self.err_reporter.error(token.line if token else 0, message)
+        raise CompileError()
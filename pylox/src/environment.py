@@ -3,21 +3,46 @@ from .tokens import Token
 
 
 class Environment:
-    def __init__(self, enclosing=None):
+    def __init__(self, enclosing: "Environment | None" = None, size: int = 0):
         self.enclosing = enclosing
-        self._values = dict()
+        self._values: dict[str, object] = dict()
+        # locals resolved by the Resolver live in fixed slots instead of _values
+        self.slots = [None] * size
 
     def define(self, identifier: str, value):
         self._values[identifier] = value
 
     def get(self, name: Token):
-        if name.lexeme in self._values:
-            return self._values[name.lexeme]
-        elif self.enclosing is not None:
-            return self.enclosing.get(name)
-        else:
-            raise PyloxRuntimeError(name, f"Undefined variable {name.lexeme}.")
+        env: Environment | None = self
+        while env is not None:
+            if name.lexeme in env._values:
+                return env._values[name.lexeme]
+            env = env.enclosing
+        raise PyloxRuntimeError(name, f"Undefined variable {name.lexeme}.")
 
     def assign(self, name: Token, value):
-        self.get(name)
-        self.define(name.lexeme, value)
+        env: Environment | None = self
+        while env is not None:
+            if name.lexeme in env._values:
+                env._values[name.lexeme] = value
+                return
+            env = env.enclosing
+        raise PyloxRuntimeError(name, f"Undefined variable {name.lexeme}.")
+
+    def define_at(self, slot: int, value):
+        self.slots[slot] = value
+
+    def get_at(self, depth: int, slot: int):
+        return self._ancestor(depth).slots[slot]
+
+    def assign_at(self, depth: int, slot: int, value):
+        self._ancestor(depth).slots[slot] = value
+
+    # the Resolver only hands out depths of scopes that exist
+    def _ancestor(self, depth: int) -> "Environment":
+        env = self
+        for _ in range(depth):
+            enclosing = env.enclosing
+            assert enclosing is not None
+            env = enclosing
+        return env
@@ -1,9 +1,20 @@
+ASSIGN = 0
+BINARY = 1
+GROUPING = 2
+LITERAL = 3
+UNARY = 4
+VARIABLE = 5
 
 
 class Assign:
+    __slots__ = ("name", "value", "depth", "slot",)
+    kind = ASSIGN
+
     def __init__(self, name, value):
         self.name = name
         self.value = value
+        self.depth = None
+        self.slot = None
 
     def accept(self, visitor):
         return visitor.visit_assign_expr(self)
@@ -14,7 +25,14 @@ class Assign:
             self.value == other.value 
         )
 
+    def __repr__(self):
+        return f"Assign(name={self.name!r}, value={self.value!r})"
+
+
 class Binary:
+    __slots__ = ("left", "operator", "right",)
+    kind = BINARY
+
     def __init__(self, left, operator, right):
         self.left = left
         self.operator = operator
@@ -30,7 +48,14 @@ class Binary:
             self.right == other.right 
         )
 
+    def __repr__(self):
+        return f"Binary(left={self.left!r}, operator={self.operator!r}, right={self.right!r})"
+
+
 class Grouping:
+    __slots__ = ("expression",)
+    kind = GROUPING
+
     def __init__(self, expression):
         self.expression = expression
 
@@ -42,7 +67,14 @@ class Grouping:
             self.expression == other.expression 
         )
 
+    def __repr__(self):
+        return f"Grouping(expression={self.expression!r})"
+
+
 class Literal:
+    __slots__ = ("value",)
+    kind = LITERAL
+
     def __init__(self, value):
         self.value = value
 
@@ -54,7 +86,14 @@ class Literal:
             self.value == other.value 
         )
 
+    def __repr__(self):
+        return f"Literal(value={self.value!r})"
+
+
 class Unary:
+    __slots__ = ("operator", "right",)
+    kind = UNARY
+
     def __init__(self, operator, right):
         self.operator = operator
         self.right = right
@@ -68,9 +107,18 @@ class Unary:
             self.right == other.right 
         )
 
+    def __repr__(self):
+        return f"Unary(operator={self.operator!r}, right={self.right!r})"
+
+
 class Variable:
+    __slots__ = ("name", "depth", "slot",)
+    kind = VARIABLE
+
     def __init__(self, name):
         self.name = name
+        self.depth = None
+        self.slot = None
 
     def accept(self, visitor):
         return visitor.visit_variable_expr(self)
@@ -78,4 +126,8 @@ class Variable:
     def __eq__(self, other):
         return (
             self.name == other.name 
-        )
\ No newline at end of file
+        )
+
+    def __repr__(self):
+        return f"Variable(name={self.name!r})"
+
@@ -0,0 +1,113 @@
+import re
+from typing import Callable, Iterable, Iterator
+
+from .errors import ErrorReporter
+from .intern import InternTable
+from .token_type import KEYWORDS, TokenType
+from .tokens import Token
+
+# One alternative per lexical class, tried in order. Whitespace, comments,
+# identifiers and numbers are consumed as whole runs by the regex engine
+# instead of one advance()/peek() call per character.
+TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<whitespace>[ \r\t]+)
+    |(?P<newline>\n)
+    |(?P<comment>//[^\n]*)
+    |(?P<identifier>[A-Za-z_][A-Za-z0-9_]*)
+    |(?P<number>[0-9]+(?:\.[0-9]+)?)
+    |(?P<string>"[^"]*"?)
+    |(?P<operator>[!=<>]=?|[(){},.\-+;*/])
+    |(?P<unexpected>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+OPERATORS = {
+    "(": TokenType.LEFT_PAREN,
+    ")": TokenType.RIGHT_PAREN,
+    "{": TokenType.LEFT_BRACE,
+    "}": TokenType.RIGHT_BRACE,
+    ",": TokenType.COMMA,
+    ".": TokenType.DOT,
+    "-": TokenType.MINUS,
+    "+": TokenType.PLUS,
+    ";": TokenType.SEMICOLON,
+    "*": TokenType.STAR,
+    "/": TokenType.SLASH,
+    "=": TokenType.EQUAL,
+    "==": TokenType.EQUAL_EQUAL,
+    "!": TokenType.BANG,
+    "!=": TokenType.BANG_EQUAL,
+    ">": TokenType.GREATER,
+    ">=": TokenType.GREATER_EQUAL,
+    "<": TokenType.LESS,
+    "<=": TokenType.LESS_EQUAL,
+}
+
+
+# Turns TOKEN_PATTERN matches into Tokens. The matches may come from a single
+# source string or from a stream read in chunks (see stream_scanner.py).
+# Identifiers and strings are interned in the given table, if any. A table
+# keeps every distinct string it's seen, which would grow without bound over
+# a stream, so scan_stream doesn't intern unless it's given one.
+def tokenize(
+    matches: Iterable[re.Match],
+    error_reporter: ErrorReporter,
+    line: int = 1,
+    interner: InternTable | None = None,
+) -> Iterator[Token]:
+    keyword = KEYWORDS.get
+    # str() returns a str unchanged
+    intern: Callable[[str], str] = str
+    if interner is not None:
+        intern = interner.intern
+
+    for match in matches:
+        kind = match.lastgroup
+        if kind == "whitespace" or kind == "comment":
+            continue
+        text = match.group()
+        if kind == "operator":
+            yield Token(OPERATORS[text], text, None, line)
+        elif kind == "identifier":
+            text = intern(text)
+            yield Token(keyword(text, TokenType.IDENTIFIER), text, text, line)
+        elif kind == "newline":
+            line += 1
+        elif kind == "number":
+            yield Token(TokenType.NUMBER, text, float(text), line)
+        elif kind == "string":
+            line += text.count("\n")
+            if len(text) > 1 and text[-1] == '"':
+                yield Token(TokenType.STRING, intern(text), intern(text[1:-1]), line)
+            else:
+                error_reporter.error(line, "Unterminated string")
+        else:
+            error_reporter.error(line, "Unexpected character")
+
+    yield Token(TokenType.EOF, "", None, line)
+
+
+# Drop-in replacement for Scanner driven by a single compiled regex. It
+# produces the same tokens, line numbers and errors as Scanner.
+class FastScanner:
+    def __init__(
+        self,
+        source: str,
+        error_reporter: ErrorReporter,
+        interner: InternTable | None = None,
+    ):
+        self.source = source
+        self.error_reporter: ErrorReporter = error_reporter
+        self.interner = interner if interner is not None else InternTable()
+        self.tokens: list[Token] = []
+        self.line: int = 1
+
+    def scan_tokens(self) -> list[Token]:
+        matches = TOKEN_PATTERN.finditer(self.source)
+        self.tokens.extend(
+            tokenize(matches, self.error_reporter, self.line, self.interner)
+        )
+        self.line = self.tokens[-1].line
+        return self.tokens
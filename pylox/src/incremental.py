@@ -0,0 +1,321 @@
+from bisect import bisect_left
+from dataclasses import dataclass
+
+from .errors import ErrorReporter
+from .fast_scanner import TOKEN_PATTERN, tokenize
+from .intern import InternTable
+from .parser import PrattParser
+from .resolver import Resolver
+from .session import CollectingErrorReporter, LoxError
+from .token_type import TokenType
+from .tokens import Token
+
+
+@dataclass(frozen=True)
+class EditStats:
+    # tokens produced by re-scanning and top level declarations re-parsed
+    scanned: int
+    parsed: int
+
+
+# Records scan errors with the offset of the match that caused them
+class _ScanErrors(ErrorReporter):
+    def __init__(self):
+        super().__init__()
+        self.offset = 0
+        self.errors: list[tuple[int, int, str]] = []
+
+    def error(self, line: int, message: str):
+        self.errors.append((self.offset, line, message))
+
+
+# Records parse errors with the Token they were reported at
+class _ParseErrors(ErrorReporter):
+    def __init__(self):
+        super().__init__()
+        self.errors: list[tuple[Token, str]] = []
+
+    def parse_error(self, token: Token, message: str):
+        self.errors.append((token, message))
+
+
+# Source kept scanned, parsed and resolved across text edits, for editors and
+# watch modes re-checking a big script on every keystroke. edit() re-scans the
+# tokens from the one before the edit up to where the new tokens line up with
+# old ones again, then re-parses the top level declarations touching those
+# tokens up to where a declaration starts at an old declaration boundary. The
+# other tokens, declarations and their errors are reused.
+#
+# Tokens after an edit have moved by a number of characters, of tokens and of
+# lines. Rather than updating all of them on every edit, the values after a
+# "gap" index are stored stale by a pending shift, and only the entries between
+# the old and the new position of the gap are fixed when the next edit lands
+# elsewhere (a gap buffer, for offsets). Token lines are fixed in place, so the
+# Tokens in the tree get the right line too. Reading tokens or statements
+# settles everything.
+class IncrementalDocument:
+    def __init__(
+        self,
+        source: str = "",
+        parser=PrattParser,
+        interner: InternTable | None = None,
+    ):
+        self.parser = parser
+        self.interner = interner if interner is not None else InternTable()
+        self.source = ""
+
+        self._tokens: list[Token] = [Token(TokenType.EOF, "", None, 1)]
+        # source offset of every token, stale by _offset_shift from _gap on,
+        # where the lines of the tokens are stale by _line_shift
+        self._starts: list[int] = [0]
+        self._gap = 1
+        self._offset_shift = 0
+        self._line_shift = 0
+        # (offset, line, message) of the scan errors, by offset
+        self._scan_errors: list[tuple[int, int, str]] = []
+
+        self._statements: list = []
+        # index of the first token of every declaration, stale by _index_shift
+        # from _declaration_gap on
+        self._declaration_starts: list[int] = []
+        self._declaration_gap = 0
+        self._index_shift = 0
+        # (token index, message) of the parse errors, by token index
+        self._parse_errors: list[tuple[int, str]] = []
+
+        self.edit(0, 0, source)
+
+    @property
+    def tokens(self) -> list[Token]:
+        self._move_gap(len(self._tokens))
+        return self._tokens
+
+    @property
+    def statements(self) -> list:
+        self._move_gap(len(self._tokens))
+        return self._statements
+
+    @property
+    def had_error(self) -> bool:
+        return bool(self._scan_errors or self._parse_errors)
+
+    # errors of the whole document in the order a full scan and parse would
+    # report them
+    def errors(self) -> list[LoxError]:
+        reporter = CollectingErrorReporter()
+        for _, line, message in self._scan_errors:
+            reporter.error(line, message)
+        for index, message in self._parse_errors:
+            token = self._tokens[index]
+            line = self._line_at(index)
+            reporter.parse_error(
+                Token(token.type, token.lexeme, token.literal, line), message
+            )
+        return reporter.errors
+
+    # replaces `removed` characters at `offset` by `inserted`
+    def edit(self, offset: int, removed: int, inserted: str) -> EditStats:
+        if not 0 <= offset <= offset + removed <= len(self.source):
+            raise ValueError(f"edit {offset}+{removed} outside of the source")
+        old_end = offset + removed
+        offset_delta = len(inserted) - removed
+        line_delta = inserted.count("\n") - self.source.count("\n", offset, old_end)
+        self.source = self.source[:offset] + inserted + self.source[old_end:]
+
+        first, removed_tokens, scanned = self._rescan(
+            offset, old_end, offset_delta, line_delta
+        )
+        parsed = self._reparse(first, scanned, scanned - removed_tokens)
+        return EditStats(scanned, parsed)
+
+    # re-scans from the second last token starting before the edit (a token
+    # can merge with the two before it, `1.` and `5` make `1.5`) and replaces
+    # the old tokens up to the first one found again at the same place. Returns
+    # the index of the first new token, the number of old tokens replaced and
+    # the number of new ones.
+    def _rescan(self, offset: int, old_end: int, offset_delta: int, line_delta: int):
+        tokens, starts = self._tokens, self._starts
+        reused = self._count_before(offset)
+        self._move_gap(reused)
+        first = reused - 2
+        if first < 0:
+            first, position, line = 0, 0, 1
+        else:
+            token = tokens[first]
+            position = starts[first]
+            # a string's line is the one it ends on
+            line = token.line - token.lexeme.count("\n")
+
+        errors = _ScanErrors()
+        matches = self._matches(position, errors)
+        new_end = old_end + offset_delta
+        shift = self._offset_shift
+        new_tokens, new_starts = [], []
+        last = len(tokens) - 1
+        for token in tokenize(matches, errors, line, self.interner):
+            start = errors.offset
+            if start >= new_end:
+                # old tokens lie after the edit from here on, once one starts
+                # at the same place the rest is scanned the same
+                old = bisect_left(starts, start - offset_delta - shift, reused)
+                if old <= last and starts[old] + shift == start - offset_delta:
+                    break
+            new_tokens.append(token)
+            new_starts.append(start)
+        else:
+            old = last + 1
+
+        # in the old source, the scan errors up to there were found again
+        scan_end = (
+            starts[old] + shift if old <= last else len(self.source) - offset_delta
+        )
+        self._replace_scan_errors(
+            position, scan_end, errors.errors, offset_delta, line_delta
+        )
+
+        # the tokens before the edit usually come out the same, keeping them
+        # spares re-parsing the declaration they end
+        while (
+            first < min(reused, old) and new_tokens and new_tokens[0] == tokens[first]
+        ):
+            del new_tokens[0], new_starts[0]
+            first += 1
+
+        tokens[first:old] = new_tokens
+        starts[first:old] = new_starts
+        self._gap = first + len(new_tokens)
+        self._offset_shift += offset_delta
+        self._line_shift += line_delta
+        return first, old - first, len(new_tokens)
+
+    # TOKEN_PATTERN matches from position, leaving the offset of the one being
+    # tokenized in errors.offset (the EOF token is at the end of the source)
+    def _matches(self, position: int, errors: _ScanErrors):
+        for match in TOKEN_PATTERN.finditer(self.source, position):
+            errors.offset = match.start()
+            yield match
+        errors.offset = len(self.source)
+
+    def _replace_scan_errors(
+        self, position, scan_end, new_errors, offset_delta, line_delta
+    ):
+        kept_before = [e for e in self._scan_errors if e[0] < position]
+        kept_after = [
+            (offset + offset_delta, line + line_delta, message)
+            for offset, line, message in self._scan_errors
+            if offset >= scan_end
+        ]
+        self._scan_errors = kept_before + new_errors + kept_after
+
+    # re-parses the declarations touching the count new tokens from first,
+    # after which tokens moved by index_delta. Returns the number parsed.
+    def _reparse(self, first: int, count: int, index_delta: int) -> int:
+        starts = self._declaration_starts
+        declaration = max(self._count_declarations_before(first) - 1, 0)
+        self._move_declaration_gap(declaration)
+        shift = self._index_shift
+        last = len(starts) - 1
+
+        # a declaration is affected if its tokens, or the one following them
+        # (looked at to end it), were re-scanned
+        position = starts[declaration] + shift if declaration <= last else 0
+        errors = _ParseErrors()
+        parser = self.parser(errors, self._tokens)
+        parser.current = position
+        new_statements, new_starts, resolved = [], [], []
+        while True:
+            if position >= first + count:
+                old = bisect_left(starts, position - index_delta - shift, declaration)
+                if old <= last and starts[old] + shift == position - index_delta:
+                    break
+            if parser._is_at_end():
+                old = last + 1
+                break
+            new_starts.append(position)
+            reported = len(errors.errors)
+            stmt = parser._declaration()
+            new_statements.append(stmt)
+            # like the whole program, only declarations without errors are resolved
+            if stmt is not None and len(errors.errors) == reported:
+                resolved.append(stmt)
+            position = parser.current
+
+        # in the old tokens, the parse errors up to there were found again
+        old_position = (
+            starts[old] + shift if old <= last else len(self._tokens) - index_delta
+        )
+        start = new_starts[0] if new_starts else position
+        self._replace_parse_errors(
+            start, old_position, errors.errors, parser, index_delta
+        )
+
+        Resolver().resolve(resolved)
+        self._statements[declaration:old] = new_statements
+        starts[declaration:old] = new_starts
+        self._declaration_gap = declaration + len(new_statements)
+        self._index_shift += index_delta
+        return len(new_statements)
+
+    def _replace_parse_errors(
+        self, start, old_position, new_errors, parser, index_delta
+    ):
+        tokens = self._tokens
+        found = []
+        for token, message in new_errors:
+            # the Token is at or shortly before where the parser stopped
+            index = parser.current
+            while tokens[index] is not token:
+                index -= 1
+            found.append((index, message))
+        kept_before = [e for e in self._parse_errors if e[0] < start]
+        kept_after = [
+            (index + index_delta, message)
+            for index, message in self._parse_errors
+            if index >= old_position
+        ]
+        self._parse_errors = kept_before + found + kept_after
+
+    def _line_at(self, index: int) -> int:
+        line = self._tokens[index].line
+        return line + self._line_shift if index >= self._gap else line
+
+    # number of tokens starting before offset
+    def _count_before(self, offset: int) -> int:
+        starts, gap, shift = self._starts, self._gap, self._offset_shift
+        if gap < len(starts) and starts[gap] + shift < offset:
+            return bisect_left(starts, offset - shift, gap)
+        return bisect_left(starts, offset, 0, gap)
+
+    # number of declarations starting before token index
+    def _count_declarations_before(self, index: int) -> int:
+        starts, gap = self._declaration_starts, self._declaration_gap
+        shift = self._index_shift
+        if gap < len(starts) and starts[gap] + shift < index:
+            return bisect_left(starts, index - shift, gap)
+        return bisect_left(starts, index, 0, gap)
+
+    # settles the tokens before index and leaves the ones after it stale
+    def _move_gap(self, index: int):
+        tokens, starts = self._tokens, self._starts
+        shift, lines = self._offset_shift, self._line_shift
+        if index < self._gap:
+            shift, lines = -shift, -lines
+            changed = range(index, self._gap)
+        else:
+            changed = range(self._gap, index)
+        for i in changed:
+            starts[i] += shift
+        if lines:
+            for i in changed:
+                tokens[i].line += lines
+        self._gap = index
+
+    def _move_declaration_gap(self, index: int):
+        starts, shift = self._declaration_starts, self._index_shift
+        if index < self._declaration_gap:
+            for i in range(index, self._declaration_gap):
+                starts[i] -= shift
+        else:
+            for i in range(self._declaration_gap, index):
+                starts[i] += shift
+        self._declaration_gap = index
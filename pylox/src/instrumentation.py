@@ -0,0 +1,107 @@
+import time
+
+
+# main.py creates an Instrumentation on every start, so this module avoids
+# dataclasses, contextlib and typing, and only imports tracemalloc when memory
+# is traced
+class PhaseEvent:
+    __slots__ = ("phase", "count", "unit", "wall", "cpu", "peak_memory")
+
+    def __init__(self, phase: str):
+        self.phase = phase
+        # what the phase produced, tokens for "scan", AST nodes for "parse"...
+        self.count: int | None = None
+        self.unit = ""
+        self.wall = 0.0
+        self.cpu = 0.0
+        # highest traced memory during the phase, None unless memory is traced
+        self.peak_memory: int | None = None
+
+    def __repr__(self):
+        return (
+            f"PhaseEvent(phase={self.phase!r}, count={self.count!r}, "
+            f"unit={self.unit!r}, wall={self.wall!r}, cpu={self.cpu!r}, "
+            f"peak_memory={self.peak_memory!r})"
+        )
+
+
+# Reports every phase of a run (scan, parse, resolve, interpret...) to the
+# subscribed listeners. Nothing is measured while nobody listens: phase()
+# then yields None, which callers check before computing counts.
+class Instrumentation:
+    def __init__(self, trace_memory: bool = False):
+        # callables taking a PhaseEvent
+        self.listeners: list = []
+        # tracemalloc makes everything several times slower, so it is opt-in
+        self.trace_memory = trace_memory
+
+    def subscribe(self, listener):
+        self.listeners.append(listener)
+
+    def phase(self, name: str):
+        if not self.listeners:
+            return _UNMEASURED
+        return _Phase(self, name)
+
+
+class _Unmeasured:
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_UNMEASURED = _Unmeasured()
+
+
+# context manager measuring one phase, the event is reported even if the
+# phase raises
+class _Phase:
+    def __init__(self, instrumentation: Instrumentation, name: str):
+        self.instrumentation = instrumentation
+        self.event = PhaseEvent(name)
+
+    def __enter__(self) -> PhaseEvent:
+        if self.instrumentation.trace_memory:
+            import tracemalloc
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        self._wall, self._cpu = time.perf_counter(), time.process_time()
+        return self.event
+
+    def __exit__(self, *exc_info):
+        event = self.event
+        event.wall = time.perf_counter() - self._wall
+        event.cpu = time.process_time() - self._cpu
+        if self.instrumentation.trace_memory:
+            import tracemalloc
+
+            event.peak_memory = tracemalloc.get_traced_memory()[1]
+        for listener in self.instrumentation.listeners:
+            listener(event)
+        return False
+
+
+# Listener keeping every event, used by `main.py --stats`
+class StatsCollector:
+    def __init__(self):
+        self.events: list[PhaseEvent] = []
+
+    def __call__(self, event: PhaseEvent):
+        self.events.append(event)
+
+    def summary(self) -> str:
+        rows = [
+            f"{'phase':<10} {'count':>16} {'wall ms':>10} {'cpu ms':>10} {'peak KiB':>10}"
+        ]
+        for e in self.events:
+            count = f"{e.count} {e.unit}" if e.count is not None else ""
+            peak = f"{e.peak_memory / 1024:.1f}" if e.peak_memory is not None else ""
+            rows.append(
+                f"{e.phase:<10} {count:>16} {e.wall * 1000:>10.3f} "
+                f"{e.cpu * 1000:>10.3f} {peak:>10}"
+            )
+        return "\n".join(rows)
@@ -0,0 +1,51 @@
+# the scanners import this module, so no dataclass here (see tokens.py)
+class InternStats:
+    __slots__ = ("hits", "misses")
+
+    def __init__(self, hits: int, misses: int):
+        self.hits = hits
+        self.misses = misses
+
+    def __eq__(self, other):
+        if other.__class__ is not InternStats:
+            return NotImplemented
+        return (self.hits, self.misses) == (other.hits, other.misses)
+
+    def __hash__(self):
+        return hash((self.hits, self.misses))
+
+    def __repr__(self):
+        return f"InternStats(hits={self.hits!r}, misses={self.misses!r})"
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+# Table the scanners use so that every occurrence of an identifier or string
+# is the same str object. Tokens then don't keep thousands of
+# copies of `i`, and Environment lookups compare names by identity.
+# A table can be shared by several scanners (see IncrementalDocument, which
+# re-scans edits with its own). It keeps every string it has seen, so
+# scan_stream only interns into a table it's given.
+class InternTable:
+    def __init__(self):
+        self._strings: dict[str, str] = dict()
+        self.hits = 0
+        self.misses = 0
+
+    def intern(self, text: str) -> str:
+        interned = self._strings.get(text)
+        if interned is None:
+            self._strings[text] = text
+            self.misses += 1
+            return text
+        self.hits += 1
+        return interned
+
+    def stats(self) -> InternStats:
+        return InternStats(self.hits, self.misses)
+
+    def __len__(self) -> int:
+        return len(self._strings)
@@ -1,49 +1,46 @@
-from expr import Assign
 from .environment import Environment
 from .errors import PyloxRuntimeError, ErrorReporter
-from .expr import Binary, Grouping, Literal, Unary, Variable
+from .expr import Assign, Binary, Grouping, Literal, Unary, Variable
+from .runtime import (
+    FLOAT_OPERATORS,
+    checked_divide,
+    is_equal,
+    is_truthy,
+    stringify,
+    validate_number,
+    validate_plus,
+)
 from .stmt import Expression, Print, Var, Block
 from .token_type import TokenType
 from .tokens import Token
 
+# OutputSink is a typing.Protocol, only imported by type checkers so a plain
+# run doesn't import typing
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .output import OutputSink
+
 
 class Interpreter:
-    def __init__(self, err_reporter: ErrorReporter):
+    # print statements go to the output sink, or to print() when there is none
+    # (looked up on every call so it can be patched)
+    def __init__(self, err_reporter: ErrorReporter, output: "OutputSink | None" = None):
         self.err_reporter = err_reporter
-        self.env = Environment()
+        self.output = output
+        self.globals = Environment()
+        self.env = self.globals
 
     def visit_binary_expr(self, expr: Binary):
         left = self._evaluate(expr.left)
         right = self._evaluate(expr.right)
-        match expr.operator.type:
-            case TokenType.MINUS:
-                self._validate_number(expr.operator, left, right)
-                return float(left) - float(right)
-            case TokenType.SLASH:
-                self._validate_number(expr.operator, left, right)
-                return float(left) / float(right)
-            case TokenType.STAR:
-                self._validate_number(expr.operator, left, right)
-                return float(left) * float(right)
-            case TokenType.PLUS:
-                return self._validate_plus(expr.operator, left, right)
-            case TokenType.GREATER:
-                self._validate_number(expr.operator, left, right)
-                return float(left) > float(right)
-            case TokenType.GREATER_EQUAL:
-                self._validate_number(expr.operator, left, right)
-                return float(left) >= float(right)
-            case TokenType.LESS:
-                self._validate_number(expr.operator, left, right)
-                return float(left) < float(right)
-            case TokenType.LESS_EQUAL:
-                self._validate_number(expr.operator, left, right)
-                return float(left) <= float(right)
-            # Pyton equality seems to be the same as src so no additonal logic is needed
-            case TokenType.EQUAL_EQUAL:
-                return str(left) == str(right)
-            case TokenType.BANG_EQUAL:
-                return not (str(left) == str(right))
+        # number literals are floats since scan time, so the common case needs no validation
+        if type(left) is float and type(right) is float:
+            if op := FLOAT_OPERATORS.get(expr.operator.type):
+                try:
+                    return op(left, right)
+                except ZeroDivisionError:
+                    return checked_divide(expr.operator, left, right)
+        return self._binary(expr.operator, left, right)
 
     def visit_grouping_expr(self, expr: Grouping):
         return self._evaluate(expr.expression)
@@ -52,23 +49,21 @@ class Interpreter:
         return expr.value
 
     def visit_unary_expr(self, expr: Unary):
-        right = self._evaluate(expr.right)
-        match expr.operator.type:
-            case TokenType.MINUS:
-                self._validate_number(expr.operator, right)
-                return -float(right)
-            case TokenType.BANG:
-                # Pretty sure Python's not behaves the same as Lox so no additional logic is needed
-                return not right
-            case _:
-                return None
+        return self._unary(expr.operator, self._evaluate(expr.right))
 
+    # nodes the Resolver didn't annotate (globals, or trees that were never
+    # resolved) fall back to looking the name up through the environment chain
     def visit_variable_expr(self, expr: Variable):
-        return self.env.get(expr.name)
+        if expr.depth is None:
+            return self.env.get(expr.name)
+        return self.env.get_at(expr.depth, expr.slot)
 
     def visit_assign_expr(self, expr: Assign):
         value = self._evaluate(expr.value)
-        self.env.assign(expr.name, value)
+        if expr.depth is None:
+            self.env.assign(expr.name, value)
+        else:
+            self.env.assign_at(expr.depth, expr.slot, value)
         return value
 
     def visit_expression_stmt(self, stmt: Expression):
@@ -76,56 +71,69 @@ class Interpreter:
 
     def visit_print_stmt(self, stmt: Print):
         value = self._evaluate(stmt.expression)
-        print(self._stringify_expression_result(value))
+        if self.output is None:
+            print(stringify(value))
+        else:
+            self.output.write(stringify(value))
 
     def visit_var_stmt(self, stmt: Var):
         value = None
         if stmt.initializer:
             value = self._evaluate(stmt.initializer)
-        self.env.define(stmt.name.lexeme, value)
+        if stmt.slot is None:
+            self.env.define(stmt.name.lexeme, value)
+        else:
+            self.env.define_at(stmt.slot, value)
 
     def visit_block_stmt(self, stmt: Block):
-        block_env = Environment(self.env)
+        block_env = Environment(self.env, stmt.slot_count or 0)
         self._execute_block(stmt.statements, block_env)
 
-    def _evaluate(self, expr):
-        return expr.accept(self)
+    # operators with their operands already evaluated
+    def _binary(self, operator: Token, left, right):
+        match operator.type:
+            case TokenType.EQUAL_EQUAL:
+                return is_equal(left, right)
+            case TokenType.BANG_EQUAL:
+                return not is_equal(left, right)
+            case TokenType.MINUS:
+                validate_number(operator, left, right)
+                return float(left) - float(right)
+            case TokenType.SLASH:
+                validate_number(operator, left, right)
+                return checked_divide(operator, float(left), float(right))
+            case TokenType.STAR:
+                validate_number(operator, left, right)
+                return float(left) * float(right)
+            case TokenType.PLUS:
+                return validate_plus(operator, left, right)
+            case TokenType.GREATER:
+                validate_number(operator, left, right)
+                return float(left) > float(right)
+            case TokenType.GREATER_EQUAL:
+                validate_number(operator, left, right)
+                return float(left) >= float(right)
+            case TokenType.LESS:
+                validate_number(operator, left, right)
+                return float(left) < float(right)
+            case TokenType.LESS_EQUAL:
+                validate_number(operator, left, right)
+                return float(left) <= float(right)
 
-    def _validate_number(self, operator: Token, *operands):
-        for o in operands:
-            try:
-                float(o)
-            except:
-                raise PyloxRuntimeError(operator, f"{o} must be a number")
+    def _unary(self, operator: Token, right):
+        match operator.type:
+            case TokenType.MINUS:
+                if type(right) is float:
+                    return -right
+                validate_number(operator, right)
+                return -float(right)
+            case TokenType.BANG:
+                return not is_truthy(right)
+            case _:
+                return None
 
-    def _validate_plus(self, operator: Token, left, right):
-        try:
-            lf = float(left)
-            rf = float(right)
-            return lf + rf
-        except:
-            # TODO not really sure if this is right, but the book doesn't give any examples
-            if isinstance(left, str) and isinstance(right, str):
-                return left + right
-            elif isinstance(left, str):
-                raise PyloxRuntimeError(
-                    operator, f"{left} and {right} must both be strings"
-                )
-            else:
-                raise PyloxRuntimeError(
-                    operator, f"{left} and {right} must both a numbers"
-                )
-
-    def _stringify_expression_result(self, value):
-        if value is None:
-            return "nil"
-
-        text = str(value)
-        if isinstance(value, float):
-            if text.endswith(".0"):
-                text = text[:-2]
-            return text
-        return text
+    def _evaluate(self, expr):
+        return expr.accept(self)
 
     def _execute(self, stmt):
         stmt.accept(self)
@@ -144,4 +152,7 @@ class Interpreter:
             for stmt in statements:
                 self._execute(stmt)
         except PyloxRuntimeError as err:
+            # buffered output comes before the error
+            if self.output is not None:
+                self.output.flush()
             self.err_reporter.runtime_error(err)
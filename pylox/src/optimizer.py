@@ -0,0 +1,190 @@
+from .errors import ErrorReporter, PyloxRuntimeError
+from .expr import ASSIGN, BINARY, GROUPING, LITERAL, UNARY, VARIABLE
+from .expr import Binary, Literal, Unary
+from .interpreter import Interpreter
+from .rope import Rope
+from .stmt import BLOCK, EXPRESSION, PRINT, VAR, Block, Var
+from .token_type import TokenType
+
+# operators whose result is always a bool, so `!!x` is just `x` for them
+_BOOLEAN_OPERATORS = {
+    TokenType.BANG,
+    TokenType.BANG_EQUAL,
+    TokenType.EQUAL_EQUAL,
+    TokenType.GREATER,
+    TokenType.GREATER_EQUAL,
+    TokenType.LESS,
+    TokenType.LESS_EQUAL,
+}
+
+
+# Rewrites Stmt/Expr trees before they are resolved and run:
+#  - folds operators whose operands are literals, including comparisons
+#  - strips Grouping nodes, which only matter to the parser
+#  - turns `!!x` into `x` when x is already a bool
+#  - drops statements without effect (`1;`, empty blocks) and inlines blocks
+#    that don't declare anything
+# Folding evaluates with the Interpreter itself and is skipped whenever that
+# fails, so runtime errors like `"a" - 1` still happen at run time.
+#
+# Like linearize() in stack_interpreter, the tree is walked from an explicit
+# work stack, so there is no limit on how deep it can be nested. It holds the
+# nodes still to visit, and `(node,)` entries for nodes to rewrite once their
+# children are done. Every node leaves its rewritten version (None for a
+# dropped statement) on a stack of results. Eliminated nodes are counted where
+# they are dropped.
+class Optimizer:
+    def __init__(self):
+        self.eliminated = 0
+        self._evaluator = Interpreter(ErrorReporter())
+
+    def optimize(self, statements: list) -> list:
+        work = list(reversed(statements))
+        push = work.append
+        results: list = []
+        emit = results.append
+        pop = results.pop
+
+        while work:
+            node = work.pop()
+            if type(node) is tuple:
+                node = node[0]
+                kind = node.kind
+                if kind == BINARY:
+                    right = pop()
+                    left = pop()
+                    node.left, node.right = left, right
+                    if type(left) is Literal and type(right) is Literal:
+                        emit(self._fold(node))
+                    else:
+                        emit(node)
+                elif kind == UNARY:
+                    node.right = right = pop()
+                    if type(right) is Literal:
+                        emit(self._fold(node))
+                    elif (
+                        node.operator.type == TokenType.BANG
+                        and type(right) is Unary
+                        and right.operator.type == TokenType.BANG
+                        and _is_boolean(right.right)
+                    ):
+                        self.eliminated += 2
+                        emit(right.right)
+                    else:
+                        emit(node)
+                elif kind == EXPRESSION:
+                    node.expression = expression = pop()
+                    if type(expression) is Literal:
+                        self.eliminated += 2
+                        emit(None)
+                    else:
+                        emit(node)
+                elif kind == PRINT:
+                    node.expression = pop()
+                    emit(node)
+                elif kind == ASSIGN:
+                    node.value = pop()
+                    emit(node)
+                elif kind == VAR:
+                    node.initializer = pop()
+                    emit(node)
+                elif kind == BLOCK:
+                    first = len(results) - len(node.statements)
+                    node.statements = self._flatten(results[first:])
+                    del results[first:]
+                    if node.statements:
+                        emit(node)
+                    else:
+                        self.eliminated += 1
+                        emit(None)
+                continue
+
+            kind = node.kind
+            if kind == LITERAL or kind == VARIABLE:
+                emit(node)
+            elif kind == BINARY:
+                push((node,))
+                push(node.right)
+                push(node.left)
+            elif kind == GROUPING:
+                # the expression takes the place of the Grouping
+                self.eliminated += 1
+                push(node.expression)
+            elif kind == UNARY:
+                push((node,))
+                push(node.right)
+            elif kind == EXPRESSION or kind == PRINT:
+                push((node,))
+                push(node.expression)
+            elif kind == ASSIGN:
+                push((node,))
+                push(node.value)
+            elif kind == VAR:
+                if node.initializer:
+                    push((node,))
+                    push(node.initializer)
+                else:
+                    emit(node)
+            elif kind == BLOCK:
+                push((node,))
+                work.extend(reversed(node.statements))
+
+        return self._flatten(results)
+
+    # replaces an operator whose operands are literals by one literal
+    def _fold(self, expr):
+        try:
+            value = expr.accept(self._evaluator)
+        except PyloxRuntimeError:
+            return expr
+        self.eliminated += 2 if expr.kind == BINARY else 1
+        # literals hold plain values, they get cached and marshaled
+        return Literal(str(value) if isinstance(value, Rope) else value)
+
+    # drops removed statements and inlines blocks that don't declare anything
+    def _flatten(self, statements: list) -> list:
+        flattened = []
+        for stmt in statements:
+            if stmt is None:
+                continue
+            if type(stmt) is Block and not any(type(s) is Var for s in stmt.statements):
+                self.eliminated += 1
+                flattened.extend(stmt.statements)
+            else:
+                flattened.append(stmt)
+        return flattened
+
+
+def _is_boolean(expr) -> bool:
+    if isinstance(expr, Literal):
+        return isinstance(expr.value, bool)
+    if isinstance(expr, (Binary, Unary)):
+        return expr.operator.type in _BOOLEAN_OPERATORS
+    return False
+
+
+# number of Stmt/Expr nodes in the given statements, counted from a work stack
+# so there is no limit on how deep they can be nested
+def count_nodes(statements: list) -> int:
+    count = 0
+    work = [stmt for stmt in statements if stmt is not None]
+    push = work.append
+    while work:
+        node = work.pop()
+        count += 1
+        kind = node.kind
+        if kind == BINARY:
+            push(node.left)
+            push(node.right)
+        elif kind in (GROUPING, EXPRESSION, PRINT):
+            push(node.expression)
+        elif kind == UNARY:
+            push(node.right)
+        elif kind == ASSIGN:
+            push(node.value)
+        elif kind == VAR:
+            if node.initializer:
+                push(node.initializer)
+        elif kind == BLOCK:
+            work.extend(stmt for stmt in node.statements if stmt is not None)
+    return count
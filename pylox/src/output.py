@@ -0,0 +1,71 @@
+import io
+import sys
+from typing import Protocol
+
+DEFAULT_FLUSH_SIZE = 64 * 1024
+
+
+# Where the engines send the text of print statements, one line per write().
+# Without a sink they call print() for every line. Any object with these two
+# methods will do, like the sinks below. The engines only import it for type
+# checking, a run without --buffered-output doesn't import this module (nor
+# typing).
+class OutputSink(Protocol):
+    def write(self, text: str): ...
+
+    def flush(self): ...
+
+
+# Collects lines and writes them to the stream in one call once about
+# flush_size characters are pending, instead of one print() per line.
+# The stream defaults to sys.stdout, looked up when flushing.
+class BufferedSink:
+    def __init__(
+        self, stream: io.TextIOBase | None = None, flush_size: int = DEFAULT_FLUSH_SIZE
+    ):
+        self.stream = stream
+        self.flush_size = flush_size
+        self._lines: list[str] = []
+        self._size = 0
+
+    def write(self, text: str):
+        self._lines.append(text)
+        self._size += len(text) + 1
+        if self._size >= self.flush_size:
+            self.flush()
+
+    def flush(self):
+        if not self._lines:
+            return
+        stream = self.stream or sys.stdout
+        self._lines.append("")
+        stream.write("\n".join(self._lines))
+        stream.flush()
+        self._lines = []
+        self._size = 0
+
+
+# Keeps every line in memory, for tests and embedding
+class MemorySink:
+    def __init__(self):
+        self.lines: list[str] = []
+
+    def write(self, text: str):
+        self.lines.append(text)
+
+    def flush(self):
+        pass
+
+    # returns the lines written so far and starts over
+    def take(self) -> list[str]:
+        lines, self.lines = self.lines, []
+        return lines
+
+
+# Discards everything, to measure execution without output costs
+class NullSink:
+    def write(self, text: str):
+        pass
+
+    def flush(self):
+        pass
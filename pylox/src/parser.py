@@ -1,15 +1,26 @@
-from .errors import PyloxParseError, ErrorReporter, PyloxRuntimeError
+from .errors import PyloxParseError, ErrorReporter
 from .expr import Binary, Unary, Literal, Grouping, Variable, Assign
 from .stmt import Var, Print, Expression, Block
 from .token_type import TokenType
 from .tokens import Token
 
 
+# tokens can be a list or anything indexable the same way, e.g. a TokenWindow
+# over a lazily scanned stream. Token types and literals are read through
+# _type_at/_literal_at, which a TokenBuffer answers without building Tokens.
 class Parser:
     def __init__(self, error_reporter: ErrorReporter, tokens: list[Token]):
         self.error_reporter = error_reporter
         self.tokens = tokens
         self.current = 0
+        self._type_at = getattr(tokens, "type_at", None) or self._token_type_at
+        self._literal_at = getattr(tokens, "literal", None) or self._token_literal_at
+
+    def _token_type_at(self, index: int) -> TokenType:
+        return self.tokens[index].type
+
+    def _token_literal_at(self, index: int):
+        return self.tokens[index].literal
 
     def _expression(self):
         return self._assignment()
@@ -18,13 +29,15 @@ class Parser:
         expr = self._equality()
 
         if self._match(TokenType.EQUAL):
-            equals = self._previous()
+            # the `=` Token is only needed for the error
+            equals = None if isinstance(expr, Variable) else self._previous()
             value = self._assignment()
 
             if isinstance(expr, Variable):
                 name = expr.name
                 return Assign(name, value)
-            raise PyloxRuntimeError(equals, "Invalid assignment target.")
+            # reported without raising, the parser isn't in a confused state
+            self.error_reporter.parse_error(equals, "Invalid assignment target.")
         return expr
 
     def _equality(self):
@@ -79,7 +92,7 @@ class Parser:
         elif self._match(TokenType.NIL):
             return Literal(None)
         elif self._match(TokenType.NUMBER, TokenType.STRING):
-            return Literal(self._previous().literal)
+            return Literal(self._literal_at(self.current - 1))
         elif self._match(TokenType.IDENTIFIER):
             return Variable(self._previous())
         elif self._match(TokenType.LEFT_PAREN):
@@ -92,13 +105,16 @@ class Parser:
     def _match(self, *token_types: TokenType) -> bool:
         for tt in token_types:
             if self._check(tt):
-                self._advance()
+                # not _advance(), the matched Token is only built if _previous() asks
+                self.current += 1
                 return True
         else:
             return False
 
     def _check(self, token_type: TokenType) -> bool:
-        return self._peek().type == token_type if not self._is_at_end() else False
+        if self._is_at_end():
+            return False
+        return self._type_at(self.current) == token_type
 
     def _advance(self) -> Token:
         if not self._is_at_end():
@@ -106,7 +122,7 @@ class Parser:
         return self._previous()
 
     def _is_at_end(self) -> bool:
-        return self._peek().type == TokenType.EOF
+        return self._type_at(self.current) == TokenType.EOF
 
     def _peek(self) -> Token:
         return self.tokens[self.current]
@@ -114,9 +130,10 @@ class Parser:
     def _previous(self) -> Token:
         return self.tokens[self.current - 1]
 
-    def _consume(self, token_type: TokenType, message: str) -> Token:
+    def _consume(self, token_type: TokenType, message: str):
         if self._check(token_type):
-            return self._advance()
+            self.current += 1
+            return
         raise self._create_exception(message)
 
     def _create_exception(self, message):
@@ -126,10 +143,10 @@ class Parser:
     def _synchronize(self):
         self._advance()
         while not self._is_at_end():
-            if self._previous().type == TokenType.SEMICOLON:
+            if self._type_at(self.current - 1) == TokenType.SEMICOLON:
                 return
 
-            match self._peek().type:
+            match self._type_at(self.current):
                 case (
                     TokenType.CLASS
                     | TokenType.FUNC
@@ -154,7 +171,8 @@ class Parser:
             return None
 
     def _var_declaration(self):
-        identifier = self._consume(TokenType.IDENTIFIER, "Expect variable name.")
+        self._consume(TokenType.IDENTIFIER, "Expect variable name.")
+        identifier = self._previous()
 
         initializer = None
         if self._match(TokenType.EQUAL):
@@ -180,20 +198,127 @@ class Parser:
         self._consume(TokenType.SEMICOLON, "Expect ';' after value.")
         return Expression(value)
 
+    # Blocks directly nested in blocks are parsed with a stack of the open ones
+    # instead of recursing, so nesting `{` is not limited by Python's stack.
+    # Errors are recovered from as if every inner block had been parsed by a
+    # recursive _declaration: a bad inner block is dropped (None) after
+    # _synchronize, a bad outermost one raises to our caller.
     def _block_statement(self):
-        statements = self._define_block()
-        return Block(statements)
-
-    def _define_block(self):
-        statements = list()
-        while not self._check(TokenType.RIGHT_BRACE) and not self._is_at_end():
-            statements.append(self._declaration())
-        self._consume(TokenType.RIGHT_BRACE, "Expect '}' at end of block.")
-        return statements
+        open_blocks = [list()]
+        while True:
+            if self._match(TokenType.LEFT_BRACE):
+                open_blocks.append(list())
+            elif not self._check(TokenType.RIGHT_BRACE) and not self._is_at_end():
+                open_blocks[-1].append(self._declaration())
+            else:
+                try:
+                    self._consume(TokenType.RIGHT_BRACE, "Expect '}' at end of block.")
+                    block = Block(open_blocks.pop())
+                except PyloxParseError:
+                    if len(open_blocks) == 1:
+                        raise
+                    open_blocks.pop()
+                    self._synchronize()
+                    block = None
+                if not open_blocks:
+                    return block
+                open_blocks[-1].append(block)
 
     def parse(self):
-        statements = []
+        return list(self.declarations())
+
+    # yields each top level declaration as soon as it is parsed, None for the
+    # ones that had a parse error
+    def declarations(self):
         while not self._is_at_end():
-            statements.append(self._declaration())
+            yield self._declaration()
+
+
+# binding power of the infix operators, higher binds tighter. Assignment is
+# the loosest and handled by _expression itself, since only a whole
+# expression can be assigned to (`a + b = c` is an error, not `a + (b = c)`).
+EQUALITY = 1
+COMPARISON = 2
+TERM = 3
+FACTOR = 4
+UNARY = 5
+
+_INFIX_PRECEDENCE = {
+    TokenType.BANG_EQUAL: EQUALITY,
+    TokenType.EQUAL_EQUAL: EQUALITY,
+    TokenType.GREATER: COMPARISON,
+    TokenType.GREATER_EQUAL: COMPARISON,
+    TokenType.LESS: COMPARISON,
+    TokenType.LESS_EQUAL: COMPARISON,
+    TokenType.MINUS: TERM,
+    TokenType.PLUS: TERM,
+    TokenType.SLASH: FACTOR,
+    TokenType.STAR: FACTOR,
+}
+
+
+# Parser whose expressions are parsed by precedence climbing over the tables
+# above and _PREFIX below instead of one method per precedence level, so an
+# operand costs a couple of calls instead of going through all six levels.
+# It builds the same trees and reports the same errors as Parser.
+class PrattParser(Parser):
+    def _expression(self):
+        expr = self._parse_precedence(EQUALITY)
+
+        if self._type_at(self.current) == TokenType.EQUAL:
+            # the `=` Token is only needed for the error
+            equals = None if isinstance(expr, Variable) else self.tokens[self.current]
+            self.current += 1
+            value = self._expression()
+
+            if isinstance(expr, Variable):
+                return Assign(expr.name, value)
+            # reported without raising, the parser isn't in a confused state
+            self.error_reporter.parse_error(equals, "Invalid assignment target.")
+        return expr
+
+    # parses an operand and every following infix operator binding at least
+    # as tight as `precedence`
+    def _parse_precedence(self, precedence: int):
+        prefix = _PREFIX.get(self._type_at(self.current))
+        if prefix is None:
+            raise self._create_exception("Expect Expression")
+        self.current += 1
+        expr = prefix(self)
+
+        infix_precedence = _INFIX_PRECEDENCE.get
+        type_at = self._type_at
+        while (operator := infix_precedence(type_at(self.current), 0)) >= precedence:
+            self.current += 1
+            token = self._previous()
+            # left associative: the right operand only takes tighter operators
+            expr = Binary(expr, token, self._parse_precedence(operator + 1))
+        return expr
 
-        return statements
+    def _prefix_literal(self):
+        return Literal(self._literal_at(self.current - 1))
+
+    def _prefix_variable(self):
+        return Variable(self._previous())
+
+    def _prefix_grouping(self):
+        expr = self._expression()
+        self._consume(TokenType.RIGHT_PAREN, "Expect ) after expression")
+        return Grouping(expr)
+
+    def _prefix_unary(self):
+        return Unary(self._previous(), self._parse_precedence(UNARY))
+
+
+# handlers for the token starting an operand, called once it is consumed
+_PREFIX = {
+    TokenType.FALSE: lambda parser: Literal(False),
+    TokenType.TRUE: lambda parser: Literal(True),
+    TokenType.NIL: lambda parser: Literal(None),
+    TokenType.NUMBER: PrattParser._prefix_literal,
+    TokenType.STRING: PrattParser._prefix_literal,
+    TokenType.IDENTIFIER: PrattParser._prefix_variable,
+    TokenType.LEFT_PAREN: PrattParser._prefix_grouping,
+    TokenType.BANG: PrattParser._prefix_unary,
+    TokenType.MINUS: PrattParser._prefix_unary,
+}
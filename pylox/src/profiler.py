@@ -0,0 +1,137 @@
+import json
+from dataclasses import asdict, dataclass
+from time import perf_counter_ns
+
+from .errors import ErrorReporter
+from .expr import Assign, Binary, Grouping, Unary, Variable
+from .interpreter import Interpreter
+from .output import OutputSink
+from .stmt import Expression, Print, Var, Block
+
+
+@dataclass
+class NodeRecord:
+    kind: str
+    line: int
+    count: int = 0
+    # time spent in the node including its children, and without them
+    total_ns: int = 0
+    self_ns: int = 0
+
+
+@dataclass
+class LineRecord:
+    line: int
+    # statements executed on the line
+    count: int = 0
+    self_ns: int = 0
+
+
+# Interpreter recording execution counts and times of every node it runs.
+# Everything happens in the overridden _execute/_evaluate chokepoints, so the
+# plain Interpreter is untouched and has no overhead when not profiling.
+class ProfilingInterpreter(Interpreter):
+    def __init__(self, err_reporter: ErrorReporter, output: OutputSink | None = None):
+        super().__init__(err_reporter, output)
+        # by id() of the node
+        self.records: dict[int, NodeRecord] = dict()
+        self._statements: set[int] = set()
+        # references to the profiled nodes, so their ids can't be reused by
+        # other nodes once a statement is freed (as with --pipeline)
+        self._nodes: list = []
+        self._child_ns = [0]
+        self._line = 0
+
+    def _execute(self, stmt):
+        previous_line = self._line
+        self._line = line_of(stmt) or previous_line
+        try:
+            self._profile(stmt, Interpreter._execute, True)
+        finally:
+            self._line = previous_line
+
+    def _evaluate(self, expr):
+        return self._profile(expr, Interpreter._evaluate, False)
+
+    def _profile(self, node, run, is_statement: bool):
+        record = self.records.get(id(node))
+        if record is None:
+            record = NodeRecord(type(node).__name__, line_of(node) or self._line)
+            self.records[id(node)] = record
+            self._nodes.append(node)
+            if is_statement:
+                self._statements.add(id(node))
+
+        self._child_ns.append(0)
+        start = perf_counter_ns()
+        try:
+            return run(self, node)
+        finally:
+            elapsed = perf_counter_ns() - start
+            children = self._child_ns.pop()
+            self._child_ns[-1] += elapsed
+            record.count += 1
+            record.total_ns += elapsed
+            record.self_ns += elapsed - children
+
+    @property
+    def total_ns(self) -> int:
+        return self._child_ns[0]
+
+    def lines(self) -> list[LineRecord]:
+        lines: dict[int, LineRecord] = dict()
+        for key, record in self.records.items():
+            line = lines.setdefault(record.line, LineRecord(record.line))
+            line.self_ns += record.self_ns
+            if key in self._statements:
+                line.count += record.count
+        return sorted(lines.values(), key=lambda r: r.self_ns, reverse=True)
+
+    def nodes(self) -> list[NodeRecord]:
+        return sorted(self.records.values(), key=lambda r: r.self_ns, reverse=True)
+
+    def report(self, limit: int = 10) -> str:
+        total = self.total_ns or 1
+        rows = [f"total {self.total_ns / 1e6:.3f} ms", "", "hot lines:"]
+        rows.append(f"{'line':>6} {'count':>10} {'self ms':>10} {'%':>6}")
+        for line in self.lines()[:limit]:
+            rows.append(
+                f"{line.line:>6} {line.count:>10} {line.self_ns / 1e6:>10.3f} "
+                f"{100 * line.self_ns / total:>6.1f}"
+            )
+        rows += ["", "hot nodes:"]
+        rows.append(
+            f"{'line':>6} {'node':<12} {'count':>10} {'total ms':>10} {'self ms':>10}"
+        )
+        for node in self.nodes()[:limit]:
+            rows.append(
+                f"{node.line:>6} {node.kind:<12} {node.count:>10} "
+                f"{node.total_ns / 1e6:>10.3f} {node.self_ns / 1e6:>10.3f}"
+            )
+        return "\n".join(rows)
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "total_ns": self.total_ns,
+                "lines": [asdict(r) for r in self.lines()],
+                "nodes": [asdict(r) for r in self.nodes()],
+            },
+            indent=2,
+        )
+
+
+# source line of a node, taken from the first token found in it. Literals keep
+# no token, they get the line of their statement (0 when that has none either).
+def line_of(node):
+    if isinstance(node, (Var, Assign, Variable)):
+        return node.name.line
+    if isinstance(node, (Binary, Unary)):
+        return node.operator.line
+    if isinstance(node, Grouping):
+        return line_of(node.expression)
+    if isinstance(node, (Expression, Print)):
+        return line_of(node.expression)
+    if isinstance(node, Block):
+        return line_of(node.statements[0]) if node.statements else None
+    return None
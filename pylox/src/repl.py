@@ -0,0 +1,99 @@
+from typing import Callable, TextIO
+
+from .fast_scanner import FastScanner
+from .instrumentation import Instrumentation
+from .session import CollectingErrorReporter, LoxSession
+from .token_type import TokenType
+
+PROMPT = "> "
+CONTINUATION_PROMPT = ". "
+
+_NESTING = {
+    TokenType.LEFT_BRACE: 1,
+    TokenType.RIGHT_BRACE: -1,
+    TokenType.LEFT_PAREN: 1,
+    TokenType.RIGHT_PAREN: -1,
+}
+
+
+# whether source can be run as is, rather than being the start of a longer
+# snippet: no unterminated string, no unclosed brace or parenthesis, and it
+# ends a statement
+def is_complete(source: str) -> bool:
+    reporter = CollectingErrorReporter()
+    tokens = FastScanner(source, reporter).scan_tokens()
+    if any(error.message == "Unterminated string" for error in reporter.errors):
+        return False
+    if sum(_NESTING.get(token.type, 0) for token in tokens) > 0:
+        return False
+    return len(tokens) == 1 or tokens[-2].type in (
+        TokenType.SEMICOLON,
+        TokenType.RIGHT_BRACE,
+    )
+
+
+# Interactive prompt on top of a LoxSession, so globals defined on one line are
+# there on the next and a line entered again runs from the session's cache of
+# parsed snippets. Lines are collected until they form a complete snippet; an
+# empty line runs an incomplete one anyway (to see its errors).
+#
+# Every snippet is run in an instrumentation phase named "line", `main.py
+# --stats` reports the latency of each one.
+class Repl:
+    def __init__(
+        self,
+        session: LoxSession | None = None,
+        stdout: TextIO | None = None,
+        instrumentation: Instrumentation | None = None,
+    ):
+        self.session = session if session is not None else LoxSession()
+        # None is sys.stdout at the time of printing
+        self.stdout = stdout
+        self.instrumentation = (
+            instrumentation if instrumentation is not None else Instrumentation()
+        )
+        self._lines: list[str] = []
+
+    @property
+    def prompt(self) -> str:
+        return CONTINUATION_PROMPT if self._lines else PROMPT
+
+    # adds a line of input, returns True while the snippet needs more lines
+    def push(self, line: str) -> bool:
+        if not line.strip():
+            if not self._lines:
+                return False
+            source = "\n".join(self._lines)
+        else:
+            self._lines.append(line)
+            source = "\n".join(self._lines)
+            # a snippet already run once is complete
+            if not self.session.is_cached(source) and not is_complete(source):
+                return True
+        self._lines = []
+        self.run(source)
+        return False
+
+    def run(self, source: str):
+        with self.instrumentation.phase("line") as event:
+            result = self.session.execute(source)
+            if event:
+                event.count, event.unit = source.count("\n") + 1, "lines"
+        for line in result.output:
+            print(line, file=self.stdout)
+        for error in result.errors:
+            print(error, file=self.stdout)
+
+    # reads lines until end of input, Ctrl-C drops the snippet being entered
+    def loop(self, read: Callable[[str], str] = input):
+        while True:
+            try:
+                line = read(self.prompt)
+            except EOFError:
+                print(file=self.stdout)
+                return
+            except KeyboardInterrupt:
+                self._lines = []
+                print(file=self.stdout)
+                continue
+            self.push(line)
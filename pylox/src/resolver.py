@@ -0,0 +1,91 @@
+from .expr import Assign, Binary, Grouping, Literal, Unary, Variable
+from .stmt import Block, Expression, Print, Var
+
+
+# Static pass run between Parser.parse() and Interpreter.interpret(). Every local
+# Variable/Assign is annotated with the number of scopes to hop (depth) and its
+# index in that scope's frame (slot), so the interpreter never has to look
+# locals up by name. Globals are left unresolved and stay name based.
+#
+# Nodes are visited from an explicit work stack rather than by recursion, so
+# the depth of the tree is only limited by memory. The visit methods push the
+# children, and (method, node) pairs for what has to happen once they are done.
+class Resolver:
+    def __init__(self):
+        self.scopes: list[dict[str, int]] = []
+        self._work: list = []
+
+    def resolve(self, statements: list):
+        work = self._work
+        scopes = len(self.scopes)
+        work.extend(reversed(statements))
+        try:
+            while work:
+                item = work.pop()
+                if type(item) is tuple:
+                    finish, node = item
+                    finish(node)
+                else:
+                    item.accept(self)
+        except BaseException:
+            work.clear()
+            del self.scopes[scopes:]
+            raise
+
+    def visit_block_stmt(self, stmt: Block):
+        self.scopes.append(dict())
+        self._work.append((self._end_block, stmt))
+        self._work.extend(reversed(stmt.statements))
+
+    def _end_block(self, stmt: Block):
+        stmt.slot_count = len(self.scopes.pop())
+
+    def visit_expression_stmt(self, stmt: Expression):
+        self._work.append(stmt.expression)
+
+    def visit_print_stmt(self, stmt: Print):
+        self._work.append(stmt.expression)
+
+    def visit_var_stmt(self, stmt: Var):
+        # the initializer is resolved before the name is declared so that
+        # `var a = a;` reads the enclosing `a`, same as the dynamic lookup did
+        self._work.append((self._declare, stmt))
+        if stmt.initializer:
+            self._work.append(stmt.initializer)
+
+    def _declare(self, stmt: Var):
+        if not self.scopes:
+            stmt.slot = None
+            return
+        scope = self.scopes[-1]
+        # redeclaring a name in the same scope reuses its slot
+        stmt.slot = scope.setdefault(stmt.name.lexeme, len(scope))
+
+    def visit_assign_expr(self, expr: Assign):
+        self._resolve_local(expr)
+        self._work.append(expr.value)
+
+    def visit_binary_expr(self, expr: Binary):
+        self._work.append(expr.right)
+        self._work.append(expr.left)
+
+    def visit_grouping_expr(self, expr: Grouping):
+        self._work.append(expr.expression)
+
+    def visit_literal_expr(self, expr: Literal):
+        pass
+
+    def visit_unary_expr(self, expr: Unary):
+        self._work.append(expr.right)
+
+    def visit_variable_expr(self, expr: Variable):
+        self._resolve_local(expr)
+
+    def _resolve_local(self, expr):
+        for depth, scope in enumerate(reversed(self.scopes)):
+            if (slot := scope.get(expr.name.lexeme)) is not None:
+                expr.depth = depth
+                expr.slot = slot
+                return
+        expr.depth = None
+        expr.slot = None
@@ -0,0 +1,41 @@
+# Lox string built by concatenation. `s = s + x` on a str copies s every time,
+# which makes building a string in a loop quadratic. A Rope only appends x to
+# a list of parts and joins them the first time the text is needed (printing,
+# comparing), so the same loop is linear.
+#
+# Ropes share their parts list: appending to a rope adds to the list and
+# returns a rope seeing one more part. Appending to an older rope, whose parts
+# were extended since, copies its own parts first.
+class Rope:
+    __slots__ = ("_parts", "_count", "_length", "_text")
+
+    def __init__(self, parts: list[str], count: int, length: int):
+        self._parts = parts
+        self._count = count
+        self._length = length
+        self._text: str | None = None
+
+    @staticmethod
+    def of(left: str, right: str) -> "Rope":
+        return Rope([left, right], 2, len(left) + len(right))
+
+    def append(self, text: str) -> "Rope":
+        parts = self._parts
+        if self._count != len(parts):
+            parts = parts[: self._count]
+        parts.append(text)
+        return Rope(parts, len(parts), self._length + len(text))
+
+    def __str__(self) -> str:
+        if self._text is None:
+            parts = self._parts
+            if self._count != len(parts):
+                parts = parts[: self._count]
+            self._text = "".join(parts)
+        return self._text
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return f"Rope({str(self)!r})"
@@ -0,0 +1,134 @@
+import operator as op
+
+from .errors import PyloxRuntimeError
+from .rope import Rope
+from .token_type import TokenType
+from .tokens import Token
+
+# Lox value semantics shared by the execution engines (Interpreter, ClosureCompiler)
+
+# Operators that can be applied directly once both operands are known to be floats
+FLOAT_OPERATORS = {
+    TokenType.MINUS: op.sub,
+    TokenType.SLASH: op.truediv,
+    TokenType.STAR: op.mul,
+    TokenType.PLUS: op.add,
+    TokenType.GREATER: op.gt,
+    TokenType.GREATER_EQUAL: op.ge,
+    TokenType.LESS: op.lt,
+    TokenType.LESS_EQUAL: op.le,
+}
+
+
+# Lox numbers are floats, but dividing by zero is a runtime error rather than
+# Python's ZeroDivisionError. The engines' fast paths divide directly and only
+# call this for a zero divisor (or, like the slow paths, for validated operands).
+def checked_divide(operator: Token, left: float, right: float) -> float:
+    if not right:
+        raise PyloxRuntimeError(operator, "Division by zero.")
+    return left / right
+
+
+def validate_number(operator: Token, *operands):
+    for o in operands:
+        try:
+            float(o)
+        except:
+            raise PyloxRuntimeError(operator, f"{stringify(o)} must be a number")
+
+
+# concatenations producing at least this many characters build a Rope
+ROPE_THRESHOLD = 256
+
+# first characters of the (ASCII) strings float() may accept
+_NUMERIC_START = frozenset("0123456789+-. \t\n\r\x0b\x0ciInN")
+
+
+def validate_plus(operator: Token, left, right):
+    if type(left) is float and type(right) is float:
+        return left + right
+    left_type, right_type = type(left), type(right)
+    if (left_type is str or left_type is Rope) and (
+        right_type is str or right_type is Rope
+    ):
+        # strings that read as numbers are added as numbers (ropes never are),
+        # the prefilter avoids an exception from float() for most strings
+        if (
+            left_type is str
+            and right_type is str
+            and left[:1] in _NUMERIC_START
+            and right[:1] in _NUMERIC_START
+        ):
+            try:
+                return float(left) + float(right)
+            except ValueError:
+                pass
+        return concat(left, right)
+
+    try:
+        lf = float(left)
+        rf = float(right)
+        return lf + rf
+    except:
+        # TODO not really sure if this is right, but the book doesn't give any examples
+        if isinstance(left, (str, Rope)):
+            raise PyloxRuntimeError(
+                operator,
+                f"{stringify(left)} and {stringify(right)} must both be strings",
+            )
+        else:
+            raise PyloxRuntimeError(
+                operator,
+                f"{stringify(left)} and {stringify(right)} must both a numbers",
+            )
+
+
+def concat(left, right):
+    if type(right) is Rope:
+        right = str(right)
+    if type(left) is Rope:
+        return left.append(right)
+    if len(left) + len(right) >= ROPE_THRESHOLD:
+        return Rope.of(left, right)
+    return left + right
+
+
+# nil and false are falsey, every other value (0 and "" included) is truthy
+def is_truthy(value) -> bool:
+    return value is not None and value is not False
+
+
+# Values of different types are never equal in Lox (1 != "1", true != 1, nil
+# only equals nil), otherwise numbers, strings and bools compare natively.
+# Nothing is converted or allocated.
+def is_equal(left, right) -> bool:
+    if left is right:
+        return True
+    if type(left) is Rope:
+        left = str(left)
+    if type(right) is Rope:
+        right = str(right)
+    if type(left) is not type(right):
+        return False
+    return left == right
+
+
+# below this str() prints integral floats as "123.0" rather than "1e+16"
+_INTEGRAL_LIMIT = 1e16
+
+
+def stringify(value) -> str:
+    if type(value) is str:
+        return value
+    if type(value) is Rope:
+        return str(value)
+    if type(value) is float:
+        # integral numbers are formatted as ints directly, the rest (and -0.0,
+        # which "%d" would print as "0") go through str()
+        if value and value.is_integer() and -_INTEGRAL_LIMIT < value < _INTEGRAL_LIMIT:
+            return "%d" % value
+        text = str(value)
+        return text[:-2] if text.endswith(".0") else text
+    if value is None:
+        return "nil"
+    return str(value)
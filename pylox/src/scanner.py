@@ -1,12 +1,21 @@
 from .errors import ErrorReporter
+from .intern import InternTable
 from .token_type import TokenType, get_keyword
 from .tokens import Token
 
 
 class Scanner:
-    def __init__(self, source: str, error_reporter: ErrorReporter):
+    def __init__(
+        self,
+        source: str,
+        error_reporter: ErrorReporter,
+        interner: InternTable | None = None,
+    ):
         self.source = source
         self.error_reporter: ErrorReporter = error_reporter
+        # identifiers and strings are interned, in a table of their own unless
+        # one is shared with other scanners
+        self.interner = interner if interner is not None else InternTable()
         self.tokens: list[Token] = []
         self.line: int = 1
         self.start: int = 0
@@ -114,7 +123,10 @@ class Scanner:
             return
 
         self.advance()
-        self.add_token(TokenType.STRING, self.source[self.start + 1 : self.current - 1])
+        intern = self.interner.intern
+        lexeme = intern(self.source[self.start : self.current])
+        literal = intern(self.source[self.start + 1 : self.current - 1])
+        self.tokens.append(Token(TokenType.STRING, lexeme, literal, self.line))
 
     def add_number(self):
         while self.is_digit(self.peek()):
@@ -125,17 +137,15 @@ class Scanner:
             while self.is_digit(self.peek()):
                 self.advance()
 
-        self.add_token(TokenType.NUMBER, self.source[self.start : self.current])
+        self.add_token(TokenType.NUMBER, float(self.source[self.start : self.current]))
 
     def add_identifier(self):
         while (peek := self.peek()) and self.is_alpha(peek) or self.is_digit(peek):
             self.advance()
 
-        identifier = self.source[self.start : self.current]
-        if keyword := get_keyword(identifier):
-            self.add_token(keyword, identifier)
-        else:
-            self.add_token(TokenType.IDENTIFIER, identifier)
+        identifier = self.interner.intern(self.source[self.start : self.current])
+        token_type = get_keyword(identifier) or TokenType.IDENTIFIER
+        self.tokens.append(Token(token_type, identifier, identifier, self.line))
 
     # check if the next character matches, if so consume it and return True else return False
     def match(self, next_c: str) -> bool:
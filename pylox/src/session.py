@@ -0,0 +1,133 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from .environment import Environment
+from .errors import ErrorReporter, PyloxRuntimeError
+from .fast_scanner import FastScanner
+from .interpreter import Interpreter
+from .optimizer import Optimizer
+from .output import MemorySink
+from .parser import PrattParser
+from .resolver import Resolver
+from .token_type import TokenType
+from .tokens import Token
+
+DEFAULT_CACHE_SIZE = 256
+TOO_DEEP = "Expression nested too deeply."
+
+
+@dataclass(frozen=True)
+class LoxError:
+    # "scan", "parse" or "runtime" ("internal" for a failure of pylox itself,
+    # at line 0, see batch.run_script)
+    kind: str
+    line: int
+    message: str
+
+    def __str__(self):
+        return f"[line {self.line}] {self.kind} error: {self.message}"
+
+
+@dataclass
+class ExecutionResult:
+    output: list[str] = field(default_factory=list)
+    errors: list[LoxError] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+# ErrorReporter recording structured errors instead of printing them
+class CollectingErrorReporter(ErrorReporter):
+    def __init__(self):
+        super().__init__()
+        self.errors: list[LoxError] = []
+
+    def reset(self):
+        self.had_error = False
+        self.had_runtime_error = False
+        self.errors = []
+
+    def error(self, line: int, message: str):
+        self.errors.append(LoxError("scan", line, message))
+        self.had_error = True
+
+    def parse_error(self, token: Token, message: str):
+        where = "end" if token.type == TokenType.EOF else f"'{token.lexeme}'"
+        self.errors.append(LoxError("parse", token.line, f"at {where}: {message}"))
+        self.had_error = True
+
+    def runtime_error(self, err: PyloxRuntimeError):
+        self.errors.append(LoxError("runtime", err.token.line, err.message))
+        self.had_runtime_error = True
+
+
+# Embeddable interpreter. The Interpreter and its globals live as long as the
+# session, so a variable defined by one execute() call is visible to the next.
+# Nothing is printed: the output of print statements and the errors of each
+# call are returned in an ExecutionResult. Programs that parsed cleanly are
+# kept (already resolved) in an LRU cache keyed by source, so running the same
+# snippet again skips scanning, parsing and resolution.
+#
+# engine is any of the execution engines taking (err_reporter, output).
+# Expressions nested deeper than the recursive parser and engines can handle
+# are reported as errors too, the session stays usable whatever it's given.
+class LoxSession:
+    def __init__(
+        self,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        optimize: bool = False,
+        engine=Interpreter,
+    ):
+        self.cache_size = cache_size
+        self.optimize = optimize
+        self._errors = CollectingErrorReporter()
+        self._output = MemorySink()
+        self._interpreter = engine(self._errors, self._output)
+        self._cache: OrderedDict[str, list] = OrderedDict()
+
+    # an Environment, or the dict of the VM
+    @property
+    def globals(self) -> Environment | dict:
+        return self._interpreter.globals
+
+    def is_cached(self, source: str) -> bool:
+        return source in self._cache
+
+    def execute(self, source: str) -> ExecutionResult:
+        self._errors.reset()
+
+        statements = self._parse(source)
+        if statements is not None:
+            try:
+                self._interpreter.interpret(statements)
+            except RecursionError:
+                line = source.count("\n") + 1
+                self._errors.errors.append(LoxError("runtime", line, TOO_DEEP))
+        return ExecutionResult(self._output.take(), self._errors.errors)
+
+    def _parse(self, source: str):
+        statements = self._cache.get(source)
+        if statements is not None:
+            self._cache.move_to_end(source)
+            return statements
+
+        tokens = FastScanner(source, self._errors).scan_tokens()
+        parser = PrattParser(self._errors, tokens)
+        try:
+            statements = parser.parse()
+        except RecursionError:
+            self._errors.parse_error(parser._peek(), TOO_DEEP)
+            return None
+        if self._errors.had_error:
+            return None
+        if self.optimize:
+            statements = Optimizer().optimize(statements)
+        Resolver().resolve(statements)
+
+        if self.cache_size > 0:
+            self._cache[source] = statements
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return statements
@@ -0,0 +1,196 @@
+from .environment import Environment
+from .errors import PyloxRuntimeError
+from .expr import ASSIGN, BINARY, GROUPING, LITERAL, UNARY, VARIABLE
+from .interpreter import Interpreter
+from .runtime import FLOAT_OPERATORS, checked_divide, is_truthy, stringify
+from .stmt import BLOCK, EXPRESSION, PRINT, VAR
+from .token_type import TokenType
+
+# Instructions of the flattened program, each one is an (op, argument) pair
+CONSTANT = 0  # argument: the value
+GET_GLOBAL = 1  # argument: name token
+GET_LOCAL = 2  # argument: slot in the current scope
+GET_AT = 3  # argument: (depth, slot)
+SET_GLOBAL = 4  # argument: name token
+SET_LOCAL = 5  # argument: slot in the current scope
+SET_AT = 6  # argument: (depth, slot)
+BINARY_OP = 7  # argument: (operator token, float operator or None)
+NEGATE = 8  # argument: operator token
+NOT = 9
+POP = 10
+PRINT_OP = 11
+DEFINE_GLOBAL = 12  # argument: name
+DEFINE_LOCAL = 13  # argument: slot in the current scope
+ENTER = 14  # argument: number of slots of the block
+EXIT = 15
+
+
+# Flattens Stmt/Expr trees to a list of instructions in post order. The tree is
+# walked from an explicit work stack holding both nodes still to visit and
+# instructions to emit once their operands are done, so there is no recursion
+# and no limit on how deep expressions or blocks can be nested.
+def linearize(statements: list) -> list[tuple]:
+    code: list[tuple] = []
+    emit = code.append
+    work = list(reversed(statements))
+    push = work.append
+
+    while work:
+        node = work.pop()
+        if type(node) is tuple:
+            emit(node)
+            continue
+
+        kind = node.kind
+        if kind == BINARY:
+            operator = node.operator
+            push((BINARY_OP, (operator, FLOAT_OPERATORS.get(operator.type))))
+            push(node.right)
+            push(node.left)
+        elif kind == LITERAL:
+            emit((CONSTANT, node.value))
+        elif kind == VARIABLE:
+            if node.depth is None:
+                emit((GET_GLOBAL, node.name))
+            elif node.depth == 0:
+                emit((GET_LOCAL, node.slot))
+            else:
+                emit((GET_AT, (node.depth, node.slot)))
+        elif kind == VAR:
+            if node.slot is None:
+                define = (DEFINE_GLOBAL, node.name.lexeme)
+            else:
+                define = (DEFINE_LOCAL, node.slot)
+            initializer = node.initializer
+            # the usual `var a;` and `var a = 1;` are emitted right away
+            if initializer is None:
+                emit((CONSTANT, None))
+                emit(define)
+            elif initializer.kind == LITERAL:
+                emit((CONSTANT, initializer.value))
+                emit(define)
+            else:
+                push(define)
+                push(initializer)
+        elif kind == BLOCK:
+            emit((ENTER, node.slot_count or 0))
+            push((EXIT, None))
+            work.extend(reversed(node.statements))
+        elif kind == GROUPING:
+            push(node.expression)
+        elif kind == UNARY:
+            operator = node.operator
+            if operator.type == TokenType.MINUS:
+                push((NEGATE, operator))
+            elif operator.type == TokenType.BANG:
+                push((NOT, None))
+            else:
+                push((CONSTANT, None))
+                push((POP, None))
+            push(node.right)
+        elif kind == ASSIGN:
+            if node.depth is None:
+                push((SET_GLOBAL, node.name))
+            elif node.depth == 0:
+                push((SET_LOCAL, node.slot))
+            else:
+                push((SET_AT, (node.depth, node.slot)))
+            push(node.value)
+        elif kind == EXPRESSION:
+            push((POP, None))
+            push(node.expression)
+        elif kind == PRINT:
+            push((PRINT_OP, None))
+            push(node.expression)
+    return code
+
+
+# Runs the linearized program with a value stack instead of recursing through
+# the visitor, so deep trees don't hit Python's recursion limit and don't pay
+# for a Python call per node. Semantics, errors and output are the same as the
+# Interpreter it extends, whose slow paths it reuses for anything but floats.
+#
+# Flattening costs about as much as a walk of the tree, and Lox has no loops
+# to run the flattened code more than once. So interpret() mostly buys depth:
+# on programs made of nested blocks (see bench_stack_interpreter) it is a bit
+# slower than the Interpreter, run() on code already flattened is not.
+class StackInterpreter(Interpreter):
+    def compile(self, statements: list) -> list[tuple]:
+        return linearize(statements)
+
+    def interpret(self, statements: list):
+        self.run(self.compile(statements))
+
+    def run(self, code: list[tuple]):
+        previous = self.env
+        try:
+            self._run(code)
+        except PyloxRuntimeError as err:
+            # buffered output comes before the error
+            if self.output is not None:
+                self.output.flush()
+            self.err_reporter.runtime_error(err)
+        finally:
+            # a runtime error can leave the program inside a block
+            self.env = previous
+
+    def _run(self, code: list[tuple]):
+        stack: list = []
+        push = stack.append
+        pop = stack.pop
+        env = self.env
+        # environments of the blocks being run, EXIT goes back to the last one
+        scopes: list[Environment] = []
+        output = self.output
+
+        for op, arg in code:
+            if op == BINARY_OP:
+                right = pop()
+                left = stack[-1]
+                operator, float_op = arg
+                if (
+                    float_op is not None
+                    and type(left) is float
+                    and type(right) is float
+                ):
+                    try:
+                        stack[-1] = float_op(left, right)
+                    except ZeroDivisionError:
+                        checked_divide(operator, left, right)
+                else:
+                    stack[-1] = self._binary(operator, left, right)
+            elif op == CONSTANT:
+                push(arg)
+            elif op == GET_LOCAL:
+                push(env.slots[arg])
+            elif op == GET_GLOBAL:
+                push(env.get(arg))
+            elif op == GET_AT:
+                push(env.get_at(*arg))
+            elif op == SET_LOCAL:
+                env.slots[arg] = stack[-1]
+            elif op == SET_GLOBAL:
+                env.assign(arg, stack[-1])
+            elif op == SET_AT:
+                env.assign_at(arg[0], arg[1], stack[-1])
+            elif op == POP:
+                pop()
+            elif op == DEFINE_LOCAL:
+                env.slots[arg] = pop()
+            elif op == DEFINE_GLOBAL:
+                env.define(arg, pop())
+            elif op == ENTER:
+                scopes.append(env)
+                env = self.env = Environment(env, arg)
+            elif op == EXIT:
+                env = self.env = scopes.pop()
+            elif op == PRINT_OP:
+                # print() is looked up on every call so it can be patched
+                if output is None:
+                    print(stringify(pop()))
+                else:
+                    output.write(stringify(pop()))
+            elif op == NEGATE:
+                stack[-1] = self._unary(arg, stack[-1])
+            elif op == NOT:
+                stack[-1] = not is_truthy(stack[-1])
@@ -1,8 +1,16 @@
+BLOCK = 6
+EXPRESSION = 7
+PRINT = 8
+VAR = 9
 
 
 class Block:
+    __slots__ = ("statements", "slot_count",)
+    kind = BLOCK
+
     def __init__(self, statements):
         self.statements = statements
+        self.slot_count = None
 
     def accept(self, visitor):
         return visitor.visit_block_stmt(self)
@@ -12,7 +20,14 @@ class Block:
             self.statements == other.statements 
         )
 
+    def __repr__(self):
+        return f"Block(statements={self.statements!r})"
+
+
 class Expression:
+    __slots__ = ("expression",)
+    kind = EXPRESSION
+
     def __init__(self, expression):
         self.expression = expression
 
@@ -24,7 +39,14 @@ class Expression:
             self.expression == other.expression 
         )
 
+    def __repr__(self):
+        return f"Expression(expression={self.expression!r})"
+
+
 class Print:
+    __slots__ = ("expression",)
+    kind = PRINT
+
     def __init__(self, expression):
         self.expression = expression
 
@@ -36,10 +58,18 @@ class Print:
             self.expression == other.expression 
         )
 
+    def __repr__(self):
+        return f"Print(expression={self.expression!r})"
+
+
 class Var:
+    __slots__ = ("name", "initializer", "slot",)
+    kind = VAR
+
     def __init__(self, name, initializer):
         self.name = name
         self.initializer = initializer
+        self.slot = None
 
     def accept(self, visitor):
         return visitor.visit_var_stmt(self)
@@ -48,4 +78,8 @@ class Var:
         return (
             self.name == other.name and
             self.initializer == other.initializer 
-        )
\ No newline at end of file
+        )
+
+    def __repr__(self):
+        return f"Var(name={self.name!r}, initializer={self.initializer!r})"
+
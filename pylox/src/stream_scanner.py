@@ -0,0 +1,64 @@
+from collections import deque
+from typing import Iterator, TextIO
+
+from .errors import ErrorReporter
+from .fast_scanner import TOKEN_PATTERN, tokenize
+from .intern import InternTable
+from .tokens import Token
+
+CHUNK_SIZE = 64 * 1024
+
+
+# Lazily scans a file object, reading it chunk_size characters at a time. Only
+# the unconsumed tail of the current chunk is kept in memory, so the tokens
+# can be consumed while the rest of the file is still unread. Names and
+# strings are only interned in the given table (see tokenize).
+def scan_stream(
+    file: TextIO,
+    error_reporter: ErrorReporter,
+    chunk_size: int = CHUNK_SIZE,
+    interner: InternTable | None = None,
+) -> Iterator[Token]:
+    return tokenize(_stream_matches(file, chunk_size), error_reporter, 1, interner)
+
+
+def _stream_matches(file: TextIO, chunk_size: int):
+    buffer = ""
+    pos = 0
+    at_eof = False
+
+    while True:
+        match = TOKEN_PATTERN.match(buffer, pos)
+        # a match that reaches the last character might continue in the next
+        # chunk (identifiers, strings, `1.` followed by `5`, `!` followed by
+        # `=`), so it is only accepted once more input is available
+        if match is None or match.end() + 1 >= len(buffer):
+            if not at_eof:
+                chunk = file.read(chunk_size)
+                at_eof = not chunk
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                continue
+            if match is None:
+                return
+        pos = match.end()
+        yield match
+
+
+# Bounded lookahead buffer letting Parser consume a token iterator as if it
+# was a list. Only the last `size` tokens are kept, which is plenty since the
+# parser looks at most one token back (_previous) and at the current one (_peek).
+class TokenWindow:
+    def __init__(self, tokens: Iterator[Token], size: int = 8):
+        self._tokens = tokens
+        self._window: deque[Token] = deque(maxlen=size)
+        self._end = 0
+
+    def __getitem__(self, index: int) -> Token:
+        while index >= self._end:
+            self._window.append(next(self._tokens))
+            self._end += 1
+        start = self._end - len(self._window)
+        if index < start:
+            raise IndexError(f"token {index} is no longer buffered")
+        return self._window[index - start]
@@ -0,0 +1,118 @@
+from array import array
+
+from .errors import ErrorReporter
+from .fast_scanner import OPERATORS, TOKEN_PATTERN
+from .intern import InternTable
+from .token_type import KEYWORDS, TOKEN_TYPES, TokenType
+from .tokens import Token
+
+# TokenType by value, the buffer stores the values (no TokenType has value 0,
+# EOF only fills the list)
+_TOKEN_TYPES = [TokenType.EOF] * (max(t.value for t in TOKEN_TYPES) + 1)
+for _token_type in TOKEN_TYPES:
+    _TOKEN_TYPES[_token_type.value] = _token_type
+
+_HAS_LEXEME_LITERAL = {TokenType.IDENTIFIER, *KEYWORDS.values()}
+
+
+# Compact storage for the tokens of a source: parallel arrays of token type
+# values, source offsets, lengths and lines, about 13 bytes per token instead
+# of a Token object and its lexeme. Lexemes and literals are sliced from the
+# source when asked for.
+#
+# Parser checks types through type_at() and only builds Tokens (through
+# indexing, like a list) for the ones it keeps in the tree.
+class TokenBuffer:
+    def __init__(self, source: str):
+        self.source = source
+        self.types = array("B")
+        self.starts = array("I")
+        self.lengths = array("I")
+        self.lines = array("I")
+        # the Tokens built for identifiers share their lexeme
+        self._interner = InternTable()
+
+    def append(self, token_type: TokenType, start: int, length: int, line: int):
+        self.types.append(token_type.value)
+        self.starts.append(start)
+        self.lengths.append(length)
+        self.lines.append(line)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def type_at(self, index: int) -> TokenType:
+        return _TOKEN_TYPES[self.types[index]]
+
+    def lexeme(self, index: int) -> str:
+        start = self.starts[index]
+        return self.source[start : start + self.lengths[index]]
+
+    def literal(self, index: int):
+        token_type = _TOKEN_TYPES[self.types[index]]
+        if token_type == TokenType.NUMBER:
+            return float(self.lexeme(index))
+        if token_type == TokenType.STRING:
+            start = self.starts[index]
+            return self.source[start + 1 : start + self.lengths[index] - 1]
+        if token_type in _HAS_LEXEME_LITERAL:
+            return self._interner.intern(self.lexeme(index))
+        return None
+
+    def __getitem__(self, index: int) -> Token:
+        token_type = _TOKEN_TYPES[self.types[index]]
+        lexeme = self.lexeme(index)
+        if token_type in _HAS_LEXEME_LITERAL:
+            lexeme = self._interner.intern(lexeme)
+            return Token(token_type, lexeme, lexeme, self.lines[index])
+        return Token(token_type, lexeme, self.literal(index), self.lines[index])
+
+
+# Scans straight into a TokenBuffer, with the same tokens, lines and errors as
+# Scanner and FastScanner but without creating Token objects
+class CompactScanner:
+    def __init__(self, source: str, error_reporter: ErrorReporter):
+        self.source = source
+        self.error_reporter = error_reporter
+
+    def scan_tokens(self) -> TokenBuffer:
+        buffer = TokenBuffer(self.source)
+        add_type = buffer.types.append
+        add_start = buffer.starts.append
+        add_length = buffer.lengths.append
+        add_line = buffer.lines.append
+
+        def append(token_type: TokenType, start: int, length: int, line: int):
+            add_type(token_type.value)
+            add_start(start)
+            add_length(length)
+            add_line(line)
+
+        keyword = KEYWORDS.get
+        line = 1
+
+        for match in TOKEN_PATTERN.finditer(self.source):
+            kind = match.lastgroup
+            if kind == "whitespace" or kind == "comment":
+                continue
+            start, end = match.span()
+            if kind == "operator":
+                append(OPERATORS[match.group()], start, end - start, line)
+            elif kind == "identifier":
+                token_type = keyword(match.group(), TokenType.IDENTIFIER)
+                append(token_type, start, end - start, line)
+            elif kind == "newline":
+                line += 1
+            elif kind == "number":
+                append(TokenType.NUMBER, start, end - start, line)
+            elif kind == "string":
+                line += self.source.count("\n", start, end)
+                if end - start > 1 and self.source[end - 1] == '"':
+                    append(TokenType.STRING, start, end - start, line)
+                else:
+                    self.error_reporter.error(line, "Unterminated string")
+            else:
+                self.error_reporter.error(line, "Unexpected character")
+
+        append(TokenType.EOF, len(self.source), 0, line)
+        return buffer
@@ -1,74 +1,100 @@
-import enum
-from typing import Optional
+# Kinds of Token. Not an enum.Enum: importing enum and building the class is
+# a noticeable part of starting pylox. The class body lists the values, which
+# are then replaced by one TokenType per kind, having a name and a value like
+# enum members. Members compare by identity.
+class TokenType:
+    __slots__ = ("name", "value")
 
-
-class TokenType(enum.Enum):
     # Single Characters
-    LEFT_PAREN = enum.auto()
-    RIGHT_PAREN = enum.auto()
-    LEFT_BRACE = enum.auto()
-    RIGHT_BRACE = enum.auto()
-    COMMA = enum.auto()
-    DOT = enum.auto()
-    MINUS = enum.auto()
-    PLUS = enum.auto()
-    SEMICOLON = enum.auto()
-    SLASH = enum.auto()
-    STAR = enum.auto()
+    LEFT_PAREN = 1
+    RIGHT_PAREN = 2
+    LEFT_BRACE = 3
+    RIGHT_BRACE = 4
+    COMMA = 5
+    DOT = 6
+    MINUS = 7
+    PLUS = 8
+    SEMICOLON = 9
+    SLASH = 10
+    STAR = 11
 
     # One of two characters
-    BANG = enum.auto()
-    BANG_EQUAL = enum.auto()
-    EQUAL = enum.auto()
-    EQUAL_EQUAL = enum.auto()
-    GREATER = enum.auto()
-    GREATER_EQUAL = enum.auto()
-    LESS = enum.auto()
-    LESS_EQUAL = enum.auto()
+    BANG = 12
+    BANG_EQUAL = 13
+    EQUAL = 14
+    EQUAL_EQUAL = 15
+    GREATER = 16
+    GREATER_EQUAL = 17
+    LESS = 18
+    LESS_EQUAL = 19
 
     # Literals
-    IDENTIFIER = enum.auto()
-    STRING = enum.auto()
-    NUMBER = enum.auto()
+    IDENTIFIER = 20
+    STRING = 21
+    NUMBER = 22
 
     # Keywords
-    AND = enum.auto()
-    CLASS = enum.auto()
-    ELSE = enum.auto()
-    FALSE = enum.auto()
-    FUNC = enum.auto()  # variation from the book
-    FOR = enum.auto()
-    IF = enum.auto()
-    NIL = enum.auto()
-    OR = enum.auto()
-    PRINT = enum.auto()
-    RETURN = enum.auto()
-    SUPER = enum.auto()
-    THIS = enum.auto()
-    TRUE = enum.auto()
-    VAR = enum.auto()
-    WHILE = enum.auto()
+    AND = 23
+    CLASS = 24
+    ELSE = 25
+    FALSE = 26
+    FUNC = 27  # variation from the book
+    FOR = 28
+    IF = 29
+    NIL = 30
+    OR = 31
+    PRINT = 32
+    RETURN = 33
+    SUPER = 34
+    THIS = 35
+    TRUE = 36
+    VAR = 37
+    WHILE = 38
+
+    EOF = 39
+
+    def __init__(self, name: str, value: int):
+        self.name = name
+        self.value = value
+
+    def __repr__(self):
+        return f"<TokenType.{self.name}: {self.value}>"
+
+    def __str__(self):
+        return f"TokenType.{self.name}"
+
+    # unpickles to the same member
+    def __reduce__(self):
+        return getattr, (TokenType, self.name)
+
+
+# every TokenType, by value
+TOKEN_TYPES: list[TokenType] = []
+for _name, _value in list(vars(TokenType).items()):
+    if type(_value) is int:
+        _member = TokenType(_name, _value)
+        setattr(TokenType, _name, _member)
+        TOKEN_TYPES.append(_member)
 
-    EOF = enum.auto()
+KEYWORDS = {
+    "and": TokenType.AND,
+    "class": TokenType.CLASS,
+    "else": TokenType.ELSE,
+    "false": TokenType.FALSE,
+    "func": TokenType.FUNC,  # variation from the book
+    "for": TokenType.FOR,
+    "if": TokenType.IF,
+    "nil": TokenType.NIL,
+    "or": TokenType.OR,
+    "print": TokenType.PRINT,
+    "return": TokenType.RETURN,
+    "super": TokenType.SUPER,
+    "this": TokenType.THIS,
+    "true": TokenType.TRUE,
+    "var": TokenType.VAR,
+    "while": TokenType.WHILE,
+}
 
 
-def get_keyword(c: str) -> Optional[TokenType]:
-    keywords = {
-        "and": TokenType.AND,
-        "class": TokenType.CLASS,
-        "else": TokenType.ELSE,
-        "false": TokenType.FALSE,
-        "func": TokenType.FUNC,  # variation from the book
-        "for": TokenType.FOR,
-        "if": TokenType.IF,
-        "nil": TokenType.NIL,
-        "or": TokenType.OR,
-        "print": TokenType.PRINT,
-        "return": TokenType.RETURN,
-        "super": TokenType.SUPER,
-        "this": TokenType.THIS,
-        "true": TokenType.TRUE,
-        "var": TokenType.VAR,
-        "while": TokenType.WHILE
-    }
-    return keywords.get(c)
+def get_keyword(c: str) -> TokenType | None:
+    return KEYWORDS.get(c)
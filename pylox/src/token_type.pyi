@@ -0,0 +1,62 @@
+# Type stub for token_type.py: the members are assigned as ints in the class
+# body and only then replaced by TokenTypes, which a type checker can't follow.
+from typing import ClassVar
+
+class TokenType:
+    name: str
+    value: int
+
+    # Single Characters
+    LEFT_PAREN: ClassVar[TokenType]
+    RIGHT_PAREN: ClassVar[TokenType]
+    LEFT_BRACE: ClassVar[TokenType]
+    RIGHT_BRACE: ClassVar[TokenType]
+    COMMA: ClassVar[TokenType]
+    DOT: ClassVar[TokenType]
+    MINUS: ClassVar[TokenType]
+    PLUS: ClassVar[TokenType]
+    SEMICOLON: ClassVar[TokenType]
+    SLASH: ClassVar[TokenType]
+    STAR: ClassVar[TokenType]
+
+    # One of two characters
+    BANG: ClassVar[TokenType]
+    BANG_EQUAL: ClassVar[TokenType]
+    EQUAL: ClassVar[TokenType]
+    EQUAL_EQUAL: ClassVar[TokenType]
+    GREATER: ClassVar[TokenType]
+    GREATER_EQUAL: ClassVar[TokenType]
+    LESS: ClassVar[TokenType]
+    LESS_EQUAL: ClassVar[TokenType]
+
+    # Literals
+    IDENTIFIER: ClassVar[TokenType]
+    STRING: ClassVar[TokenType]
+    NUMBER: ClassVar[TokenType]
+
+    # Keywords
+    AND: ClassVar[TokenType]
+    CLASS: ClassVar[TokenType]
+    ELSE: ClassVar[TokenType]
+    FALSE: ClassVar[TokenType]
+    FUNC: ClassVar[TokenType]  # variation from the book
+    FOR: ClassVar[TokenType]
+    IF: ClassVar[TokenType]
+    NIL: ClassVar[TokenType]
+    OR: ClassVar[TokenType]
+    PRINT: ClassVar[TokenType]
+    RETURN: ClassVar[TokenType]
+    SUPER: ClassVar[TokenType]
+    THIS: ClassVar[TokenType]
+    TRUE: ClassVar[TokenType]
+    VAR: ClassVar[TokenType]
+    WHILE: ClassVar[TokenType]
+
+    EOF: ClassVar[TokenType]
+
+    def __init__(self, name: str, value: int) -> None: ...
+
+TOKEN_TYPES: list[TokenType]
+KEYWORDS: dict[str, TokenType]
+
+def get_keyword(c: str) -> TokenType | None: ...
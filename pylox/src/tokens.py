@@ -1,15 +1,35 @@
-from dataclasses import dataclass
-from typing import Optional
-
 from .token_type import TokenType
 
 
-@dataclass
+# A plain class rather than a dataclass, which would cost its construction at
+# every startup. Compares, prints and pickles like the dataclass did.
 class Token:
-    type: TokenType
-    lexeme: str
-    literal: Optional[str]
-    line: int
+    __slots__ = ("type", "lexeme", "literal", "line")
+
+    def __init__(
+        self, type: TokenType, lexeme: str, literal: str | float | None, line: int
+    ):
+        self.type = type
+        self.lexeme = lexeme
+        self.literal = literal
+        self.line = line
+
+    # defining __eq__ leaves Token unhashable, like the dataclass: it's mutable
+    def __eq__(self, other):
+        if other.__class__ is not Token:
+            return NotImplemented
+        return (
+            self.type == other.type
+            and self.lexeme == other.lexeme
+            and self.literal == other.literal
+            and self.line == other.line
+        )
+
+    def __repr__(self):
+        return (
+            f"Token(type={self.type!r}, lexeme={self.lexeme!r}, "
+            f"literal={self.literal!r}, line={self.line!r})"
+        )
 
     def __str__(self):
         return f"{self.type} {self.lexeme} {self.literal}"
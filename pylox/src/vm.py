@@ -0,0 +1,192 @@
+from .bytecode import (
+    OP_ADD,
+    OP_CONSTANT,
+    OP_DEFINE_GLOBAL,
+    OP_DIVIDE,
+    OP_EQUAL,
+    OP_FALSE,
+    OP_GET_GLOBAL,
+    OP_GET_LOCAL,
+    OP_GREATER,
+    OP_GREATER_EQUAL,
+    OP_LESS,
+    OP_LESS_EQUAL,
+    OP_MULTIPLY,
+    OP_NEGATE,
+    OP_NIL,
+    OP_NOT,
+    OP_NOT_EQUAL,
+    OP_POP,
+    OP_POPN,
+    OP_PRINT,
+    OP_RETURN,
+    OP_SET_GLOBAL,
+    OP_SET_LOCAL,
+    OP_SUBTRACT,
+    OP_TRUE,
+    Chunk,
+)
+from .compiler import Compiler
+from .errors import PyloxRuntimeError, ErrorReporter
+from .runtime import (
+    checked_divide,
+    is_equal,
+    is_truthy,
+    stringify,
+    validate_number,
+    validate_plus,
+)
+
+# only for type checkers, like in interpreter.py
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .output import OutputSink
+
+
+# Stack based virtual machine executing the Chunks produced by Compiler
+class VM:
+    def __init__(self, err_reporter: ErrorReporter, output: "OutputSink | None" = None):
+        self.err_reporter = err_reporter
+        self.output = output
+        self.globals: dict[str, object] = dict()
+
+    def interpret(self, statements: list):
+        chunk = Compiler(self.err_reporter).compile(statements)
+        if chunk is not None:
+            self.run(chunk)
+
+    def run(self, chunk: Chunk):
+        try:
+            self._run(chunk)
+        except PyloxRuntimeError as err:
+            if self.output is not None:
+                self.output.flush()
+            self.err_reporter.runtime_error(err)
+
+    def _run(self, chunk: Chunk):
+        code = chunk.code
+        constants = chunk.constants
+        tokens = chunk.tokens
+        variables = self.globals
+        stack: list = []
+        push = stack.append
+        pop = stack.pop
+        ip = 0
+
+        # the most frequent instructions are tested first
+        while True:
+            instruction = code[ip]
+
+            if instruction == OP_GET_LOCAL:
+                push(stack[code[ip + 1] << 8 | code[ip + 2]])
+                ip += 3
+            elif instruction == OP_CONSTANT:
+                push(constants[code[ip + 1] << 8 | code[ip + 2]])
+                ip += 3
+            # arithmetic and comparison opcodes are numbered contiguously
+            elif OP_ADD <= instruction <= OP_LESS_EQUAL:
+                right = pop()
+                left = stack[-1]
+                if type(left) is float and type(right) is float:
+                    if instruction == OP_ADD:
+                        stack[-1] = left + right
+                    elif instruction == OP_SUBTRACT:
+                        stack[-1] = left - right
+                    elif instruction == OP_MULTIPLY:
+                        stack[-1] = left * right
+                    elif instruction == OP_DIVIDE:
+                        if not right:
+                            checked_divide(tokens[ip], left, right)
+                        stack[-1] = left / right
+                    elif instruction == OP_GREATER:
+                        stack[-1] = left > right
+                    elif instruction == OP_GREATER_EQUAL:
+                        stack[-1] = left >= right
+                    elif instruction == OP_LESS:
+                        stack[-1] = left < right
+                    else:
+                        stack[-1] = left <= right
+                else:
+                    stack[-1] = self._slow_binary(instruction, tokens[ip], left, right)
+                ip += 1
+            elif instruction == OP_SET_LOCAL:
+                stack[code[ip + 1] << 8 | code[ip + 2]] = stack[-1]
+                ip += 3
+            elif instruction == OP_POP:
+                pop()
+                ip += 1
+            elif instruction == OP_GET_GLOBAL:
+                name = constants[code[ip + 1] << 8 | code[ip + 2]]
+                if name not in variables:
+                    raise PyloxRuntimeError(tokens[ip], f"Undefined variable {name}.")
+                push(variables[name])
+                ip += 3
+            elif instruction == OP_SET_GLOBAL:
+                name = constants[code[ip + 1] << 8 | code[ip + 2]]
+                if name not in variables:
+                    raise PyloxRuntimeError(tokens[ip], f"Undefined variable {name}.")
+                variables[name] = stack[-1]
+                ip += 3
+            elif instruction == OP_DEFINE_GLOBAL:
+                variables[constants[code[ip + 1] << 8 | code[ip + 2]]] = pop()
+                ip += 3
+            elif instruction == OP_PRINT:
+                if self.output is None:
+                    print(stringify(pop()))
+                else:
+                    self.output.write(stringify(pop()))
+                ip += 1
+            elif instruction == OP_EQUAL:
+                right = pop()
+                stack[-1] = is_equal(stack[-1], right)
+                ip += 1
+            elif instruction == OP_NOT_EQUAL:
+                right = pop()
+                stack[-1] = not is_equal(stack[-1], right)
+                ip += 1
+            elif instruction == OP_NEGATE:
+                value = stack[-1]
+                if type(value) is not float:
+                    validate_number(tokens[ip], value)
+                    value = float(value)
+                stack[-1] = -value
+                ip += 1
+            elif instruction == OP_NOT:
+                stack[-1] = not is_truthy(stack[-1])
+                ip += 1
+            elif instruction == OP_NIL:
+                push(None)
+                ip += 1
+            elif instruction == OP_TRUE:
+                push(True)
+                ip += 1
+            elif instruction == OP_FALSE:
+                push(False)
+                ip += 1
+            elif instruction == OP_POPN:
+                del stack[len(stack) - (code[ip + 1] << 8 | code[ip + 2]) :]
+                ip += 3
+            elif instruction == OP_RETURN:
+                return
+            else:
+                raise RuntimeError(f"Unknown opcode {instruction} at {ip}")
+
+    # operands that aren't both floats go through the same validation as the interpreter
+    def _slow_binary(self, instruction: int, operator, left, right):
+        if instruction == OP_ADD:
+            return validate_plus(operator, left, right)
+        validate_number(operator, left, right)
+        left, right = float(left), float(right)
+        if instruction == OP_SUBTRACT:
+            return left - right
+        elif instruction == OP_MULTIPLY:
+            return left * right
+        elif instruction == OP_DIVIDE:
+            return checked_divide(operator, left, right)
+        elif instruction == OP_GREATER:
+            return left > right
+        elif instruction == OP_GREATER_EQUAL:
+            return left >= right
+        elif instruction == OP_LESS:
+            return left < right
+        return left <= right
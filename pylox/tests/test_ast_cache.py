@@ -0,0 +1,111 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src import ast_cache
+from src.ast_cache import AstCache
+from src.errors import ErrorReporter
+from src.optimizer import count_nodes
+from src.parser import Parser
+from src.scanner import Scanner
+
+SOURCE = """
+var a = 1.5;
+var b;
+var s = "text";
+{
+  var a = -a * (2 + 3) / 4;
+  b = a >= 1 == !nil;
+  print a != b;
+}
+print s + "!";
+a = b = true;
+"""
+
+
+def parse(source: str) -> list:
+    error_reporter = ErrorReporter()
+    tokens = Scanner(source, error_reporter).scan_tokens()
+    return Parser(error_reporter, tokens).parse()
+
+
+class AstCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = AstCache(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def entries(self) -> list[str]:
+        return sorted(os.listdir(self.directory.name))
+
+    def test_round_trip(self):
+        statements = parse(SOURCE)
+        self.cache.store(SOURCE, statements)
+
+        loaded = self.cache.load(SOURCE)
+        self.assertEqual(statements, loaded)
+        self.assertEqual(statements[2].name.line, loaded[2].name.line)
+
+    # deeper than both Python's recursion limit and marshal's nesting limit
+    def test_deeply_nested_program(self):
+        source = "{" * 3000 + "print -(1);" + "}" * 3000
+        self.cache.store(source, parse(source))
+
+        loaded = self.cache.load(source)
+        self.assertEqual(3004, count_nodes(loaded))
+        [node] = loaded
+        for _ in range(3000):
+            [node] = node.statements
+        self.assertEqual(parse("print -(1);"), [node])
+
+    def test_miss_for_unknown_source(self):
+        self.assertIsNone(self.cache.load(SOURCE))
+
+    def test_edited_source_misses(self):
+        self.cache.store(SOURCE, parse(SOURCE))
+        self.assertIsNone(self.cache.load(SOURCE + " "))
+
+    def test_version_change_misses(self):
+        self.cache.store(SOURCE, parse(SOURCE))
+        with patch.object(ast_cache, "VERSION", "pylox-ast-next"):
+            self.assertIsNone(self.cache.load(SOURCE))
+
+    def test_corrupt_entry_is_dropped(self):
+        self.cache.store(SOURCE, parse(SOURCE))
+        [entry] = self.entries()
+        with open(os.path.join(self.directory.name, entry), "wb") as file:
+            file.write(b"not marshal data")
+
+        self.assertIsNone(self.cache.load(SOURCE))
+        self.assertEqual([], self.entries())
+
+    def test_unwritable_directory_is_skipped(self):
+        # a file where the directory should be
+        path = os.path.join(self.directory.name, "file")
+        open(path, "w").close()
+        cache = AstCache(os.path.join(path, "cache"))
+
+        cache.store(SOURCE, parse(SOURCE))
+        self.assertIsNone(cache.load(SOURCE))
+
+    def test_evicts_least_recently_used(self):
+        sources = [f"print {i};" for i in range(3)]
+        for i, source in enumerate(sources):
+            self.cache.store(source, parse(source))
+            path = self.cache._path(source)
+            os.utime(path, (i, i))
+        entry_size = os.path.getsize(self.cache._path(sources[0]))
+
+        self.cache.max_bytes = 2 * entry_size
+        self.cache.evict()
+
+        self.assertIsNone(self.cache.load(sources[0]))
+        self.assertIsNotNone(self.cache.load(sources[1]))
+        self.assertIsNotNone(self.cache.load(sources[2]))
+
+
+if __name__ == "__main__":
+    unittest.main()
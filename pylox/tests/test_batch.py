@@ -0,0 +1,53 @@
+import unittest
+from unittest.mock import patch
+
+from src.batch import BatchExecutor, run_script
+from src.session import LoxError
+
+SCRIPTS = [
+    "var a = 1; print a;",
+    'print "a" + "b";',
+    "print a;",
+    "print ;",
+    "var a = 2; { var b = a * 3; print b; }",
+    "print 1 / 0;",
+]
+
+
+class BatchTest(unittest.TestCase):
+    def check_results(self, results):
+        self.assertEqual(
+            [["1"], ["ab"], [], [], ["6"], []], [result.output for result in results]
+        )
+        self.assertEqual(
+            [[], [], ["runtime"], ["parse"], [], ["runtime"]],
+            [[e.kind for e in result.errors] for result in results],
+        )
+
+    def test_run_script(self):
+        self.assertEqual(["3"], run_script("print 1 + 2;").output)
+
+    def test_threads(self):
+        with patch("builtins.print") as mock_print:
+            with BatchExecutor(4, mode="thread", chunksize=1) as executor:
+                results = executor.run(SCRIPTS * 20)
+        mock_print.assert_not_called()
+        self.check_results(results[:6])
+        self.assertEqual(results[:6] * 20, results)
+
+    def test_processes(self):
+        with BatchExecutor(2, mode="process") as executor:
+            self.check_results(executor.run(SCRIPTS))
+
+    def test_internal_failure_is_isolated(self):
+        with patch("src.batch.LoxSession.execute", side_effect=MemoryError("full")):
+            result = run_script("print 1;")
+        self.assertEqual([LoxError("internal", 0, "MemoryError: full")], result.errors)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            BatchExecutor(mode="fiber")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from benchmarks.suite import PHASES, regressions, run_suite, time_phases
+from benchmarks.workloads import WORKLOADS
+
+
+def result(size: int, best: float) -> dict:
+    stats = {"min": best, "median": best, "mean": best, "stdev": 0.0}
+    return {"size": size, **{phase: stats for phase in PHASES}}
+
+
+class BenchmarkSuiteTest(unittest.TestCase):
+    def test_workloads_run(self):
+        for name, (generate, _) in WORKLOADS.items():
+            with self.subTest(name):
+                times = time_phases(generate(20), repeat=2)
+                self.assertEqual(set(PHASES), set(times))
+                self.assertEqual([2, 2, 2], [len(times[p]) for p in PHASES])
+
+    def test_run_suite_scales_workloads(self):
+        results = run_suite(scale=0.01, repeat=1)
+
+        self.assertEqual(set(WORKLOADS), set(results))
+        for name, (_, size) in WORKLOADS.items():
+            self.assertEqual(max(1, int(size * 0.01)), results[name]["size"])
+
+    def test_regressions(self):
+        baseline = {"a": result(10, 1.0), "b": result(10, 1.0)}
+        results = {"a": result(10, 1.2), "b": result(10, 1.3)}
+
+        found = regressions(results, baseline, tolerance=0.25)
+        self.assertEqual(len(PHASES), len(found))
+        self.assertTrue(all(message.startswith("b ") for message in found))
+
+    def test_different_size_is_not_compared(self):
+        found = regressions({"a": result(20, 2.0)}, {"a": result(10, 1.0)})
+        self.assertEqual([], found)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from unittest.mock import patch
+
+import test_interpreter
+from src.closure_compiler import ClosureCompiler
+from src.errors import ErrorReporter
+from src.parser import Parser
+from src.resolver import Resolver
+from src.scanner import Scanner
+
+
+# runs every interpreter test against the closure compiler
+class TestClosureCompiler(test_interpreter.TestInterpreter):
+    engine = ClosureCompiler
+
+    @patch("builtins.print")
+    def test_compiled_program_can_be_rerun(self, mock_print):
+        error_reporter = ErrorReporter()
+        tokens = Scanner(
+            "var a = 1; { var b = a + 1; a = b * 2; } print a;", error_reporter
+        ).scan_tokens()
+        statements = Parser(error_reporter, tokens).parse()
+        Resolver().resolve(statements)
+
+        compiler = ClosureCompiler(error_reporter)
+        program = compiler.compile(statements)
+        compiler.run(program)
+        compiler.run(program)
+
+        printed = [call.args[0] for call in mock_print.call_args_list]
+        self.assertEqual(["4", "4"], printed)
+
+    @patch("builtins.print")
+    def test_reports_runtime_errors(self, mock_print):
+        error_reporter = ErrorReporter()
+        tokens = Scanner(
+            'print 1; print "a" - 1; print 2;', error_reporter
+        ).scan_tokens()
+        statements = Parser(error_reporter, tokens).parse()
+
+        ClosureCompiler(error_reporter).interpret(statements)
+
+        self.assertTrue(error_reporter.had_runtime_error)
+        self.assertNotIn("2", [call.args[0] for call in mock_print.call_args_list])
+
+
+if __name__ == "__main__":
+    unittest.main()
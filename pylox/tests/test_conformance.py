@@ -0,0 +1,126 @@
+import unittest
+from unittest.mock import patch
+
+from src.closure_compiler import ClosureCompiler
+from src.errors import ErrorReporter
+from src.interpreter import Interpreter
+from src.optimizer import Optimizer
+from src.parser import Parser
+from src.resolver import Resolver
+from src.scanner import Scanner
+from src.stack_interpreter import StackInterpreter
+from src.vm import VM
+
+# every engine has to produce exactly the same output as the tree-walking
+# Interpreter, runtime error messages included
+ENGINES = [Interpreter, StackInterpreter, ClosureCompiler, VM]
+
+PROGRAMS = {
+    "arithmetic": "print 1 + 2 * 3 - 4 / 8; print -(2 - 5) * 1.5; print 10 / 4;",
+    "comparison": "print 1 < 2; print 2 <= 2; print 3 > 4; print 4 >= 5;",
+    "equality": 'print 1 == 1; print "a" != "b"; print nil == nil; print true == !false;',
+    "mixed_equality": 'print 1 == "1"; print nil == false; print 0 != false; print "" == nil;',
+    "strings": 'var s = "con"; s = s + "cat"; print s; print s + "enate";',
+    # past ROPE_THRESHOLD concatenation builds ropes
+    "long_strings": """
+        var chunk = "xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx";
+        var s = chunk + chunk + chunk;
+        var t = s + "!";
+        var u = s + "?";
+        print t == s + "!";
+        print t == u;
+        print u;
+        print -s;
+    """,
+    "unary": "print !nil; print !0; print --3;",
+    "truthiness": 'print !0; print !""; print !"a"; print !nil; print !false; print !!0;',
+    "globals": "var a; print a; a = 2; var b = a = a + 1; print a; print b;",
+    "redeclare": "var a = 1; var a = a + 1; print a; { var b = 1; var b = b + 1; print b; }",
+    "scopes": """
+        var a = "global a";
+        var b = "global b";
+        {
+          var a = "outer a";
+          {
+            var a = a + " shadowed";
+            print a;
+            b = "assigned b";
+          }
+          print a;
+          var b = "outer b";
+          print b;
+        }
+        print a;
+        print b;
+    """,
+    "assignment_chain": "{ var a; var b; a = b = 3; print a + b; }",
+    "runtime_error": 'print "before"; print "a" - 1; print "after";',
+    "mixed_plus_error": 'print 1 + "a";',
+    "undefined_variable": "print nope;",
+    "undefined_assignment": "{ nope = 1; }",
+    "comparison_error": 'print 1 < "2";',
+    "negate_error": 'print -"muffin";',
+    "division_by_zero": 'print "before"; print 1 / 0; print "after";',
+    "local_division_by_zero": "{ var z = 0; print 2 / -z; }",
+    "string_division_by_zero": 'print "4" / "0";',
+}
+
+
+def run_engine(engine, source: str, optimize=False) -> tuple[list, bool, bool]:
+    error_reporter = ErrorReporter()
+    with patch("builtins.print") as mock_print:
+        tokens = Scanner(source, error_reporter).scan_tokens()
+        statements = Parser(error_reporter, tokens).parse()
+        if optimize:
+            statements = Optimizer().optimize(statements)
+        Resolver().resolve(statements)
+        engine(error_reporter).interpret(statements)
+    output = [" ".join(map(str, call.args)) for call in mock_print.call_args_list]
+    return output, error_reporter.had_error, error_reporter.had_runtime_error
+
+
+class TestConformance(unittest.TestCase):
+    def test_engines_agree(self):
+        for name, source in PROGRAMS.items():
+            expected = run_engine(Interpreter, source)
+            for engine in ENGINES[1:]:
+                with self.subTest(program=name, engine=engine.__name__):
+                    self.assertEqual(expected, run_engine(engine, source))
+
+    def test_reference_output(self):
+        output, _, had_runtime_error = run_engine(Interpreter, PROGRAMS["scopes"])
+        self.assertEqual(
+            [
+                "outer a shadowed",
+                "outer a",
+                "outer b",
+                "global a",
+                "assigned b",
+            ],
+            output,
+        )
+        self.assertFalse(had_runtime_error)
+
+    # only nil and false are falsey, 0 and "" included
+    def test_truthiness(self):
+        expected = ["False", "False", "False", "True", "True", "True"]
+        for engine in ENGINES:
+            for optimize in [False, True]:
+                with self.subTest(engine=engine.__name__, optimize=optimize):
+                    output, _, _ = run_engine(engine, PROGRAMS["truthiness"], optimize)
+                    self.assertEqual(expected, output)
+
+    # a runtime error, where Python would raise ZeroDivisionError
+    def test_division_by_zero(self):
+        for engine in ENGINES:
+            for optimize in [False, True]:
+                with self.subTest(engine=engine.__name__, optimize=optimize):
+                    output, _, had_runtime_error = run_engine(
+                        engine, PROGRAMS["division_by_zero"], optimize
+                    )
+                    self.assertEqual(["before", "Division by zero. \n[line 1]"], output)
+                    self.assertTrue(had_runtime_error)
+
+
+if __name__ == "__main__":
+    unittest.main()
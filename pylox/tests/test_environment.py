@@ -58,3 +58,27 @@ class EnvironmentTests(unittest.TestCase):
         self.assertEqual(
             global_env.get(Token(TokenType.VAR, "global_var", "", 1)), "42"
         )
+
+    def test_can_get_and_assign_slots(self):
+        global_env = Environment()
+        block_env = Environment(global_env, 2)
+        inner_env = Environment(block_env, 1)
+
+        block_env.define_at(1, "outer")
+        inner_env.define_at(0, "inner")
+
+        self.assertEqual(inner_env.get_at(0, 0), "inner")
+        self.assertEqual(inner_env.get_at(1, 1), "outer")
+
+        inner_env.assign_at(1, 1, "changed")
+        self.assertEqual(block_env.get_at(0, 1), "changed")
+
+    def test_assign_updates_enclosing_scope(self):
+        global_env = Environment()
+        global_env.define("my_var", 42)
+        block_env = Environment(global_env)
+
+        token = Token(TokenType.VAR, "my_var", "", 1)
+        block_env.assign(token, 100)
+
+        self.assertEqual(global_env.get(token), 100)
@@ -0,0 +1,46 @@
+import unittest
+from unittest.mock import patch
+
+import test_scanner
+from src.errors import ErrorReporter
+from src.fast_scanner import FastScanner
+from src.scanner import Scanner
+
+SOURCES = [
+    "",
+    "var a = 1;\nprint a + 2.5 * (3 - 4) / 5;",
+    "!a != b == c = d <= e >= f < g > h",
+    "{ var _x1 = nil; _x1 = true and false or !_x1; }",
+    "// comment only",
+    "1 // comment\n2 /\n/ 3",
+    '"multi\nline\nstring" after\n"another"',
+    '"unterminated\nstring',
+    "1.5 1. .5 12.34.56",
+    "123abc abc123 a_b_c",
+    "~ # @ $ é \f 1",
+    "\r\n\t var\r\n",
+    "class else func for if return super this while",
+]
+
+
+# runs every scanner test against the regex scanner
+class FastScannerTest(test_scanner.ScannerTest):
+    scanner = FastScanner
+
+    def test_matches_scanner_token_stream(self):
+        for source in SOURCES:
+            with self.subTest(source=source):
+                with patch("builtins.print") as slow_print:
+                    slow_reporter = ErrorReporter()
+                    expected = Scanner(source, slow_reporter).scan_tokens()
+                with patch("builtins.print") as fast_print:
+                    fast_reporter = ErrorReporter()
+                    actual = FastScanner(source, fast_reporter).scan_tokens()
+
+                self.assertEqual(expected, actual)
+                self.assertEqual(slow_reporter.had_error, fast_reporter.had_error)
+                self.assertEqual(slow_print.call_args_list, fast_print.call_args_list)
+
+
+if __name__ == "__main__":
+    unittest.main()
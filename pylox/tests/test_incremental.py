@@ -0,0 +1,152 @@
+import random
+import unittest
+
+from src.fast_scanner import FastScanner
+from src.incremental import IncrementalDocument
+from src.parser import Parser, PrattParser
+from src.session import CollectingErrorReporter, LoxError
+
+PROGRAM = """var a = 1;
+print a + 2;
+{ var b = a; print b; }
+var c = "two
+lines";
+print c;
+"""
+
+PIECES = [
+    "var a = 1;",
+    "print a + 2;",
+    "{ var b = a; print b; }",
+    "\n",
+    " ",
+    "// comment\n",
+    '"str\ning"',
+    '"',
+    "{",
+    "}",
+    ";",
+    "(",
+    "1.",
+    ")",
+    "1.5",
+    "a",
+    "+",
+    "*",
+    "!",
+    "print",
+    "var",
+    "@",
+]
+
+
+def parse(source: str, parser=PrattParser):
+    reporter = CollectingErrorReporter()
+    tokens = FastScanner(source, reporter).scan_tokens()
+    return tokens, parser(reporter, tokens).parse(), reporter.errors
+
+
+class TestIncrementalDocument(unittest.TestCase):
+    def assertMatchesFullParse(self, document: IncrementalDocument, parser=PrattParser):
+        tokens, statements, errors = parse(document.source, parser)
+        self.assertEqual(errors, document.errors())
+        self.assertEqual(tokens, document.tokens)
+        self.assertEqual(statements, document.statements)
+
+    def test_initial_parse(self):
+        document = IncrementalDocument(PROGRAM)
+        self.assertMatchesFullParse(document)
+        self.assertFalse(document.had_error)
+
+    def test_edit_reuses_other_declarations(self):
+        document = IncrementalDocument(PROGRAM)
+        before = list(document.statements)
+
+        stats = document.edit(PROGRAM.index("a + 2"), 1, "c")
+
+        self.assertEqual(1, stats.parsed)
+        self.assertEqual("print c + 2;", document.source.splitlines()[1])
+        self.assertMatchesFullParse(document)
+        self.assertIsNot(before[1], document.statements[1])
+        for index in (0, 2, 3, 4):
+            self.assertIs(before[index], document.statements[index])
+
+    def test_line_break_moves_following_lines(self):
+        document = IncrementalDocument(PROGRAM)
+        last = document.statements[-1]
+
+        document.edit(0, 0, "\n\n")
+
+        self.assertIs(last, document.statements[-1])
+        self.assertEqual(8, last.expression.name.line)
+        self.assertMatchesFullParse(document)
+
+    # the digit merges with the two tokens before it
+    def test_typing_a_decimal_number(self):
+        document = IncrementalDocument("print a;\nprint 1.;")
+
+        document.edit(len("print a;\nprint 1."), 0, "5")
+
+        self.assertEqual("1.5", document.tokens[4].lexeme)
+        self.assertMatchesFullParse(document)
+        self.assertFalse(document.had_error)
+
+    def test_errors_follow_edits(self):
+        document = IncrementalDocument(PROGRAM)
+
+        document.edit(PROGRAM.index(";"), 1, "")
+        self.assertEqual(
+            [LoxError("parse", 2, "at 'print': Expect ';' after value.")],
+            document.errors(),
+        )
+        document.edit(0, 0, "@\n")
+        self.assertEqual(
+            [
+                LoxError("scan", 1, "Unexpected character"),
+                LoxError("parse", 3, "at 'print': Expect ';' after value."),
+            ],
+            document.errors(),
+        )
+
+        document.edit(PROGRAM.index(";") + 2, 0, ";")
+        document.edit(0, 2, "")
+        self.assertFalse(document.had_error)
+        self.assertMatchesFullParse(document)
+
+    def test_invalid_assignment_target_is_an_error(self):
+        document = IncrementalDocument("var a = 1;\nprint a;\n")
+        document.edit(0, 0, "1 = 2;\n")
+        self.assertEqual(
+            [LoxError("parse", 1, "at '=': Invalid assignment target.")],
+            document.errors(),
+        )
+        self.assertEqual(3, len(document.statements))
+
+    def test_edit_outside_of_source(self):
+        document = IncrementalDocument("print 1;")
+        with self.assertRaises(ValueError):
+            document.edit(5, 10, "")
+
+    def test_random_edits_match_full_parse(self):
+        rng = random.Random(7)
+        for parser in (PrattParser, Parser):
+            for _ in range(60):
+                source = "".join(rng.choice(PIECES) for _ in range(rng.randint(0, 30)))
+                document = IncrementalDocument(source, parser)
+                for _ in range(15):
+                    offset = rng.randint(0, len(source))
+                    removed = rng.randint(0, min(5, len(source) - offset))
+                    inserted = "".join(
+                        rng.choice(PIECES) for _ in range(rng.randint(0, 2))
+                    )
+                    edited = source[:offset] + inserted + source[offset + removed :]
+                    errors = parse(edited, parser)[2]
+                    source = edited
+                    document.edit(offset, removed, inserted)
+                    self.assertEqual(errors, document.errors())
+                with self.subTest(source=source, parser=parser.__name__):
+                    self.assertMatchesFullParse(document, parser)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import tracemalloc
+import unittest
+from unittest.mock import patch
+
+import main
+from src.errors import ErrorReporter
+from src.instrumentation import Instrumentation, StatsCollector
+
+
+class InstrumentationTest(unittest.TestCase):
+    def setUp(self):
+        main.errorReporter = ErrorReporter()
+        self.stats = StatsCollector()
+        main.instrumentation = Instrumentation()
+        main.instrumentation.subscribe(self.stats)
+
+    def tearDown(self):
+        main.instrumentation = Instrumentation()
+        tracemalloc.stop()
+
+    def run_source(self, source: str, options=main.DEFAULT_OPTIONS) -> list:
+        with patch("builtins.print") as mock_print:
+            main.run(source, options)
+        return [call.args[0] for call in mock_print.call_args_list]
+
+    def test_no_listener_measures_nothing(self):
+        with Instrumentation().phase("scan") as event:
+            self.assertIsNone(event)
+
+    def test_reports_every_phase(self):
+        output = self.run_source("var a = 1; print a + 2;")
+
+        self.assertEqual(["3"], output)
+        self.assertEqual(
+            ["scan", "parse", "resolve", "interpret"],
+            [e.phase for e in self.stats.events],
+        )
+        scan, parse = self.stats.events[:2]
+        self.assertEqual((11, "tokens"), (scan.count, scan.unit))
+        self.assertEqual((6, "nodes"), (parse.count, parse.unit))
+        for event in self.stats.events:
+            self.assertGreaterEqual(event.wall, 0)
+            self.assertGreaterEqual(event.cpu, 0)
+            self.assertIsNone(event.peak_memory)
+
+    def test_optimize_phase(self):
+        output = self.run_source("print 1 + 2;", main.Options(optimize=True))
+
+        # the number of nodes eliminated is only reported to listeners
+        self.assertEqual(["3"], output)
+        optimize = self.stats.events[2]
+        self.assertEqual(("optimize", 2), (optimize.phase, optimize.count))
+
+    def test_pipeline_is_one_phase(self):
+        self.run_source("print 1; print 2;", main.Options(pipeline=True))
+
+        self.assertEqual(["scan", "pipeline"], [e.phase for e in self.stats.events])
+        self.assertEqual(2, self.stats.events[1].count)
+
+    def test_parse_error_stops_after_parse(self):
+        self.run_source("print ;")
+        self.assertEqual(["scan", "parse"], [e.phase for e in self.stats.events])
+
+    def test_trace_memory(self):
+        main.instrumentation.trace_memory = True
+        self.run_source('var a = "abc"; print a;')
+
+        for event in self.stats.events:
+            self.assertGreater(event.peak_memory, 0)
+
+    def test_event_reported_when_phase_raises(self):
+        with self.assertRaises(ValueError):
+            with main.instrumentation.phase("broken"):
+                raise ValueError()
+        self.assertEqual("broken", self.stats.events[0].phase)
+
+    def test_summary(self):
+        self.run_source("print 1;")
+        summary = self.stats.summary().splitlines()
+
+        self.assertEqual(5, len(summary))
+        self.assertIn("4 tokens", summary[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import io
+import unittest
+
+from src.errors import ErrorReporter
+from src.fast_scanner import FastScanner
+from src.intern import InternTable
+from src.scanner import Scanner
+from src.stream_scanner import scan_stream
+from src.token_type import TokenType
+
+SOURCE = 'var count = "a"; count = count + "a"; { var count = "b"; print count; }'
+
+
+class InternTableTest(unittest.TestCase):
+    def test_intern(self):
+        table = InternTable()
+        first = table.intern("".join(["na", "me"]))
+        second = table.intern("".join(["n", "ame"]))
+
+        self.assertIs(first, second)
+        self.assertEqual((1, 1), (table.hits, table.misses))
+        self.assertEqual(0.5, table.stats().hit_rate)
+        self.assertEqual(1, len(table))
+
+    def test_empty_hit_rate(self):
+        self.assertEqual(0.0, InternTable().stats().hit_rate)
+
+
+class ScannerInterningTest(unittest.TestCase):
+    def check_interned(self, tokens: list):
+        identifiers = [t for t in tokens if t.type == TokenType.IDENTIFIER]
+        strings = [t for t in tokens if t.type == TokenType.STRING]
+
+        self.assertEqual(5, len(identifiers))
+        for token in identifiers:
+            self.assertIs(identifiers[0].lexeme, token.lexeme)
+            self.assertIs(token.lexeme, token.literal)
+        a = [t for t in strings if t.literal == "a"]
+        self.assertIs(a[0].literal, a[1].literal)
+        self.assertIs(a[0].lexeme, a[1].lexeme)
+
+    def test_scanners(self):
+        for scanner in (Scanner, FastScanner):
+            with self.subTest(scanner.__name__):
+                s = scanner(SOURCE, ErrorReporter())
+                self.check_interned(s.scan_tokens())
+                # 8 identifiers and keywords, 3 strings (lexeme and literal)
+                self.assertEqual(14, s.interner.hits + s.interner.misses)
+                # var, count, print, "a", a, "b", b
+                self.assertEqual(7, len(s.interner))
+
+    def test_stream_scanner(self):
+        table = InternTable()
+        tokens = scan_stream(io.StringIO(SOURCE), ErrorReporter(), 8, table)
+        self.check_interned(list(tokens))
+        self.assertGreater(table.hits, 0)
+
+    def test_shared_table(self):
+        table = InternTable()
+        first = Scanner("var name;", ErrorReporter(), table).scan_tokens()
+        second = FastScanner("print name;", ErrorReporter(), table).scan_tokens()
+
+        self.assertIs(first[1].lexeme, second[1].lexeme)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,6 +11,9 @@ from src.tokens import Token
 
 
 class TestInterpreter(unittest.TestCase):
+    # execution engine under test, other engines reuse these tests by subclassing
+    engine = Interpreter
+
     @patch("builtins.print")
     def test_interpreter(self, mock_print):
         expression = Print(
@@ -25,7 +28,7 @@ class TestInterpreter(unittest.TestCase):
         )
 
         err_reporter = ErrorReporter()
-        Interpreter(err_reporter).interpret([expression])
+        self.engine(err_reporter).interpret([expression])
 
         mock_print.assert_called_with("-5617.41")
 
@@ -44,7 +47,7 @@ class TestInterpreter(unittest.TestCase):
         )
 
         err_reporter = ErrorReporter()
-        Interpreter(err_reporter).interpret([expression])
+        self.engine(err_reporter).interpret([expression])
         self.assertEqual(True, err_reporter.had_runtime_error)
 
     @patch("builtins.print")
@@ -56,7 +59,7 @@ class TestInterpreter(unittest.TestCase):
         )
 
         err_reporter = ErrorReporter()
-        Interpreter(err_reporter).interpret([expression])
+        self.engine(err_reporter).interpret([expression])
         mock_print.assert_called_with("hello world")
 
     @patch("builtins.print")
@@ -70,7 +73,7 @@ class TestInterpreter(unittest.TestCase):
         )
 
         err_reporter = ErrorReporter()
-        Interpreter(err_reporter).interpret([expression])
+        self.engine(err_reporter).interpret([expression])
         mock_print.assert_called_with("3")
 
     # 3.0 + 2.0 == 5.0
@@ -78,18 +81,29 @@ class TestInterpreter(unittest.TestCase):
     def test_can_compare_equality(self, mock_print):
         expression = Print(
             Binary(
-                Binary(
-                    Literal("3.0"), Token(TokenType.PLUS, "+", None, 1), Literal("2.0")
-                ),
+                Binary(Literal(3.0), Token(TokenType.PLUS, "+", None, 1), Literal(2.0)),
                 Token(TokenType.EQUAL_EQUAL, "==", None, 1),
-                Literal("5.0"),
+                Literal(5.0),
             )
         )
 
         err_reporter = ErrorReporter()
-        Interpreter(err_reporter).interpret([expression])
+        self.engine(err_reporter).interpret([expression])
         mock_print.assert_called_with("True")
 
+    # 1 == "1"
+    @patch("builtins.print")
+    def test_values_of_different_types_are_not_equal(self, mock_print):
+        expression = Print(
+            Binary(
+                Literal(1.0), Token(TokenType.EQUAL_EQUAL, "==", None, 1), Literal("1")
+            )
+        )
+
+        err_reporter = ErrorReporter()
+        self.engine(err_reporter).interpret([expression])
+        mock_print.assert_called_with("False")
+
     # var a = 42
     # a = 100
     # print(a)
@@ -101,7 +115,7 @@ class TestInterpreter(unittest.TestCase):
         use = Print(Variable(a_token))
         program = [declare, assign, use]
         err_reporter = ErrorReporter()
-        Interpreter(err_reporter).interpret(program)
+        self.engine(err_reporter).interpret(program)
         mock_print.assert_called_with("100")
 
     @patch("builtins.print")
@@ -118,7 +132,7 @@ class TestInterpreter(unittest.TestCase):
 
         program = [declare, block, use]
         err_reporter = ErrorReporter()
-        Interpreter(err_reporter).interpret(program)
+        self.engine(err_reporter).interpret(program)
 
         mock_print.assert_any_call("42")
         mock_print.assert_any_call("24")
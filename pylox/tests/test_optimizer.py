@@ -0,0 +1,145 @@
+import unittest
+from unittest.mock import patch
+
+from src.ast_printer import AstPrinter
+from src.errors import ErrorReporter
+from src.expr import Literal, Unary, Binary
+from src.interpreter import Interpreter
+from src.optimizer import Optimizer, count_nodes
+from src.parser import Parser
+from src.resolver import Resolver
+from src.scanner import Scanner
+from src.stmt import Block, Print
+
+
+def parse(source: str) -> list:
+    error_reporter = ErrorReporter()
+    tokens = Scanner(source, error_reporter).scan_tokens()
+    return Parser(error_reporter, tokens).parse()
+
+
+def run(statements: list) -> tuple[list, bool]:
+    error_reporter = ErrorReporter()
+    with patch("builtins.print") as mock_print:
+        Resolver().resolve(statements)
+        Interpreter(error_reporter).interpret(statements)
+    return [
+        call.args[0] for call in mock_print.call_args_list
+    ], error_reporter.had_runtime_error
+
+
+class OptimizerTest(unittest.TestCase):
+    def optimize_expression(self, source: str) -> str:
+        [stmt] = Optimizer().optimize(parse(f"print {source};"))
+        return AstPrinter().print(stmt.expression)
+
+    def test_folds_constant_expressions(self):
+        test_cases = [
+            ("1 + 2 * 3", 7.0),
+            ("(1 + 2) * 3", 9.0),
+            ('"a" + "b"', "ab"),
+            ("-(4 / 2)", -2.0),
+            ("1 < 2", True),
+            ("2 >= 3", False),
+            ("1 == 1", True),
+            ('"a" != "a"', False),
+            ("!nil", True),
+            ("!!true", True),
+        ]
+        for source, expected in test_cases:
+            with self.subTest(source=source):
+                [stmt] = Optimizer().optimize(parse(f"print {source};"))
+                self.assertEqual(Literal(expected), stmt.expression)
+                self.assertIs(type(expected), type(stmt.expression.value))
+
+    def test_folds_inside_variable_expressions(self):
+        self.assertEqual("(+ a 6)", self.optimize_expression("a + (2 * 3)"))
+        self.assertEqual("(+ (+ a 1) 2)", self.optimize_expression("a + 1 + 2"))
+
+    def test_strips_groupings(self):
+        self.assertEqual("(* (+ a b) c)", self.optimize_expression("((a + b)) * (c)"))
+
+    def test_simplifies_double_negation_of_booleans(self):
+        self.assertEqual("(< a b)", self.optimize_expression("!!(a < b)"))
+        self.assertEqual("(! a)", self.optimize_expression("!!!a"))
+        # !!a turns a into a bool, so it has to stay
+        self.assertEqual("(! (! a))", self.optimize_expression("!!a"))
+
+    def test_keeps_expressions_that_fail_at_runtime(self):
+        [stmt] = Optimizer().optimize(parse('print "a" - 1;'))
+        self.assertIsInstance(stmt.expression, Binary)
+
+        [stmt] = Optimizer().optimize(parse('print -"a";'))
+        self.assertIsInstance(stmt.expression, Unary)
+
+        [stmt] = Optimizer().optimize(parse("print 1 / 0;"))
+        self.assertIsInstance(stmt.expression, Binary)
+
+        output, had_runtime_error = run(Optimizer().optimize(parse('print "a" - 1;')))
+        self.assertTrue(had_runtime_error)
+
+    def test_removes_dead_statements(self):
+        optimizer = Optimizer()
+        statements = optimizer.optimize(parse("1 + 2; {} { { } } print 1; a;"))
+
+        self.assertEqual(2, len(statements))
+        self.assertIsInstance(statements[0], Print)
+
+    def test_inlines_blocks_without_declarations(self):
+        statements = Optimizer().optimize(
+            parse("var a = 1; { a = 2; { var a = 3; print a; } } print a;")
+        )
+
+        self.assertEqual(4, len(statements))
+        self.assertIsInstance(statements[2], Block)
+        self.assertEqual(["3", "2"], run(statements)[0])
+
+    def test_reports_eliminated_nodes(self):
+        statements = parse("print (1 + 2) * 3; 4;")
+        self.assertEqual(9, count_nodes(statements))
+
+        optimizer = Optimizer()
+        optimized = optimizer.optimize(statements)
+        self.assertEqual(2, count_nodes(optimized))
+        self.assertEqual(7, optimizer.eliminated)
+
+    def test_deeply_nested_program(self):
+        statements = parse("{" * 3000 + "print 1 + 2;" + "}" * 3000)
+        self.assertEqual(3004, count_nodes(statements))
+
+        optimizer = Optimizer()
+        optimized = optimizer.optimize(statements)
+        self.assertEqual([Print(Literal(3.0))], optimized)
+        self.assertEqual(3002, optimizer.eliminated)
+
+    def test_preserves_program_output(self):
+        source = """
+            var a = 2 * (3 + 4);
+            {
+              var b = a - (10 / 5);
+              print !!(b > 1 + 1);
+              print "x" + "y" + "z";
+              { a = b * (1 + 1); }
+            }
+            print a == 24;
+            print !!a;
+        """
+        self.assertEqual(run(parse(source)), run(Optimizer().optimize(parse(source))))
+
+    def test_eliminated_matches_node_counts(self):
+        source = """
+            print ((1 + 2));
+            "a";
+            { { } var a = !!(1 < 2); { print !!a; 2 * 3; } }
+            print -(-"x");
+            { print 1 / 0 + 1; }
+        """
+        statements = parse(source)
+        before = count_nodes(statements)
+        optimizer = Optimizer()
+        optimized = optimizer.optimize(statements)
+        self.assertEqual(before - count_nodes(optimized), optimizer.eliminated)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import io
+import unittest
+from unittest.mock import patch
+
+from src.closure_compiler import ClosureCompiler
+from src.errors import ErrorReporter
+from src.interpreter import Interpreter
+from src.output import BufferedSink, MemorySink, NullSink
+from src.parser import Parser
+from src.resolver import Resolver
+from src.scanner import Scanner
+from src.stack_interpreter import StackInterpreter
+from src.vm import VM
+
+ENGINES = [Interpreter, StackInterpreter, ClosureCompiler, VM]
+
+
+def parse(source: str) -> list:
+    error_reporter = ErrorReporter()
+    statements = Parser(
+        error_reporter, Scanner(source, error_reporter).scan_tokens()
+    ).parse()
+    Resolver().resolve(statements)
+    return statements
+
+
+class OutputSinkTest(unittest.TestCase):
+    def test_buffered_sink_writes_in_blocks(self):
+        stream = io.StringIO()
+        sink = BufferedSink(stream, flush_size=10)
+
+        sink.write("abc")
+        sink.write("def")
+        self.assertEqual("", stream.getvalue())
+        sink.write("ghi")
+        self.assertEqual("abc\ndef\nghi\n", stream.getvalue())
+        sink.write("j")
+        sink.flush()
+        self.assertEqual("abc\ndef\nghi\nj\n", stream.getvalue())
+
+    def test_buffered_sink_defaults_to_stdout(self):
+        sink = BufferedSink()
+        sink.write("1")
+        with patch("sys.stdout", new=io.StringIO()) as stdout:
+            sink.flush()
+        self.assertEqual("1\n", stdout.getvalue())
+
+    def test_memory_sink(self):
+        sink = MemorySink()
+        sink.write("a")
+        sink.write("b")
+
+        self.assertEqual(["a", "b"], sink.take())
+        self.assertEqual([], sink.lines)
+
+    def test_engines_write_to_sink(self):
+        statements = parse('var a = 1; print a; { var b = "x"; print b; } print nil;')
+        for engine in ENGINES:
+            with self.subTest(engine.__name__):
+                sink = MemorySink()
+                with patch("builtins.print") as mock_print:
+                    engine(ErrorReporter(), sink).interpret(statements)
+                mock_print.assert_not_called()
+                self.assertEqual(["1", "x", "nil"], sink.lines)
+
+    def test_output_is_flushed_before_runtime_error(self):
+        statements = parse('print 1; print -"a";')
+        for engine in ENGINES:
+            with self.subTest(engine.__name__):
+                stream = io.StringIO()
+                with patch("builtins.print") as mock_print:
+                    mock_print.side_effect = lambda *args: stream.write(f"{args[0]}\n")
+                    engine(ErrorReporter(), BufferedSink(stream)).interpret(statements)
+                self.assertEqual(
+                    "1\na must be a number \n[line 1]\n", stream.getvalue()
+                )
+
+    def test_null_sink(self):
+        statements = parse("print 1; print 2;")
+        for engine in ENGINES:
+            with self.subTest(engine.__name__):
+                with patch("builtins.print") as mock_print:
+                    engine(ErrorReporter(), NullSink()).interpret(statements)
+                mock_print.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,6 +11,8 @@ from src.tokens import Token
 
 
 class TestParser(unittest.TestCase):
+    parser = Parser
+
     def test_can_parse_simple_expression(self):
         test_cases = [
             ("5+3;", "(+ 5 3)"),
@@ -26,7 +28,7 @@ class TestParser(unittest.TestCase):
                 error_reporter = ErrorReporter()
                 scanner = Scanner(text, error_reporter)
                 tokens = scanner.scan_tokens()
-                parser = Parser(error_reporter, tokens)
+                parser = self.parser(error_reporter, tokens)
                 stmts = parser.parse()
                 result = AstPrinter().print(stmts[0].expression)
                 self.assertEqual(result, expected)
@@ -36,7 +38,7 @@ class TestParser(unittest.TestCase):
         error_reporter = ErrorReporter()
         scanner = Scanner(program, error_reporter)
         tokens = scanner.scan_tokens()
-        parser = Parser(error_reporter, tokens)
+        parser = self.parser(error_reporter, tokens)
         ast = parser.parse()
 
         expected_stmt_0 = Print(Literal("one"))
@@ -46,17 +48,31 @@ class TestParser(unittest.TestCase):
         self.assertEqual(expected_stmt_1, ast[1])
 
         expected_stmt_2 = Print(
-            Binary(Literal("2"), Token(TokenType.PLUS, "+", None, 1), Literal("1"))
+            Binary(Literal(2.0), Token(TokenType.PLUS, "+", None, 1), Literal(1.0))
         )
         self.assertEqual(expected_stmt_2, ast[2])
 
         a_id = Token(TokenType.IDENTIFIER, "a", "a", 1)
-        expected_stmt_3 = Var(a_id, Literal("42"))
+        expected_stmt_3 = Var(a_id, Literal(42.0))
         self.assertEqual(expected_stmt_3, ast[3])
 
-        expected_stmt_4 = Expression(Assign(a_id, Literal("100")))
+        expected_stmt_4 = Expression(Assign(a_id, Literal(100.0)))
         self.assertEqual(expected_stmt_4, ast[4])
 
+    # blocks are parsed without recursion, nesting is not limited by the stack
+    def test_can_parse_deeply_nested_blocks(self):
+        depth = 5000
+        program = "{" * depth + "print 1;" + "}" * depth
+        error_reporter = ErrorReporter()
+        tokens = Scanner(program, error_reporter).scan_tokens()
+        ast = self.parser(error_reporter, tokens).parse()
+
+        self.assertFalse(error_reporter.had_error)
+        block = ast[0]
+        for _ in range(depth - 1):
+            block = block.statements[0]
+        self.assertEqual([Print(Literal(1.0))], block.statements)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,65 @@
+import io
+import unittest
+from unittest.mock import patch
+
+import main
+from src.errors import ErrorReporter
+from src.parser import Parser
+from src.stream_scanner import TokenWindow, scan_stream
+
+
+class PipelineTest(unittest.TestCase):
+    def setUp(self):
+        main.errorReporter = ErrorReporter()
+
+    def run_pipelined(self, source: str) -> list[str]:
+        with patch("builtins.print") as mock_print:
+            main.run_stream(io.StringIO(source), main.Options(pipeline=True))
+        return [call.args[0] for call in mock_print.call_args_list]
+
+    def test_declarations_are_parsed_lazily(self):
+        source = io.StringIO("print 1;\n" * 1000)
+        parser = Parser(
+            ErrorReporter(), TokenWindow(scan_stream(source, ErrorReporter(), 64))
+        )
+
+        first = next(parser.declarations())
+        self.assertEqual(1.0, first.expression.value)
+        self.assertLess(source.tell(), 200)
+
+    def test_runs_program(self):
+        output = self.run_pipelined(
+            'var a = 1; { var b = a + 1; print b; } print "done";'
+        )
+        self.assertEqual(["2", "done"], output)
+
+    def test_output_starts_before_parse_error(self):
+        output = self.run_pipelined("print 1; print ; print 2;")
+
+        self.assertEqual("1", output[0])
+        self.assertNotIn("2", output)
+        self.assertTrue(main.errorReporter.had_error)
+
+    def test_reports_every_parse_error(self):
+        output = self.run_pipelined("print ; print 2; print ;")
+
+        self.assertEqual(2, sum("Error" in line for line in output))
+        self.assertNotIn("2", output)
+
+    def test_stops_at_runtime_error(self):
+        output = self.run_pipelined('print 1; print -"a"; print 2;')
+
+        self.assertEqual("1", output[0])
+        self.assertNotIn("2", output)
+        self.assertTrue(main.errorReporter.had_runtime_error)
+
+    def test_parse_first_runs_nothing_on_parse_error(self):
+        with patch("builtins.print") as mock_print:
+            main.run_stream(io.StringIO("print 1; print ;"))
+
+        self.assertNotIn("1", [call.args[0] for call in mock_print.call_args_list])
+        self.assertTrue(main.errorReporter.had_error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import patch
+
+import test_parser
+from src.errors import ErrorReporter
+from src.fast_scanner import FastScanner
+from src.parser import Parser, PrattParser
+from src.token_buffer import CompactScanner
+
+SOURCES = [
+    "1 + 2 * 3 - 4 / 5;",
+    "1 - 2 - 3; 8 / 4 / 2;",
+    "a = b = c + 1;",
+    "!!a == -b != -(-c) < d;",
+    "1 < 2 == 3 >= 4 <= 5 > 6;",
+    '"a" + "b" * (c - (d)) == nil;',
+    "var x = (a = 1) + --2; print !true == false;",
+    "{ var y = x * (x + 1); { y = -y / (2 - x); } }",
+    "1 +; print 2; (3;",
+    "print ; var = 3; print (1 + 2;",
+    "-",
+    "",
+]
+
+
+# runs every parser test against the PrattParser
+class TestPrattParser(test_parser.TestParser):
+    parser = PrattParser
+
+    def test_builds_same_trees_as_parser(self):
+        for source in SOURCES:
+            for scanner in (FastScanner, CompactScanner):
+                with self.subTest(source=source, scanner=scanner.__name__):
+                    with patch("builtins.print") as expected_print:
+                        reporter = ErrorReporter()
+                        tokens = scanner(source, reporter).scan_tokens()
+                        expected = Parser(reporter, tokens).parse()
+                    with patch("builtins.print") as actual_print:
+                        reporter = ErrorReporter()
+                        tokens = scanner(source, reporter).scan_tokens()
+                        actual = PrattParser(reporter, tokens).parse()
+
+                    self.assertEqual(repr(expected), repr(actual))
+                    self.assertEqual(
+                        expected_print.call_args_list, actual_print.call_args_list
+                    )
+
+    def test_invalid_assignment_target(self):
+        for parser in (Parser, PrattParser):
+            with self.subTest(parser.__name__):
+                reporter = ErrorReporter()
+                tokens = FastScanner("a + b = c; print 1;", reporter).scan_tokens()
+                with patch("builtins.print") as mock_print:
+                    statements = parser(reporter, tokens).parse()
+                # reported, and the parser carries on with the next statement
+                self.assertTrue(reporter.had_error)
+                mock_print.assert_called_once_with(
+                    "[line 1] Error  at '=': Invalid assignment target."
+                )
+                self.assertEqual(2, len(statements))
+
+
+if __name__ == "__main__":
+    unittest.main()
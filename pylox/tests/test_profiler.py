@@ -0,0 +1,143 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import main
+from src.errors import ErrorReporter
+from src.interpreter import Interpreter
+from src.parser import Parser
+from src.profiler import ProfilingInterpreter
+from src.resolver import Resolver
+from src.scanner import Scanner
+
+SOURCE = """var a = 0;
+{
+  var i = 1;
+  a = a + i;
+  a = a + i;
+}
+print a;
+"""
+
+
+def profile(source: str) -> tuple[ProfilingInterpreter, list]:
+    error_reporter = ErrorReporter()
+    statements = Parser(
+        error_reporter, Scanner(source, error_reporter).scan_tokens()
+    ).parse()
+    Resolver().resolve(statements)
+    profiler = ProfilingInterpreter(error_reporter)
+    with patch("builtins.print") as mock_print:
+        profiler.interpret(statements)
+    return profiler, [call.args[0] for call in mock_print.call_args_list]
+
+
+class ProfilerTest(unittest.TestCase):
+    def test_runs_program_like_interpreter(self):
+        profiler, output = profile(SOURCE)
+        self.assertEqual(["2"], output)
+        self.assertFalse(profiler.err_reporter.had_runtime_error)
+
+    def test_counts_statements_per_line(self):
+        profiler, _ = profile(SOURCE)
+        counts = {r.line: r.count for r in profiler.lines()}
+
+        # the block is attributed to the line of its first statement
+        self.assertEqual({1: 1, 3: 2, 4: 1, 5: 1, 7: 1}, counts)
+
+    def test_counts_nodes(self):
+        profiler, _ = profile(SOURCE)
+        kinds = [(r.line, r.kind, r.count) for r in profiler.nodes()]
+
+        self.assertIn((4, "Assign", 1), kinds)
+        self.assertIn((4, "Binary", 1), kinds)
+        self.assertIn((7, "Variable", 1), kinds)
+        # literals have no token, they take the line of their statement
+        self.assertIn((1, "Literal", 1), kinds)
+
+    def test_self_times_add_up_to_total(self):
+        profiler, _ = profile(SOURCE)
+
+        self.assertEqual(profiler.total_ns, sum(r.self_ns for r in profiler.lines()))
+        for r in profiler.nodes():
+            self.assertLessEqual(r.self_ns, r.total_ns)
+
+    def test_records_until_runtime_error(self):
+        profiler, _ = profile('print -1;\nprint -"a";\nprint -2;')
+        counts = {r.line: r.count for r in profiler.lines()}
+
+        self.assertTrue(profiler.err_reporter.had_runtime_error)
+        self.assertEqual({1: 1, 2: 1}, counts)
+
+    def test_unknown_line(self):
+        # nothing in `print 1;` keeps a token, its line is reported as 0
+        profiler, _ = profile("print 1;")
+        self.assertEqual([0], [r.line for r in profiler.lines()])
+
+    def test_json(self):
+        profiler, _ = profile(SOURCE)
+        data = json.loads(profiler.to_json())
+
+        self.assertEqual(profiler.total_ns, data["total_ns"])
+        self.assertEqual({"line", "count", "self_ns"}, set(data["lines"][0]))
+        self.assertEqual(
+            {"kind", "line", "count", "total_ns", "self_ns"}, set(data["nodes"][0])
+        )
+
+    def test_main_profile_option(self):
+        main.errorReporter = ErrorReporter()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profile.json")
+            with patch("builtins.print") as mock_print:
+                main.run_tokens(
+                    Scanner(SOURCE, main.errorReporter).scan_tokens(),
+                    main.Options(profile=path),
+                )
+            with open(path) as file:
+                data = json.load(file)
+
+        self.assertEqual("2", mock_print.call_args_list[0].args[0])
+        self.assertIn("hot lines:", mock_print.call_args_list[1].args[0])
+        self.assertEqual(6, sum(line["count"] for line in data["lines"]))
+
+    # every statement is freed once run, like with --pipeline
+    def test_main_profile_option_pipelined(self):
+        main.errorReporter = ErrorReporter()
+        source = "var a = 0;\n" + "a = a + 1;\n" * 200 + "print a;\n"
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profile.json")
+            with patch("builtins.print"):
+                main.run_tokens(
+                    Scanner(source, main.errorReporter).scan_tokens(),
+                    main.Options(pipeline=True, profile=path),
+                )
+            with open(path) as file:
+                data = json.load(file)
+
+        self.assertEqual(202, len(data["lines"]))
+        self.assertEqual({1}, {node["count"] for node in data["nodes"]})
+
+    def test_profile_options(self):
+        _, options, _ = main.parse_args(["--profile", "script.lox"])
+        self.assertEqual(main.PROFILE_OUTPUT, options.profile)
+
+        script, options, _ = main.parse_args(
+            ["--profile", "--profile-output", "out.json", "script.lox"]
+        )
+        self.assertEqual(("script.lox", "out.json"), (script, options.profile))
+
+        with patch("sys.stderr"), self.assertRaises(SystemExit):
+            main.parse_args(["--profile-output", "out.json", "script.lox"])
+
+    def test_disabled_by_default(self):
+        main.errorReporter = ErrorReporter()
+        self.assertIs(Interpreter, type(main.make_engine(main.Options())))
+        self.assertIs(
+            ProfilingInterpreter, type(main.make_engine(main.Options(profile="p.json")))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import io
+import unittest
+from unittest.mock import patch
+
+import main
+from src.instrumentation import Instrumentation, StatsCollector
+from src.interpreter import Interpreter
+from src.repl import CONTINUATION_PROMPT, PROMPT, Repl, is_complete
+from src.session import LoxSession
+from src.vm import VM
+
+
+def repl_output(repl: Repl) -> list[str]:
+    return repl.stdout.getvalue().splitlines()
+
+
+class TestRepl(unittest.TestCase):
+    def setUp(self):
+        self.repl = Repl(stdout=io.StringIO())
+
+    def test_globals_survive_between_lines(self):
+        self.repl.push("var a = 1;")
+        self.repl.push("a = a + 1;")
+        self.repl.push("print a;")
+        self.assertEqual(["2"], repl_output(self.repl))
+
+    def test_multi_line_snippet(self):
+        self.assertTrue(self.repl.push("{"))
+        self.assertEqual(CONTINUATION_PROMPT, self.repl.prompt)
+        self.assertTrue(self.repl.push("  var b = 2;"))
+        self.assertTrue(self.repl.push("  print b;"))
+        self.assertFalse(self.repl.push("}"))
+        self.assertEqual(PROMPT, self.repl.prompt)
+        self.assertEqual(["2"], repl_output(self.repl))
+
+    def test_multi_line_string(self):
+        self.assertTrue(self.repl.push('print "one'))
+        self.assertFalse(self.repl.push('two";'))
+        self.assertEqual(["one", "two"], repl_output(self.repl))
+
+    def test_empty_line_runs_incomplete_snippet(self):
+        self.assertTrue(self.repl.push("print 1"))
+        self.assertFalse(self.repl.push(""))
+        self.assertEqual(
+            ["[line 1] parse error: at end: Expect ';' after value."],
+            repl_output(self.repl),
+        )
+        self.assertFalse(self.repl.push(""))
+
+    def test_errors_do_not_end_the_session(self):
+        self.repl.push("var a = 1;")
+        self.repl.push('a = -"x";')
+        self.repl.push("print a;")
+        self.assertEqual(
+            ["[line 1] runtime error: x must be a number", "1"],
+            repl_output(self.repl),
+        )
+
+    def test_division_by_zero_does_not_end_the_session(self):
+        for engine in (Interpreter, VM):
+            with self.subTest(engine=engine.__name__):
+                repl = Repl(LoxSession(engine=engine), stdout=io.StringIO())
+                repl.push("var a = 1;")
+                repl.push("print a / 0;")
+                repl.push("print a;")
+                self.assertEqual(
+                    ["[line 1] runtime error: Division by zero.", "1"],
+                    repl_output(repl),
+                )
+
+    def test_bad_input_does_not_end_the_session(self):
+        self.repl.push("var a = 1;")
+        self.repl.push("a + 1 = 3;")
+        self.repl.push("print " + "(" * 3000 + "1" + ")" * 3000 + ";")
+        self.repl.push("print a;")
+        self.assertEqual(
+            [
+                "[line 1] parse error: at '=': Invalid assignment target.",
+                "[line 1] parse error: at '(': Expression nested too deeply.",
+                "1",
+            ],
+            repl_output(self.repl),
+        )
+
+    def test_reentered_lines_are_cached(self):
+        self.repl.push("var a = 1;")
+        self.repl.push("a = a + 1;")
+        program = self.repl.session._cache["a = a + 1;"]
+        self.repl.push("a = a + 1;")
+        self.repl.push("print a;")
+
+        self.assertIs(program, self.repl.session._cache["a = a + 1;"])
+        self.assertEqual(["3"], repl_output(self.repl))
+
+    def test_other_engine(self):
+        repl = Repl(LoxSession(engine=VM), stdout=io.StringIO())
+        repl.push("var a = 2;")
+        repl.push("print a * 3;")
+        self.assertEqual(["6"], repl_output(repl))
+
+    def test_reports_line_latency(self):
+        stats = StatsCollector()
+        instrumentation = Instrumentation()
+        instrumentation.subscribe(stats)
+        repl = Repl(stdout=io.StringIO(), instrumentation=instrumentation)
+        repl.push("{")
+        repl.push("print 1; }")
+
+        self.assertEqual(["line"], [event.phase for event in stats.events])
+        self.assertEqual(2, stats.events[0].count)
+
+    def test_loop_until_end_of_input(self):
+        lines = iter(["var a = 1;", "print a;"])
+        prompts = []
+
+        def read(prompt: str) -> str:
+            prompts.append(prompt)
+            try:
+                return next(lines)
+            except StopIteration:
+                raise EOFError
+
+        self.repl.loop(read)
+        self.assertEqual([PROMPT] * 3, prompts)
+        # a line break after the last prompt
+        self.assertEqual(["1", ""], repl_output(self.repl))
+
+    def test_options_of_the_prompt(self):
+        script, options, stats = main.parse_args(
+            ["--engine", "vm", "--optimize", "--stats"]
+        )
+        self.assertEqual(
+            (None, "vm", True, True), (script, options.engine, options.optimize, stats)
+        )
+
+        for option in [
+            ["--cache"],
+            ["--pipeline"],
+            ["--profile"],
+            ["--scanner", "regex"],
+        ]:
+            with self.subTest(option=option):
+                with patch("sys.stderr"), self.assertRaises(SystemExit):
+                    main.parse_args(option)
+
+    def test_is_complete(self):
+        for source in ["", "print 1;", "{ print 1; }", "// comment", "{ } }"]:
+            with self.subTest(source=source):
+                self.assertTrue(is_complete(source))
+        for source in ["print 1", "{ print 1;", '"abc', "print (1;"]:
+            with self.subTest(source=source):
+                self.assertFalse(is_complete(source))
+
+
+if __name__ == "__main__":
+    unittest.main()
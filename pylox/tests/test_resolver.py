@@ -0,0 +1,96 @@
+import unittest
+from unittest.mock import patch
+
+from src.errors import ErrorReporter
+from src.interpreter import Interpreter
+from src.parser import Parser
+from src.resolver import Resolver
+from src.scanner import Scanner
+
+
+def parse(source: str) -> list:
+    error_reporter = ErrorReporter()
+    tokens = Scanner(source, error_reporter).scan_tokens()
+    return Parser(error_reporter, tokens).parse()
+
+
+class TestResolver(unittest.TestCase):
+    def test_globals_are_left_unresolved(self):
+        stmts = parse("var a = 1; print a;")
+        Resolver().resolve(stmts)
+
+        self.assertIsNone(stmts[0].slot)
+        self.assertIsNone(stmts[1].expression.depth)
+        self.assertIsNone(stmts[1].expression.slot)
+
+    def test_resolves_locals_to_depth_and_slot(self):
+        stmts = parse("{ var a = 1; var b = 2; { print b; a = 3; } }")
+        Resolver().resolve(stmts)
+
+        outer = stmts[0]
+        self.assertEqual(2, outer.slot_count)
+        self.assertEqual(0, outer.statements[0].slot)
+        self.assertEqual(1, outer.statements[1].slot)
+
+        inner = outer.statements[2]
+        self.assertEqual(0, inner.slot_count)
+        use_b = inner.statements[0].expression
+        self.assertEqual((1, 1), (use_b.depth, use_b.slot))
+        assign_a = inner.statements[1].expression
+        self.assertEqual((1, 0), (assign_a.depth, assign_a.slot))
+
+    def test_redeclaration_reuses_slot(self):
+        stmts = parse("{ var a = 1; var a = a; }")
+        Resolver().resolve(stmts)
+
+        block = stmts[0]
+        self.assertEqual(1, block.slot_count)
+        self.assertEqual(0, block.statements[1].slot)
+        self.assertEqual(0, block.statements[1].initializer.depth)
+
+    def test_initializer_reads_enclosing_variable(self):
+        stmts = parse("{ var a = 1; { var a = a; } }")
+        Resolver().resolve(stmts)
+
+        shadow = stmts[0].statements[1].statements[0]
+        self.assertEqual((1, 0), (shadow.initializer.depth, shadow.initializer.slot))
+
+    def test_resolves_deeply_nested_blocks(self):
+        depth = 5000
+        stmts = parse("{ var a = 1;" + "{" * depth + "print a;" + "}" * depth + "}")
+        Resolver().resolve(stmts)
+
+        block = stmts[0].statements[1]
+        for _ in range(depth - 1):
+            block = block.statements[0]
+        use_a = block.statements[0].expression
+        self.assertEqual((depth, 0), (use_a.depth, use_a.slot))
+
+    @patch("builtins.print")
+    def test_resolved_program_runs(self, mock_print):
+        stmts = parse(
+            """
+            var g = "global";
+            {
+              var a = "outer";
+              {
+                var a = "inner";
+                print a;
+                print g;
+                g = "changed";
+              }
+              a = a + "!";
+              print a;
+            }
+            print g;
+            """
+        )
+        Resolver().resolve(stmts)
+        Interpreter(ErrorReporter()).interpret(stmts)
+
+        printed = [call.args[0] for call in mock_print.call_args_list]
+        self.assertEqual(["inner", "global", "outer!", "changed"], printed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+from src.rope import Rope
+from src.runtime import ROPE_THRESHOLD, is_equal, stringify, validate_plus
+from src.token_type import TokenType
+from src.tokens import Token
+
+PLUS = Token(TokenType.PLUS, "+", None, 1)
+LONG = "x" * ROPE_THRESHOLD
+
+
+class RopeTest(unittest.TestCase):
+    def test_append(self):
+        rope = Rope.of("ab", "cd").append("ef")
+
+        self.assertEqual("abcdef", str(rope))
+        self.assertEqual(6, len(rope))
+
+    def test_older_rope_is_unchanged(self):
+        base = Rope.of("a", "b")
+        first = base.append("c")
+        second = base.append("d")
+
+        self.assertEqual("ab", str(base))
+        self.assertEqual("abc", str(first))
+        self.assertEqual("abd", str(second))
+        self.assertEqual("abcx", str(first.append("x")))
+
+    def test_short_strings_stay_str(self):
+        self.assertEqual("ab", validate_plus(PLUS, "a", "b"))
+
+    def test_long_concatenation_builds_rope(self):
+        value = validate_plus(PLUS, LONG, "y")
+        value = validate_plus(PLUS, value, "z")
+
+        self.assertIs(Rope, type(value))
+        self.assertEqual(LONG + "yz", stringify(value))
+
+    def test_rope_on_the_right(self):
+        rope = validate_plus(PLUS, LONG, "y")
+        self.assertEqual("a" + LONG + "y", stringify(validate_plus(PLUS, "a", rope)))
+
+    def test_rope_equality(self):
+        rope = validate_plus(PLUS, LONG, "y")
+
+        self.assertTrue(is_equal(rope, LONG + "y"))
+        self.assertTrue(is_equal(LONG + "y", rope))
+        self.assertTrue(is_equal(rope, validate_plus(PLUS, LONG, "y")))
+        self.assertFalse(is_equal(rope, LONG))
+        self.assertFalse(is_equal(rope, 1.0))
+
+    def test_numeric_strings_still_add(self):
+        self.assertEqual(3.0, validate_plus(PLUS, "1", "2"))
+        self.assertEqual(1.5, validate_plus(PLUS, " 1", ".5"))
+        self.assertEqual("1a", validate_plus(PLUS, "1", "a"))
+        self.assertEqual("nope", validate_plus(PLUS, "no", "pe"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+
+from src.errors import PyloxRuntimeError
+from src.runtime import is_equal, is_truthy, stringify, validate_number, validate_plus
+from src.token_type import TokenType
+from src.tokens import Token
+
+
+class RuntimeTest(unittest.TestCase):
+    def test_equality(self):
+        test_cases = [
+            (1.0, 1.0, True),
+            (1.0, 2.0, False),
+            (0.5 + 0.25, 0.75, True),
+            ("a", "a", True),
+            ("a" * 3, "aaa", True),
+            ("a", "b", False),
+            (True, True, True),
+            (True, False, False),
+            (None, None, True),
+            (float("nan"), float("nan"), False),
+        ]
+        for left, right, expected in test_cases:
+            with self.subTest(left=left, right=right):
+                self.assertIs(expected, is_equal(left, right))
+
+    def test_values_of_different_types_are_never_equal(self):
+        test_cases = [
+            (1.0, "1"),
+            (1.0, "1.0"),
+            (1.0, True),
+            (0.0, False),
+            (None, False),
+            (None, "nil"),
+            ("true", True),
+        ]
+        for left, right in test_cases:
+            with self.subTest(left=left, right=right):
+                self.assertFalse(is_equal(left, right))
+                self.assertFalse(is_equal(right, left))
+
+    def test_identical_objects_are_equal(self):
+        nan = float("nan")
+        self.assertTrue(is_equal(nan, nan))
+
+    def test_only_nil_and_false_are_falsey(self):
+        for value in [0.0, -0.0, "", "0", True, float("nan")]:
+            with self.subTest(value=value):
+                self.assertTrue(is_truthy(value))
+        self.assertFalse(is_truthy(None))
+        self.assertFalse(is_truthy(False))
+
+    def test_error_messages_show_lox_values(self):
+        plus = Token(TokenType.PLUS, "+", None, 1)
+        with self.assertRaises(PyloxRuntimeError) as cm:
+            validate_plus(plus, 2.0, "ab")
+        self.assertEqual("2 and ab must both a numbers", cm.exception.message)
+        with self.assertRaises(PyloxRuntimeError) as cm:
+            validate_plus(plus, "ab", None)
+        self.assertEqual("ab and nil must both be strings", cm.exception.message)
+        with self.assertRaises(PyloxRuntimeError) as cm:
+            validate_number(plus, 1.0, None)
+        self.assertEqual("nil must be a number", cm.exception.message)
+
+    def test_stringify(self):
+        test_cases = [
+            (1.0, "1"),
+            (-12.0, "-12"),
+            (0.0, "0"),
+            (-0.0, "-0"),
+            (2.5, "2.5"),
+            (1e15, "1000000000000000"),
+            (1e16, "1e+16"),
+            (float("inf"), "inf"),
+            ("text", "text"),
+            (True, "True"),
+            (None, "nil"),
+        ]
+        for value, expected in test_cases:
+            with self.subTest(value=value):
+                self.assertEqual(expected, stringify(value))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,10 +6,13 @@ from src.token_type import TokenType
 
 
 class ScannerTest(unittest.TestCase):
+    # scanner under test, other scanners reuse these tests by subclassing
+    scanner = Scanner
+
     def test_can_scan_single_tokens(self):
         source = "(){},.-+;*"
         error_reporter = ErrorReporter()
-        scanner = Scanner(source, error_reporter)
+        scanner = self.scanner(source, error_reporter)
         tokens = scanner.scan_tokens()
         self.assertEqual(11, len(tokens))
         self.assertFalse(error_reporter.had_error)
@@ -17,7 +20,7 @@ class ScannerTest(unittest.TestCase):
     def test_can_report_errors(self):
         source = "~"
         error_reporter = ErrorReporter()
-        scanner = Scanner(source, error_reporter)
+        scanner = self.scanner(source, error_reporter)
         tokens = scanner.scan_tokens()
         self.assertEqual(1, len(tokens))
         self.assertTrue(error_reporter.had_error)
@@ -25,7 +28,7 @@ class ScannerTest(unittest.TestCase):
     def test_can_scan_double_character_tokens(self):
         source = "= == ! != > >= < <"
         error_reporter = ErrorReporter()
-        scanner = Scanner(source, error_reporter)
+        scanner = self.scanner(source, error_reporter)
         tokens = scanner.scan_tokens()
         self.assertEqual(9, len(tokens))
         self.assertFalse(error_reporter.had_error)
@@ -33,7 +36,7 @@ class ScannerTest(unittest.TestCase):
     def test_can_scan_slashes_vs_comments(self):
         source = "/ // Hello world"
         error_reporter = ErrorReporter()
-        scanner = Scanner(source, error_reporter)
+        scanner = self.scanner(source, error_reporter)
         tokens = scanner.scan_tokens()
         self.assertEqual(2, len(tokens))
         self.assertFalse(error_reporter.had_error)
@@ -41,7 +44,7 @@ class ScannerTest(unittest.TestCase):
     def test_skips_whitespace(self):
         source = "var s = 123; \n\r\t s = s + 1;"
         error_reporter = ErrorReporter()
-        scanner = Scanner(source, error_reporter)
+        scanner = self.scanner(source, error_reporter)
         tokens = scanner.scan_tokens()
         self.assertEqual(12, len(tokens))
         self.assertFalse(error_reporter.had_error)
@@ -51,7 +54,7 @@ class ScannerTest(unittest.TestCase):
                 (( )){} // grouping stuff
                 !*+-/=<> <= == // operators"""
         error_reporter = ErrorReporter()
-        scanner = Scanner(source, error_reporter)
+        scanner = self.scanner(source, error_reporter)
         tokens = scanner.scan_tokens()
         self.assertEqual(17, len(tokens))
         self.assertFalse(error_reporter.had_error)
@@ -59,7 +62,7 @@ class ScannerTest(unittest.TestCase):
     def test_can_scan_strings(self):
         source = '"hello" "world" "goodbye world"'
         error_reporter = ErrorReporter()
-        scanner = Scanner(source, error_reporter)
+        scanner = self.scanner(source, error_reporter)
         tokens = scanner.scan_tokens()
         self.assertEqual(4, len(tokens))
         self.assertEqual("hello", tokens[0].literal)
@@ -69,7 +72,7 @@ class ScannerTest(unittest.TestCase):
         source = '''"goodbye
                   world"'''
         error_reporter = ErrorReporter()
-        scanner = Scanner(source, error_reporter)
+        scanner = self.scanner(source, error_reporter)
         tokens = scanner.scan_tokens()
         self.assertEqual(2, len(tokens))
         self.assertFalse(error_reporter.had_error)
@@ -77,17 +80,18 @@ class ScannerTest(unittest.TestCase):
     def test_can_scan_numbers(self):
         source = "123 123.456"
         error_reporter = ErrorReporter()
-        scanner = Scanner(source, error_reporter)
+        scanner = self.scanner(source, error_reporter)
         tokens = scanner.scan_tokens()
         self.assertEqual(3, len(tokens))
-        self.assertEqual("123", tokens[0].literal)
-        self.assertEqual("123.456", tokens[1].literal)
+        self.assertEqual(123.0, tokens[0].literal)
+        self.assertEqual(123.456, tokens[1].literal)
+        self.assertIs(float, type(tokens[0].literal))
         self.assertFalse(error_reporter.had_error)
 
     def test_can_scan_keywords_and_identifiers(self):
         source = "if a_var and b_var"
         error_reporter = ErrorReporter()
-        scanner = Scanner(source, error_reporter)
+        scanner = self.scanner(source, error_reporter)
         tokens = scanner.scan_tokens()
         self.assertEqual(5, len(tokens))
         self.assertIs(tokens[0].type, TokenType.IF)
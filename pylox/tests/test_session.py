@@ -0,0 +1,112 @@
+import unittest
+from unittest.mock import patch
+
+from src.session import LoxError, LoxSession
+
+
+class SessionTest(unittest.TestCase):
+    def test_returns_output(self):
+        result = LoxSession().execute('print 1 + 2; print "a" + "b";')
+
+        self.assertTrue(result.ok)
+        self.assertEqual(["3", "ab"], result.output)
+
+    def test_prints_nothing(self):
+        with patch("builtins.print") as mock_print:
+            LoxSession().execute('print 1; print -"a"; print ;')
+        mock_print.assert_not_called()
+
+    def test_globals_survive_between_calls(self):
+        session = LoxSession()
+        session.execute("var a = 1;")
+        session.execute("a = a + 1;")
+
+        self.assertEqual(["2"], session.execute("print a;").output)
+
+    def test_locals_use_slots(self):
+        session = LoxSession()
+        session.execute("var a = 1;")
+        result = session.execute("{ var b = a + 1; { print a + b; } }")
+
+        self.assertEqual(["3"], result.output)
+
+    def test_scan_error(self):
+        result = LoxSession().execute("print 1; @")
+
+        self.assertFalse(result.ok)
+        self.assertEqual([LoxError("scan", 1, "Unexpected character")], result.errors)
+        self.assertEqual([], result.output)
+
+    def test_parse_error(self):
+        result = LoxSession().execute("print 1;\nprint ;")
+
+        self.assertEqual(["parse"], [e.kind for e in result.errors])
+        self.assertEqual(2, result.errors[0].line)
+        self.assertIn("at ';'", result.errors[0].message)
+        self.assertEqual([], result.output)
+
+    def test_invalid_assignment_target(self):
+        session = LoxSession()
+        session.execute("var a = 1;")
+
+        result = session.execute("print 0;\na + 1 = 3;")
+
+        self.assertEqual(
+            [LoxError("parse", 2, "at '=': Invalid assignment target.")],
+            result.errors,
+        )
+        self.assertEqual([], result.output)
+        self.assertEqual(["1"], session.execute("print a;").output)
+
+    def test_too_deeply_nested(self):
+        session = LoxSession()
+        for source in ["print " + "-" * 3000 + "1;", "print " + "(" * 3000 + "1);"]:
+            with self.subTest(source=source[:10]):
+                result = session.execute(source)
+                self.assertEqual(["parse"], [e.kind for e in result.errors])
+                self.assertIn("nested too deeply", result.errors[0].message)
+        self.assertEqual(["1"], session.execute("print 1;").output)
+
+    def test_runtime_error_keeps_earlier_output(self):
+        result = LoxSession().execute('print 1;\nprint -"a";\nprint 2;')
+
+        self.assertEqual(["1"], result.output)
+        self.assertEqual([LoxError("runtime", 2, "a must be a number")], result.errors)
+
+    def test_errors_do_not_leak_into_next_call(self):
+        session = LoxSession()
+        session.execute("print ;")
+        session.execute('print -"a";')
+
+        self.assertTrue(session.execute("print 1;").ok)
+
+    def test_runtime_error_inside_block_restores_globals(self):
+        session = LoxSession()
+        session.execute('var a = 1; { var a = 2; print -"x"; }')
+
+        self.assertEqual(["1"], session.execute("print a;").output)
+
+    def test_reuses_parsed_programs(self):
+        session = LoxSession(cache_size=2)
+        session.execute("var a = 0;")
+        source = "a = a + 1; print a;"
+
+        self.assertEqual(["1"], session.execute(source).output)
+        program = session._cache[source]
+        self.assertEqual(["2"], session.execute(source).output)
+        self.assertIs(program, session._cache[source])
+
+    def test_cache_is_bounded(self):
+        session = LoxSession(cache_size=2)
+        for i in range(5):
+            session.execute(f"print {i};")
+
+        self.assertEqual(["print 3;", "print 4;"], list(session._cache))
+
+    def test_optimize(self):
+        session = LoxSession(optimize=True)
+        self.assertEqual(["7"], session.execute("print 1 + 2 * 3;").output)
+
+
+if __name__ == "__main__":
+    unittest.main()
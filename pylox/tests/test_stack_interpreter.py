@@ -0,0 +1,85 @@
+import unittest
+from unittest.mock import patch
+
+import test_interpreter
+from src.errors import ErrorReporter
+from src.fast_scanner import FastScanner
+from src.parser import PrattParser
+from src.resolver import Resolver
+from src.stack_interpreter import (
+    BINARY_OP,
+    CONSTANT,
+    DEFINE_LOCAL,
+    ENTER,
+    EXIT,
+    GET_LOCAL,
+    PRINT_OP,
+    StackInterpreter,
+    linearize,
+)
+
+
+def parse(source: str, error_reporter: ErrorReporter) -> list:
+    tokens = FastScanner(source, error_reporter).scan_tokens()
+    statements = PrattParser(error_reporter, tokens).parse()
+    Resolver().resolve(statements)
+    return statements
+
+
+# runs every interpreter test against the StackInterpreter
+class TestStackInterpreter(test_interpreter.TestInterpreter):
+    engine = StackInterpreter
+
+    def test_linearizes_in_post_order(self):
+        statements = parse("{ var a = 1; print a * 2; }", ErrorReporter())
+        code = linearize(statements)
+
+        self.assertEqual(
+            [
+                ENTER,
+                CONSTANT,
+                DEFINE_LOCAL,
+                GET_LOCAL,
+                CONSTANT,
+                BINARY_OP,
+                PRINT_OP,
+                EXIT,
+            ],
+            [op for op, _ in code],
+        )
+
+    @patch("builtins.print")
+    def test_deep_expression(self, mock_print):
+        terms = 5000
+        error_reporter = ErrorReporter()
+        statements = parse("print " + " + ".join(["1"] * terms) + ";", error_reporter)
+        StackInterpreter(error_reporter).interpret(statements)
+
+        self.assertFalse(error_reporter.had_runtime_error)
+        mock_print.assert_called_once_with(str(terms))
+
+    @patch("builtins.print")
+    def test_deep_blocks(self, mock_print):
+        depth = 5000
+        source = "var a = 0;" + "{ var b = 1;" * depth + "a = a + b;" + "}" * depth
+        error_reporter = ErrorReporter()
+        interpreter = StackInterpreter(error_reporter)
+        interpreter.interpret(parse(source + "print a;", error_reporter))
+
+        self.assertFalse(error_reporter.had_runtime_error)
+        mock_print.assert_called_once_with("1")
+
+    @patch("builtins.print")
+    def test_runtime_error_leaves_blocks(self, mock_print):
+        error_reporter = ErrorReporter()
+        interpreter = StackInterpreter(error_reporter)
+        interpreter.interpret(parse('var a = 1; { { a = -"x"; } }', error_reporter))
+
+        self.assertTrue(error_reporter.had_runtime_error)
+        self.assertIs(interpreter.globals, interpreter.env)
+        interpreter.interpret(parse("print a;", error_reporter))
+        mock_print.assert_called_with("1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import os
+import tempfile
+import unittest
+
+from benchmarks.bench_startup import (
+    IMPORT_BUDGET_MS,
+    SLOW_MODULES,
+    import_ms,
+    startup_imports,
+)
+
+
+class StartupTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        directory = tempfile.mkdtemp()
+        cls.script = os.path.join(directory, "startup.lox")
+        with open(cls.script, "w") as file:
+            file.write("var a = 1;\nprint a + 2;\n")
+        cls.imports = startup_imports([cls.script], repeat=3)
+
+    def test_default_run_within_import_budget(self):
+        self.assertLess(import_ms(self.imports), IMPORT_BUDGET_MS, self.imports)
+
+    def test_default_run_skips_slow_modules(self):
+        self.assertEqual(set(), SLOW_MODULES & set(self.imports))
+
+    def test_default_run_skips_other_components(self):
+        for module in ["src.vm", "src.fast_scanner", "src.ast_cache", "src.repl"]:
+            with self.subTest(module):
+                self.assertNotIn(module, self.imports)
+
+    def test_options_load_their_modules(self):
+        imports = startup_imports(["--engine", "vm", self.script], repeat=1)
+        self.assertIn("src.vm", imports)
+        self.assertIn("argparse", imports)
@@ -0,0 +1,61 @@
+import io
+import unittest
+from unittest.mock import patch
+
+from src.errors import ErrorReporter
+from src.fast_scanner import FastScanner
+from src.parser import Parser
+from src.stream_scanner import TokenWindow, scan_stream
+from test_fast_scanner import SOURCES
+
+
+class StreamScannerTest(unittest.TestCase):
+    def test_matches_fast_scanner_for_any_chunk_size(self):
+        for source in SOURCES:
+            with patch("builtins.print") as expected_print:
+                expected_reporter = ErrorReporter()
+                expected = FastScanner(source, expected_reporter).scan_tokens()
+            for chunk_size in (1, 2, 3, 7, 4096):
+                with self.subTest(source=source, chunk_size=chunk_size):
+                    with patch("builtins.print") as actual_print:
+                        reporter = ErrorReporter()
+                        actual = list(
+                            scan_stream(io.StringIO(source), reporter, chunk_size)
+                        )
+
+                    self.assertEqual(expected, actual)
+                    self.assertEqual(expected_reporter.had_error, reporter.had_error)
+                    self.assertEqual(
+                        expected_print.call_args_list, actual_print.call_args_list
+                    )
+
+    def test_tokens_are_produced_lazily(self):
+        file = io.StringIO("var a = 1;\n" * 1000)
+        tokens = scan_stream(file, ErrorReporter(), chunk_size=64)
+
+        first = next(tokens)
+        self.assertEqual("var", first.lexeme)
+        self.assertLess(file.tell(), 200)
+
+    def test_parser_consumes_token_window(self):
+        source = 'var a = 1; { var b = a + 2; print b; } print "done";'
+        reporter = ErrorReporter()
+        expected = Parser(reporter, FastScanner(source, reporter).scan_tokens()).parse()
+
+        window = TokenWindow(scan_stream(io.StringIO(source), reporter, 4), size=2)
+        actual = Parser(reporter, window).parse()
+
+        self.assertEqual(expected, actual)
+        self.assertFalse(reporter.had_error)
+
+    def test_window_is_bounded(self):
+        source = "1 2 3 4 5"
+        window = TokenWindow(scan_stream(io.StringIO(source), ErrorReporter()), size=2)
+
+        self.assertEqual(4.0, window[3].literal)
+        self.assertEqual(3.0, window[2].literal)
+        self.assertRaises(IndexError, window.__getitem__, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import patch
+
+from src.errors import ErrorReporter
+from src.fast_scanner import FastScanner
+from src.parser import Parser
+from src.token_buffer import CompactScanner, TokenBuffer
+from src.token_type import TokenType
+from test_fast_scanner import SOURCES
+
+
+class TokenBufferTest(unittest.TestCase):
+    def test_matches_fast_scanner(self):
+        for source in SOURCES:
+            with self.subTest(source=source):
+                with patch("builtins.print") as expected_print:
+                    expected = FastScanner(source, ErrorReporter()).scan_tokens()
+                with patch("builtins.print") as actual_print:
+                    actual = CompactScanner(source, ErrorReporter()).scan_tokens()
+
+                self.assertEqual(expected, [actual[i] for i in range(len(actual))])
+                self.assertEqual(
+                    expected_print.call_args_list, actual_print.call_args_list
+                )
+
+    def test_views(self):
+        tokens = CompactScanner('var a = "s" + 1.5;', ErrorReporter()).scan_tokens()
+
+        self.assertEqual(TokenType.VAR, tokens.type_at(0))
+        self.assertEqual("a", tokens.lexeme(1))
+        self.assertEqual("s", tokens.literal(3))
+        self.assertEqual('"s"', tokens.lexeme(3))
+        self.assertEqual(1.5, tokens.literal(5))
+        self.assertIsNone(tokens.literal(4))
+        self.assertEqual(TokenType.EOF, tokens.type_at(-1))
+
+    def test_identifier_tokens_share_lexemes(self):
+        tokens = CompactScanner("a = a;", ErrorReporter()).scan_tokens()
+        self.assertIs(tokens[0].lexeme, tokens[2].lexeme)
+
+    def test_parser_produces_same_tree(self):
+        source = 'var a = 1; { var b = -a * (2 + a); a = b == "x"; } print !a;'
+        expected = FastScanner(source, ErrorReporter()).scan_tokens()
+        actual = CompactScanner(source, ErrorReporter()).scan_tokens()
+        expected, actual = Parser(ErrorReporter(), expected), Parser(
+            ErrorReporter(), actual
+        )
+
+        self.assertEqual(repr(expected.parse()), repr(actual.parse()))
+
+    def test_parser_only_builds_tokens_kept_in_tree(self):
+        source = "var a = 1; { print a + 2 * a; } a = -a;"
+        tokens = CompactScanner(source, ErrorReporter()).scan_tokens()
+        with patch.object(
+            TokenBuffer,
+            "__getitem__",
+            autospec=True,
+            side_effect=TokenBuffer.__getitem__,
+        ) as getitem:
+            Parser(ErrorReporter(), tokens).parse()
+
+        # names: a (var), a, a, a (assign), a; operators: + * -
+        self.assertEqual(8, getitem.call_count)
+
+    def test_parse_errors(self):
+        with patch("builtins.print") as mock_print:
+            reporter = ErrorReporter()
+            tokens = CompactScanner("print ;\nprint 1;", reporter).scan_tokens()
+            Parser(reporter, tokens).parse()
+
+        self.assertTrue(reporter.had_error)
+        self.assertIn("at ';'", mock_print.call_args_list[0].args[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
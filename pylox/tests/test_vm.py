@@ -0,0 +1,64 @@
+import unittest
+
+import test_interpreter
+from src.bytecode import disassemble
+from src.compiler import Compiler
+from src.errors import ErrorReporter
+from src.parser import Parser
+from src.scanner import Scanner
+from src.vm import VM
+
+
+def compile_source(source: str, error_reporter: ErrorReporter):
+    tokens = Scanner(source, error_reporter).scan_tokens()
+    statements = Parser(error_reporter, tokens).parse()
+    return Compiler(error_reporter).compile(statements)
+
+
+# runs every interpreter test against the bytecode VM
+class TestVM(test_interpreter.TestInterpreter):
+    engine = VM
+
+    def test_compiles_globals_and_constants(self):
+        chunk = compile_source("var a = 1; print a + 1;", ErrorReporter())
+
+        self.assertEqual(
+            [
+                "0000 OP_CONSTANT 0 (1.0)",
+                "0003 OP_DEFINE_GLOBAL 1 ('a')",
+                "0006 OP_GET_GLOBAL 1 ('a')",
+                "0009 OP_CONSTANT 0 (1.0)",
+                "0012 OP_ADD",
+                "0013 OP_PRINT",
+                "0014 OP_RETURN",
+            ],
+            disassemble(chunk),
+        )
+
+    def test_compiles_locals_to_stack_slots(self):
+        chunk = compile_source("{ var a = 1; { var b = a; b = 2; } }", ErrorReporter())
+
+        self.assertEqual(
+            [
+                "0000 OP_CONSTANT 0 (1.0)",
+                "0003 OP_GET_LOCAL 0",
+                "0006 OP_CONSTANT 1 (2.0)",
+                "0009 OP_SET_LOCAL 1",
+                "0012 OP_POP",
+                "0013 OP_POPN 1",
+                "0016 OP_POPN 1",
+                "0019 OP_RETURN",
+            ],
+            disassemble(chunk),
+        )
+
+    def test_undefined_global_is_a_runtime_error(self):
+        error_reporter = ErrorReporter()
+        chunk = compile_source("print missing;", error_reporter)
+
+        VM(error_reporter).run(chunk)
+        self.assertTrue(error_reporter.had_runtime_error)
+
+
+if __name__ == "__main__":
+    unittest.main()
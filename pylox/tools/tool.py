@@ -1,21 +1,46 @@
 import os
 
 
-def define_ast(output_dir: str, base_name: str, types: list[str]):
+def define_ast(
+    output_dir: str,
+    base_name: str,
+    types: list[str],
+    first_kind: int = 0,
+    slots: bool = True,
+):
     absolute = os.path.dirname(__file__)
     path = os.path.join(absolute + output_dir, base_name.lower() + ".py")
     if os.path.exists(path):
         os.remove(path)
+    file = generate_ast(base_name, types, first_kind, slots)
+    with open(os.path.join(absolute + output_dir, base_name.lower() + ".py"), "w") as f:
+        f.write(file)
+
+
+# builds the source of the module holding the node classes for base_name.
+# Every class gets an integer `kind` tag (unique across modules when first_kind
+# is chosen accordingly) that can be used for table based dispatch instead of
+# accept(), and unless slots is False the classes use __slots__ instead of an
+# instance __dict__
+def generate_ast(
+    base_name: str, types: list[str], first_kind: int = 0, slots: bool = True
+) -> str:
     file = ""
+    for kind, t in enumerate(types, first_kind):
+        class_name = t.split(":")[0].strip()
+        file += f"{class_name.upper()} = {kind}\n"
     for t in types:
         class_name = t.split(":")[0].strip()
-        fields = t.split(":")[1].strip()
-        file = define_class(file, class_name, base_name, fields)
-    with open(os.path.join(absolute + output_dir, base_name.lower() + ".py"), "w") as f:
-        f.write(file)
+        fields, _, annotations = t.split(":")[1].partition("|")
+        file = define_class(
+            file, class_name, base_name, fields.strip(), annotations.strip(), slots
+        )
+    return file + "\n"
 
 
-def define_class(file, class_name, base_name, fields):
+# annotations are fields filled in by later passes (e.g. the resolver), they
+# default to None and are not part of the constructor or of equality
+def define_class(file, class_name, base_name, fields, annotations="", slots=True):
     file += "\n\n"
     fields = fields.split(",")
     types = list()
@@ -23,14 +48,25 @@ def define_class(file, class_name, base_name, fields):
     for field in fields:
         types.append(field.strip().split(" ")[0])
         identifiers.append(field.strip().split(" ")[1])
+    annotated = [
+        annotation.strip().split(" ")[1]
+        for annotation in filter(None, annotations.split(","))
+    ]
 
     file += "class " + class_name + ":\n"
+    if slots:
+        names = ", ".join(f'"{id}"' for id in identifiers + annotated)
+        file += f"    __slots__ = ({names},)\n"
+    file += f"    kind = {class_name.upper()}\n"
+    file += "\n"
     ctor = "    def __init__(self"
     assign = ""
     zipped = zip(types, identifiers)
     for itr in zipped:
         ctor += f", {itr[1]}"
         assign += f"        self.{itr[1]} = {itr[1]}\n"
+    for id in annotated:
+        assign += f"        self.{id} = None\n"
     ctor += "):\n"
     file += ctor
     file += assign
@@ -44,31 +80,32 @@ def define_class(file, class_name, base_name, fields):
     for id in identifiers:
         file += f"            self.{id} == other.{id} and\n"
     file = file[:-4]
-    file += "\n        )"
+    file += "\n        )\n"
+    file += f"\n    def __repr__(self):\n"
+    file += f'        return f"{class_name}('
+    file += ", ".join(f"{id}={{self.{id}!r}}" for id in identifiers)
+    file += ')"\n'
     return file
 
 
+EXPR_TYPES = [
+    "Assign   : Token name, Expr value | int depth, int slot",
+    "Binary   : Expr left, Token operator, Expr right",
+    "Grouping : Expr expression",
+    "Literal  : Object value",
+    "Unary    : Token operator, Expr right",
+    "Variable : Token name | int depth, int slot",
+]
+
+STMT_TYPES = [
+    "Block      : list[Stmt] statements | int slot_count",
+    "Expression : Expr expression",
+    "Print      : Expr expression",
+    "Var        : Token name, Expr initializer | int slot",
+]
+
+
 if __name__ == "__main__":
-    output_dir = ""
-    define_ast(
-        output_dir,
-        "Expr",
-        [
-            "Assign   : Token name, Expr value",
-            "Binary   : Expr left, Token operator, Expr right",
-            "Grouping : Expr expression",
-            "Literal  : Object value",
-            "Unary    : Token operator, Expr right",
-            "Variable : Token name",
-        ],
-    )
-    define_ast(
-        output_dir,
-        "Stmt",
-        [
-            "Block      : list[Stmt] statements",
-            "Expression : Expr expression",
-            "Print      : Expr expression",
-            "Var        : Token name, Expr initializer",
-        ],
-    )
+    output_dir = "/../src"
+    define_ast(output_dir, "Expr", EXPR_TYPES)
+    define_ast(output_dir, "Stmt", STMT_TYPES, first_kind=len(EXPR_TYPES))